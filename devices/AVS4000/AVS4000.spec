@@ -27,6 +27,7 @@ Requires:       redhawk >= 2.2
 # Interface requirements
 BuildRequires:  frontendInterfaces >= 2.4 bulkioInterfaces >= 2.2
 Requires:       frontendInterfaces >= 2.4 bulkioInterfaces >= 2.2
+Requires:       numpy
 
 BuildArch: noarch
 
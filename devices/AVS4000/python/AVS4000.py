@@ -15,12 +15,24 @@ import logging
 from AVS4000_base import *
 
 import AVS4000Transceiver
+import Vita49
 
 class AVS4000_i(AVS4000_base):
     """
     This device interfaces with an AVS4000 transceiver
     """
 
+    #
+    # The DeviceController gap policy of each avs4000_gap_policy value
+    #
+    _gap_policies_ = \
+        {
+            enums.avs4000_gap_policy.IGNORE:    AVS4000Transceiver.IGNOREGapPolicy,
+            enums.avs4000_gap_policy.ZERO_FILL: AVS4000Transceiver.ZEROFILLGapPolicy,
+            enums.avs4000_gap_policy.HOLD_LAST: AVS4000Transceiver.HOLDLASTGapPolicy,
+            enums.avs4000_gap_policy.SPLIT:     AVS4000Transceiver.SPLITGapPolicy
+        }
+
     def constructor(self):
         """
         This is called by the framework immediately after your device registers with the system.
@@ -49,22 +61,46 @@ class AVS4000_i(AVS4000_base):
         self.host_    = 'localhost'
         self.devices_ = {}
         self.dm_      = AVS4000Transceiver.DeviceManager(the_host=self.host_)
-        self.expected_frame_count_ = -1
+        self.pipelines_ = {}      # DataPipeline of each enabled tuner, see avs4000_pipeline_depth
+        self.data_engine_ = AVS4000Transceiver.DataEngine()  # Reads the data sockets, see avs4000_data_reader
+        self.hop_schedulers_ = {}  # HopScheduler of each enabled tuner with hops, see avs4000_hop_plan
+        self.hop_keywords_   = {}  # SRI keywords of the current hop of each tuner
+        self.status_pollers_ = {}  # StatusPoller of each enabled tuner, see avs4000_rxstat_interval
+        self.supervisors_    = {}  # ConnectionSupervisor of each enabled tuner, see avs4000_reconnect_status
+        self.gap_keywords_   = {}  # SRI keywords marking the last gap of each tuner, see avs4000_gap_policy
+        self.sri_caches_     = {}  # SriCache of each tuner, the content of the SRI last pushed
+        self.sris_           = {}  # SRI last pushed for each tuner
 
         #
         # Query the number of controllers available
         #
         self.devices_ = self.dm_.get_controllers()
+        self.fleet_   = AVS4000Transceiver.DeviceFleet(self.devices_)
 
         #
         # Setup and property listeners
         #
         self.addPropertyChangeListener("avs4000_output_configuration", self.avs4000_output_configuration_changed)
+        self.addPropertyChangeListener("avs4000_hop_plan", self.avs4000_hop_plan_changed)
+        self.addPropertyChangeListener("avs4000_rxstat_interval", self.avs4000_status_interval_changed)
+        self.addPropertyChangeListener("avs4000_gps_interval", self.avs4000_status_interval_changed)
+        self.addPropertyChangeListener("avs4000_master_interval", self.avs4000_status_interval_changed)
+        self.addPropertyChangeListener("avs4000_tune_window", self.avs4000_tune_window_changed)
+        self.addPropertyChangeListener("avs4000_gap_policy", self.avs4000_gap_policy_changed)
 
         #
         # NOTE: The property structs have been created already, so I need to make sure to configure the devices
         #       created with the appropriate configuration.
         #
+        #
+        # Have the controllers return the samples as NumPy arrays, this avoids creating a Python integer
+        # for every sample read.
+        #
+        for tuner_id in self.devices_.keys():
+            self.devices_[tuner_id].set_payload_mode(AVS4000Transceiver.NUMPYPayloadMode)
+            self.devices_[tuner_id].set_tune_window(max(0.0, self.avs4000_tune_window) / 1000.0)
+            self.devices_[tuner_id].set_gap_policy(self._gap_policies_[self.avs4000_gap_policy])
+
         for configuration in self.avs4000_output_configuration:
             self._baseLog.debug("    type <{}>, configuration <{}>".format(type(configuration), configuration))
             tuner_number  = configuration.tuner_number
@@ -99,6 +135,8 @@ class AVS4000_i(AVS4000_base):
                 else:
                     self.devices_[tuner_number].set_output_endian(AVS4000Transceiver.LITTLEOutputEndian)
 
+                self._configure_reads_(tuner_number, configuration)
+
         #
         # Identify the number of devices found.
         #
@@ -118,19 +156,21 @@ class AVS4000_i(AVS4000_base):
 
         self._baseLog.debug("--> start()")
 
-        try:
-            for tuner_id in self.devices_.keys():
-                self.devices_[tuner_id].setup()
-
-                #
-                # Display how the devices are configured by default.
-                #
-                self._baseLog.info("\nTUNER {}: {}".format(tuner_id, self.devices_[tuner_id]))
+        #
+        # Setup all of the devices at once, instead of waiting on each in turn.
+        #
+        the_results, the_errors = self.fleet_.setup()
 
-        except Exception as the_error:
+        for tuner_id, the_error in the_errors.items():
             self._baseLog.error("Unable to setup/start device because: <{}>".format(the_error))
             raise the_error
 
+        for tuner_id in self.devices_.keys():
+            #
+            # Display how the devices are configured by default.
+            #
+            self._baseLog.info("\nTUNER {}: {}".format(tuner_id, self.devices_[tuner_id]))
+
         super(AVS4000_i, self).start()
 
         self._baseLog.debug("<-- start()")
@@ -147,11 +187,24 @@ class AVS4000_i(AVS4000_base):
 
         super(AVS4000_i, self).stop()
 
+        for tuner_id in self.hop_schedulers_.keys():
+            self._stop_hops_(tuner_id)
+
+        for tuner_id in self.status_pollers_.keys():
+            self._stop_status_poller_(tuner_id)
+
+        for tuner_id in self.supervisors_.keys():
+            self._stop_supervisor_(tuner_id)
+
+        for tuner_id in self.pipelines_.keys():
+            self._stop_pipeline_(tuner_id)
+
+        self.data_engine_.stop()
+
         #
         # Call the parent's stop method
         #
-        for tuner_id in self.devices_.keys():
-            self.devices_[tuner_id].teardown()
+        self.fleet_.teardown()
 
         self._baseLog.debug("<-- stop()")
 
@@ -176,8 +229,8 @@ class AVS4000_i(AVS4000_base):
                 #            Timestamps will be generated from the current processor time.
                 #
                 #  VITA49:   Data will be pushed out the dataShort_out port as 16bit I and Q complex samples.
-                #            Timestampes will be generated from the integer-seconds-timestamp +
-                #            fractional_seconds_timestamp_lsw of the VRT header.
+                #            Timestampes will be decoded from the integer and fractional seconds timestamps of the
+                #            VRT header, as selected by its TSI and TSF fields.
                 #
                 # NOTE:
                 #   Raw VITA49 ports were removed because currently there are no BULKIO VITA49 components that
@@ -211,11 +264,93 @@ class AVS4000_i(AVS4000_base):
                 if the_endian == enums.avs4000_output_configuration__.output_endian.LITTLE:
                     self.devices_[the_tuner].set_output_endian(AVS4000Transceiver.LITTLEOutputEndian)
 
+                #
+                # How the data is read, see _configure_reads_
+                #
+                self._configure_reads_(the_tuner, newval[index])
+
             else:
                 self._baseLog.error("Ignoring request to set output format for tuner <{}>".format(the_tuner))
 
         self._baseLog.debug("<-- avs4000_output_configuration_changed()")
 
+    def avs4000_hop_plan_changed(self, propid, oldval, newval):
+        self._baseLog.debug("--> avs4000_hop_plan_changed()")
+
+        #
+        # Enabled tuners start over on their new hops, the others pick them up when they are enabled.
+        #
+        for tuner_id in self.devices_.keys():
+            if self.frontend_tuner_status[tuner_id].enabled:
+                self._stop_hops_(tuner_id)
+                self._start_hops_(tuner_id)
+
+        self._baseLog.debug("<-- avs4000_hop_plan_changed()")
+
+    def avs4000_status_interval_changed(self, propid, oldval, newval):
+        self._baseLog.debug("--> avs4000_status_interval_changed()")
+
+        for tuner_id, the_poller in self.status_pollers_.items():
+            try:
+                the_poller.set_intervals(self._status_intervals_())
+
+            except ValueError as the_error:
+                self._baseLog.error("Ignoring status intervals of tuner <{}>, because <{}>".format(tuner_id, the_error))
+
+        self._baseLog.debug("<-- avs4000_status_interval_changed()")
+
+    def avs4000_tune_window_changed(self, propid, oldval, newval):
+        self._baseLog.debug("--> avs4000_tune_window_changed()")
+
+        for tuner_id in self.devices_.keys():
+            try:
+                self.devices_[tuner_id].set_tune_window(newval / 1000.0)
+
+            except ValueError as the_error:
+                self._baseLog.error("Ignoring tune window of tuner <{}>, because <{}>".format(tuner_id, the_error))
+
+        self._baseLog.debug("<-- avs4000_tune_window_changed()")
+
+    def avs4000_gap_policy_changed(self, propid, oldval, newval):
+        self._baseLog.debug("--> avs4000_gap_policy_changed()")
+
+        for tuner_id in self.devices_.keys():
+            self.devices_[tuner_id].set_gap_policy(self._gap_policies_[newval])
+
+        self._baseLog.debug("<-- avs4000_gap_policy_changed()")
+
+    def _configure_reads_(self, the_tuner, the_configuration):
+        """
+        This is a utility method that applies the read settings of an avs4000_output_configuration entry
+        to the tuner.
+
+          block_mode FIXED: block_packets Vita49 packets (or 2048 complex samples) are read at a time.
+          block_mode AUTO:  each read holds block_latency ms of samples at the tuned sample rate, low latency for
+                            narrowband tuners and large reads for wideband ones.
+          bulk_receive:     each block is received with a single MSG_WAITALL system call.
+
+        :param the_tuner:         The tuner id
+        :param the_configuration: The avs4000_output_configuration entry
+
+        :return:
+            N/A
+        """
+        the_device = self.devices_[the_tuner]
+
+        try:
+            if the_configuration.block_mode == enums.avs4000_output_configuration__.block_mode.AUTO:
+                the_device.set_block_mode(AVS4000Transceiver.AUTOBlockMode)
+            else:
+                the_device.set_block_mode(AVS4000Transceiver.FIXEDBlockMode)
+
+            the_device.set_block_packets(the_configuration.block_packets)
+            the_device.set_block_latency(the_configuration.block_latency)
+
+        except ValueError as the_error:
+            self._baseLog.error("Ignoring block size of tuner <{}>, because <{}>".format(the_tuner, the_error))
+
+        the_device.set_bulk_receive(the_configuration.bulk_receive)
+
     def process(self):
         """
         Basic functionality:
@@ -393,17 +528,27 @@ class AVS4000_i(AVS4000_base):
         # 
         self._baseLog.trace("--> process()")
 
+        self._update_pipeline_status_()
+        self._update_reconnect_status_()
+        self._update_clock_status_()
+        self._update_continuity_status_()
+
+        the_result = NOOP
+
         for index in self.devices_:
-            streamID = self.devices_[index].stream_id()
+            #
+            # The data for this tuner is being read by its DataPipeline
+            #
+            if index in self.pipelines_:
+                continue
 
             #
             # If the device was setup to NOT read data from avs4000d device controller then
-            # return NOOP to indicate no data.
+            # move on to the next device, the other devices still need to be read.
             #
             if self.devices_[index].read_data_flag() is False:
                 self._baseLog.trace("    read_data <FALSE>")
-                self._baseLog.trace("<-- process()")
-                return NOOP
+                continue
 
             if self.devices_[index].output_format() == AVS4000Transceiver.COMPLEXOutputFormat:
                 """
@@ -416,37 +561,9 @@ class AVS4000_i(AVS4000_base):
 
                 if data is None:
                     self._baseLog.trace("    data is None")
-                    self._baseLog.trace("<-- process()")
-                    return NOOP
-
-                utcNow = bulkio.timestamp.now()
-
-                if self.devices_[index].sri_changed():
-                    self._baseLog.debug("    Pushing SRI")
-
-                    the_sri = frontend.sri.create(streamID, self.frontend_tuner_status[index], self._id)
-                    the_sri.xdelta = 1.0/self.devices_[index].sample_rate()
-                    the_sri.mode   = 1  # Tell follow on processing that the mode is complex
+                    continue
 
-                    #
-                    # Add the GPS geolocation SRI information.
-                    #
-                    the_dictionary = self.devices_[index].gps_geolocation_dictionary()
-
-                    the_list = []
-                    for key, value in the_dictionary.items():
-                        the_list.append(CF.DataType(id=key, value=any .to_any(value)))
-
-                    self.addModifyKeyword(the_sri, "GEOLOCATION_GPS", the_list, True)
-                    self._baseLog.info("SRI <{}>".format(the_sri))
-
-                    self.port_dataShort_out.pushSRI(the_sri)
-                    self._baseLog.info("    Pushed SRI")
-
-                self._baseLog.debug("    streamId <{}>, len <{}>, type data[0] <{}>".format(streamID, len(data), type(data[0])))
-                self._baseLog.debug("    Before push {:.4f}".format(time.time()))
-                self.port_dataShort_out.pushPacket(data, utcNow, False, streamID)
-                self._baseLog.debug("    After  push {:.4f}".format(time.time()))
+                self._push_complex_(index, data, self._complex_timestamp_(index, data, time.time()))
 
             elif self.devices_[index].output_format() == AVS4000Transceiver.VITA49OutputFormat:
                 """
@@ -467,76 +584,730 @@ class AVS4000_i(AVS4000_base):
 
                 if the_list is None:
                     self._baseLog.debug("    data is None")
-                    self._baseLog.debug("<-- process()")
-                    return NOOP
+                    continue
+
+                self._push_vita49_(index, the_list)
+
+                #self._baseLog.info("Total time for call <{}>".format(time.time() - the_start_time))
+            else:
+                self._baseLog.debug("    Unknown format()")
+                continue
+
+            the_result = NORMAL
+
+        self._baseLog.trace("<-- process()")
+        return the_result
+
+    def _push_sri_(self, index):
+        """
+        This is a utility method that pushes the SRI of the tuner out the dataShort_out port, when its content has
+        changed since the last SRI pushed.  The SRI and its keywords are kept by the SriCache of the tuner, only the
+        fields that changed are rebuilt.
+
+        :param index: The tuner id
+
+        :return:
+            N/A
+        """
+        the_device = self.devices_[index]
+        the_status = self.frontend_tuner_status[index]
+
+        the_cache = self.sri_caches_.get(index)
+
+        if the_cache is None:
+            the_cache = AVS4000Transceiver.SriCache\
+                (
+                    lambda the_id, the_value: CF.DataType(id=the_id, value=any.to_any(the_value)),
+                    ("GEOLOCATION_GPS::TIME_SECONDS", "GEOLOCATION_GPS::TIME_FRACTIONAL")
+                )
+            self.sri_caches_[index] = the_cache
+
+        the_header = \
+            {
+                "streamID": the_device.stream_id(),
+                "xdelta":   1.0/the_device.sample_rate(),
+                "mode":     1  # Tell follow on processing that the mode is complex
+            }
+
+        #
+        # The keywords added by frontend.sri.create, followed by the GPS geolocation.
+        #
+        the_keywords = \
+            [
+                ("COL_RF",               the_status.center_frequency),
+                ("CHAN_RF",              the_status.center_frequency),
+                ("FRONTEND::RF_FLOW_ID", the_status.rf_flow_id),
+                ("FRONTEND::BANDWIDTH",  the_status.bandwidth),
+                ("FRONTEND::DEVICE_ID",  self._id),
+                ("GEOLOCATION_GPS",      the_device.gps_geolocation_dictionary())
+            ]
+
+        #
+        # While hopping, each dwell is tagged with its hop.  After a gap in the stream, see avs4000_gap_policy.
+        #
+        the_keywords.extend(sorted(self.hop_keywords_.get(index, {}).items()))
+        the_keywords.extend(sorted(self.gap_keywords_.get(index, {}).items()))
+
+        the_changes = the_cache.update(the_header, the_keywords)
+
+        if not the_changes:
+            self._baseLog.debug("    SRI unchanged")
+            return
+
+        the_sri = self.sris_.get(index)
+
+        if the_sri is None:
+            the_sri = frontend.sri.create(the_header["streamID"], the_status, self._id)
+
+        the_sri = copy.copy(the_sri)
+        the_sri.streamID = the_header["streamID"]
+        the_sri.xdelta   = the_header["xdelta"]
+        the_sri.mode     = the_header["mode"]
+        the_sri.keywords = the_cache.keywords()
+
+        self.sris_[index] = the_sri
+
+        self._baseLog.info("SRI <{}>, changed <{}>".format(the_sri, ", ".join(the_changes)))
+
+        self.port_dataShort_out.pushSRI(the_sri)
+        self._baseLog.info("    Pushed SRI")
+
+    def _reset_sri_(self, index):
+        """
+        This is a utility method that forgets the SRI last pushed for the tuner, so the next SRI is pushed in full
+        when a new stream starts.
+
+        :param index: The tuner id
+
+        :return:
+            N/A
+        """
+        the_cache = self.sri_caches_.get(index)
+
+        if the_cache is not None:
+            the_cache.reset()
+
+        self.sris_.pop(index, None)
+
+    def _complex_timestamp_(self, index, the_data, the_arrival):
+        """
+        This is a utility method that returns the timestamp of a block of complex samples.  The complex samples
+        carry no time, so it comes from the sample clock of the tuner (see DeviceController.block_time), which
+        removes the jitter of when the block happened to be read.
+
+        :param index:       The tuner id
+        :param the_data:    The interleaved I/Q samples
+        :param the_arrival: The time the block was read, time.time()
+
+        :return:
+            BULKIO.PrecisionUTCTime of the first sample
+        """
+        the_time = self.devices_[index].block_time(len(the_data) / 2, the_arrival)
+
+        if the_time is None:
+            the_time = the_arrival
+
+        the_whole_seconds = int(the_time)
+        return bulkio.timestamp.create(the_whole_seconds, the_time - the_whole_seconds)
+
+    def _push_complex_(self, index, data, the_timestamp):
+        """
+        This is a utility method that pushes a block of complex samples out the dataShort_out port
+
+        :param index:         The tuner id
+        :param data:          The samples returned by the DeviceController
+        :param the_timestamp: BULKIO.PrecisionUTCTime of the first sample
+
+        :return:
+            N/A
+        """
+        self._push_samples_(index, data, the_timestamp)
+
+    def _push_vita49_(self, index, the_list):
+        """
+        This is a utility method that pushes the payload of a list of Vita49DataPackets out the dataShort_out port
+
+        :param index:    The tuner id
+        :param the_list: The Vita49DataPackets returned by the DeviceController
+
+        :return:
+            N/A
+        """
+        #
+        # The timestamp is the exact time of the first packet, decoded by the DeviceController from the TSI/TSF
+        # fields using the Master.realSampleRate, see Vita49.Vita49PacketBlock.timestamps.
+        #
+        # NOTE:
+        #   The value for the master.realSampleRate is obtained whenever the devices tune() method is
+        #   called
+        #
+        # The continuity of every packet is checked by the DeviceController, see avs4000_continuity_status.  There
+        # is more than one Vita49DataPacket when the block was split after a gap, see avs4000_gap_policy.
+        #
+        for the_packet in the_list:
+            the_data = the_packet.payload()
+
+            the_timestamps = the_packet.timestamps()
+
+            if the_timestamps is not None and the_timestamps.valid()[0]:
+                the_whole_seconds, the_fractional_seconds = the_timestamps.time(0)
+                the_timestamp = bulkio.timestamp.create(the_whole_seconds, the_fractional_seconds, tsrc=0)
 
                 #
-                # Create the timestamp, because I am vita49, pull the integer portion from vrt
-                # calculate the fractional portion from the master.sampleRate.
-                #
-                # NOTE:
-                #   The value for the master.sampleRate is obtained whenever the devices tune() method is
-                #   called
+                # The samples concealing a gap before the first packet come before its timestamp.
                 #
-                the_master_info = self.devices_[index].master()
+                if the_packet.lead_samples() > 0 and self.devices_[index].sample_rate() > 0:
+                    the_timestamp = self._offset_timestamp_\
+                        (
+                            the_timestamp, -the_packet.lead_samples() / float(self.devices_[index].sample_rate())
+                        )
+            else:
+                self._baseLog.debug("No device timestamp for tuner <{}>, using the host time".format(index))
+                the_timestamp = bulkio.timestamp.now()
 
-                if len(the_list) != 1:
-                    self._baseLog.error("Received more than one packet!!!!")
+            if the_packet.gap() != 0:
+                self._mark_gap_(index, the_packet.gap())
 
-                for the_packet in the_list:
-                    the_vrt = the_packet.vrt_header()
+            self._push_samples_(index, the_data, the_timestamp)
 
-                    the_frame_count = the_packet.vrl().frame_count()
+    def _mark_gap_(self, index, the_samples):
+        """
+        This is a utility method that pushes an SRI marking that the next samples follow a gap in the stream, with
+        the number of gaps so far and the number of samples missing.
 
-                    if self.expected_frame_count_ == -1:
-                        self.expected_frame_count_ = 0
+        :param index:       The tuner id
+        :param the_samples: The number of complex samples missing, -1 when not known
 
-                    if the_frame_count != self.expected_frame_count_:
-                        self._baseLog.error("Missing frame expected {} received {}".format(self.expected_frame_count_, the_frame_count))
-                        self.expected_frame_count_ = the_frame_count + 1
-                    else:
-                        self.expected_frame_count_ += 64 # FIXME: need to increment by the number of buffered packets.
+        :return:
+            N/A
+        """
+        the_count = self.gap_keywords_.get(index, {}).get("AVS4000_GAP_COUNT", 0) + 1
 
-                    if self.expected_frame_count_ > 4095:
-                        self.expected_frame_count_ = 0
+        self.gap_keywords_[index] = \
+            {
+                "AVS4000_GAP_COUNT":   the_count,
+                "AVS4000_GAP_SAMPLES": the_samples
+            }
 
-                    the_data = the_packet.payload()
-                    the_fractional_seconds = the_vrt.fractional_seconds_timestamp_lsw() * (1.0 / the_master_info.sampleRate())
-                    the_timestamp = bulkio.timestamp.create(the_vrt.integer_seconds_timestamp(), the_fractional_seconds, tsrc=0)
+        self._push_sri_(index)
 
-                    if self.devices_[index].sri_changed():
-                        self._baseLog.debug("    Pushing SRI")
-                        the_sri = frontend.sri.create(streamID, self.frontend_tuner_status[index], self._id)
-                        the_sri.xdelta = 1.0/self.devices_[index].sample_rate()
-                        the_sri.mode   = 1 # Tell follow on processing that the mode is complex
+    def _push_samples_(self, index, the_data, the_timestamp):
+        """
+        This is a utility method that pushes interleaved I/Q samples out the dataShort_out port, along with the SRI
+        when it has changed.  When a live retune took effect part way through the block, the samples before it are
+        pushed with the previous SRI and the rest after the new SRI.
 
-                        #
-                        # Add the GPS geolocation SRI information.
-                        #
-                        the_dictionary = self.devices_[index].gps_geolocation_dictionary()
-                        the_list = []
-                        for key, value in the_dictionary.items():
-                            the_list.append(CF.DataType(id=key, value=any .to_any(value)))
+        :param index:         The tuner id
+        :param the_data:      The interleaved I/Q samples
+        :param the_timestamp: BULKIO.PrecisionUTCTime of the first sample
 
-                        self.addModifyKeyword(the_sri, "GEOLOCATION_GPS", the_list)
-                        self._baseLog.info("SRI <{}>".format(the_sri))
+        :return:
+            N/A
+        """
+        the_device = self.devices_[index]
+        streamID   = the_device.stream_id()
 
-                        self.port_dataShort_out.pushSRI(the_sri)
-                        self._baseLog.debug("    Pushed SRI")
+        the_sri_changed = the_device.sri_changed()
+        the_retune      = the_device.advance_samples(len(the_data) / 2)
 
-                    self._baseLog.debug("    streamId <{}>, len <{}>, type data[0] <{}>".format(streamID, len(the_data), type(the_data[0])))
-                    self._baseLog.debug("    Before push {:.4f}".format(time.time()))
-                    self.port_dataShort_out.pushPacket(the_data, the_timestamp, False, streamID)
-                    self._baseLog.debug("    After  push {:.4f}".format(time.time()))
+        if the_retune is not None:
+            the_split, the_previous_rate = the_retune
 
-                #self._baseLog.info("Total time for call <{}>".format(time.time() - the_start_time))
-            else:
-                self._baseLog.debug("    Unknown format()")
-                self._baseLog.debug("<-- process()")
-                return NOOP
+            if the_split > 0:
+                self.port_dataShort_out.pushPacket(the_data[:2 * the_split], the_timestamp, False, streamID)
 
-        self._baseLog.trace("<-- process()")
-        return NORMAL
+                if the_previous_rate > 0:
+                    the_timestamp = self._offset_timestamp_(the_timestamp, the_split / float(the_previous_rate))
+
+                the_data = the_data[2 * the_split:]
+
+            the_sri_changed = True
+
+        if the_sri_changed:
+            self._push_sri_(index)
+
+        self._baseLog.debug("    streamId <{}>, len <{}>".format(streamID, len(the_data)))
+        self._baseLog.debug("    Before push {:.4f}".format(time.time()))
+        self.port_dataShort_out.pushPacket(the_data, the_timestamp, False, streamID)
+        self._baseLog.debug("    After  push {:.4f}".format(time.time()))
+
+    @staticmethod
+    def _offset_timestamp_(the_timestamp, the_seconds):
+        """
+        This is a utility method that returns a copy of the_timestamp moved the_seconds later (earlier when
+        negative).
+        """
+        the_result     = copy.copy(the_timestamp)
+        the_fractional = the_timestamp.tfsec + the_seconds
+        the_whole      = int(the_fractional // 1)
+
+        the_result.twsec = the_timestamp.twsec + the_whole
+        the_result.tfsec = the_fractional - the_whole
+
+        return the_result
+
+    def _update_retune_status_(self):
+        """
+        This is a utility method that refreshes the avs4000_retune_status property from the devices.
+
+        :return:
+            N/A
+        """
+        the_status = []
+
+        for tuner_id, the_device in sorted(self.devices_.items()):
+            the_status.append\
+                (
+                    self.avs4000_retune_status___struct
+                        (
+                            tuner_number = tuner_id,
+                            retunes      = the_device.retune_count(),
+                            last_latency = the_device.retune_latency() * 1000.0,
+                            max_latency  = the_device.retune_latency_max() * 1000.0,
+                            coalesced    = the_device.tunes_coalesced()
+                        )
+                )
+
+        self.avs4000_retune_status = the_status
+
+    def _status_intervals_(self):
+        """
+        This is a utility method that returns the refresh interval of each status group, from the
+        avs4000_xxx_interval properties.
+        """
+        return \
+            {
+                "rxstat": self.avs4000_rxstat_interval,
+                "gps":    self.avs4000_gps_interval,
+                "master": self.avs4000_master_interval
+            }
+
+    def _start_status_poller_(self, tuner_id):
+        """
+        This is a utility method that starts refreshing the status of the tuner in the background.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_on_change = lambda the_groups: self._status_changed_(tuner_id, the_groups)
+
+        try:
+            the_poller = AVS4000Transceiver.StatusPoller\
+                (
+                    self.devices_[tuner_id], self._status_intervals_(), the_on_change=the_on_change
+                )
+
+        except ValueError as the_error:
+            self._baseLog.error("Not refreshing the status of tuner <{}>, because <{}>".format(tuner_id, the_error))
+            return
+
+        self.status_pollers_[tuner_id] = the_poller
+        the_poller.start()
+
+    def _stop_status_poller_(self, tuner_id):
+        """
+        This is a utility method that stops refreshing the status of the tuner.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_poller = self.status_pollers_.pop(tuner_id, None)
+
+        if the_poller is not None:
+            the_poller.stop()
+
+    def _status_changed_(self, tuner_id, the_groups):
+        """
+        This is called by the StatusPoller of the tuner when refreshed status groups changed, frontend_tuner_status
+        is only written when one of its values changed.
+
+        NOTE:
+            A change in the GPS position is pushed with the SRI, see DeviceController.refresh_status.
+
+        :param tuner_id:   The tuner id
+        :param the_groups: The groups whose values changed
+
+        :return:
+            N/A
+        """
+        if "rxstat" in the_groups:
+            the_status = self.frontend_tuner_status[tuner_id]
+            the_gain   = float(self.devices_[tuner_id].rxstatus().gain())
+
+            if the_status.gain != the_gain:
+                the_status.gain = the_gain
+
+    def _start_supervisor_(self, tuner_id):
+        """
+        This is a utility method that starts watching the connections of the tuner, so they are rebuilt when lost.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_supervisor = AVS4000Transceiver.ConnectionSupervisor\
+            (
+                self.devices_[tuner_id], the_on_recover=lambda the_outage: self._recovered_(tuner_id, the_outage)
+            )
+
+        self.supervisors_[tuner_id] = the_supervisor
+        the_supervisor.start()
+
+    def _stop_supervisor_(self, tuner_id):
+        """
+        This is a utility method that stops watching the connections of the tuner.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_supervisor = self.supervisors_.pop(tuner_id, None)
+
+        if the_supervisor is not None:
+            the_supervisor.stop()
+
+    def _recovered_(self, tuner_id, the_outage):
+        """
+        This is called by the ConnectionSupervisor of the tuner once its connections have been rebuilt.  The data
+        threads are started again on the new data socket.
+
+        :param tuner_id:   The tuner id
+        :param the_outage: The number of seconds the outage lasted
+
+        :return:
+            N/A
+        """
+        self._baseLog.warning("Tuner <{}> recovered after <{:.3f}> seconds".format(tuner_id, the_outage))
+
+        self._reset_sri_(tuner_id)
+
+        if tuner_id in self.pipelines_:
+            self._start_pipeline_(tuner_id)
+
+        self._update_reconnect_status_()
+
+    def _update_reconnect_status_(self):
+        """
+        This is a utility method that refreshes the avs4000_reconnect_status property from the supervisors.
+
+        :return:
+            N/A
+        """
+        the_status = []
+
+        for tuner_id, the_supervisor in sorted(self.supervisors_.items()):
+            the_status.append\
+                (
+                    self.avs4000_reconnect_status___struct
+                        (
+                            tuner_number      = tuner_id,
+                            outages           = the_supervisor.outages(),
+                            in_outage         = the_supervisor.in_outage(),
+                            last_outage       = the_supervisor.last_outage(),
+                            total_outage      = the_supervisor.total_outage(),
+                            samples_lost      = the_supervisor.samples_lost(),
+                            samples_recovered = the_supervisor.samples_recovered()
+                        )
+                )
+
+        self.avs4000_reconnect_status = the_status
+
+    def _update_clock_status_(self):
+        """
+        This is a utility method that refreshes the avs4000_clock_status property from the sample clocks of the
+        enabled tuners.
+
+        :return:
+            N/A
+        """
+        the_status = []
+
+        for tuner_id, the_device in sorted(self.devices_.items()):
+            if not self.frontend_tuner_status[tuner_id].enabled:
+                continue
+
+            the_clock = the_device.sample_clock()
+
+            the_status.append\
+                (
+                    self.avs4000_clock_status___struct
+                        (
+                            tuner_number = tuner_id,
+                            reference    = the_clock.reference() or "",
+                            drift        = the_clock.drift(),
+                            jitter       = the_clock.jitter() * 1.0e6,
+                            observations = the_clock.observations()
+                        )
+                )
+
+        self.avs4000_clock_status = the_status
+
+    def _update_continuity_status_(self):
+        """
+        This is a utility method that refreshes the avs4000_continuity_status property from the continuity trackers
+        of the enabled tuners.
+
+        :return:
+            N/A
+        """
+        the_status = []
+
+        for tuner_id, the_device in sorted(self.devices_.items()):
+            if not self.frontend_tuner_status[tuner_id].enabled:
+                continue
+
+            the_tracker  = the_device.continuity()
+            the_gap_time = next((the_time for the_time, _ in reversed(the_tracker.gap_times()) if the_time), 0.0)
+
+            the_status.append\
+                (
+                    self.avs4000_continuity_status___struct
+                        (
+                            tuner_number        = tuner_id,
+                            packets             = the_tracker.packets(),
+                            dropped_packets     = the_tracker.dropped_packets(),
+                            dropped_samples     = the_tracker.dropped_samples(),
+                            gaps                = the_tracker.gaps(),
+                            packet_count_errors = the_tracker.packet_count_errors(),
+                            loss_rate           = the_tracker.loss_rate(),
+                            last_gap_time       = the_gap_time,
+                            gaps_concealed      = the_device.gaps_concealed(),
+                            samples_concealed   = the_device.samples_concealed(),
+                            blocks_split        = the_device.blocks_split()
+                        )
+                )
+
+        self.avs4000_continuity_status = the_status
+
+    def _start_hops_(self, tuner_id):
+        """
+        This is a utility method that starts stepping the tuner through its entries of avs4000_hop_plan, if it has
+        any.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_hops = [(the_hop.center_frequency, the_hop.sample_rate, the_hop.dwell)
+                    for the_hop in self.avs4000_hop_plan if the_hop.tuner_number == tuner_id]
+
+        if not the_hops:
+            return
+
+        the_on_hop = lambda the_index, the_hop, the_start: self._hop_started_(tuner_id, the_index, the_hop, the_start)
+
+        try:
+            the_scheduler = AVS4000Transceiver.HopScheduler(self.devices_[tuner_id], the_hops, the_on_hop=the_on_hop)
+
+        except ValueError as the_error:
+            self._baseLog.error("Ignoring hops of tuner <{}>, because <{}>".format(tuner_id, the_error))
+            return
+
+        self.hop_schedulers_[tuner_id] = the_scheduler
+        the_scheduler.start()
+
+    def _stop_hops_(self, tuner_id):
+        """
+        This is a utility method that stops the hops of the tuner, the tuner stays on its current hop.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        the_scheduler = self.hop_schedulers_.pop(tuner_id, None)
+
+        if the_scheduler is not None:
+            the_scheduler.stop()
+
+        self.hop_keywords_.pop(tuner_id, None)
+
+    def _hop_started_(self, tuner_id, the_index, the_hop, the_start):
+        """
+        This is called by the HopScheduler of the tuner once a hop is armed, the SRI pushed with the first sample of
+        the hop carries the new tuning and hop keywords.
+
+        :param tuner_id:  The tuner id
+        :param the_index: Index of the hop in the tuner's hops
+        :param the_hop:   (center frequency, sample rate, dwell)
+        :param the_start: UTC start time of the hop
+
+        :return:
+            N/A
+        """
+        the_status = self.frontend_tuner_status[tuner_id]
+        the_status.center_frequency = the_hop[0]
+        the_status.sample_rate      = the_hop[1]
+
+        self.hop_keywords_[tuner_id] = \
+            {
+                "AVS4000_HOP_INDEX": the_index,
+                "AVS4000_HOP_START": the_start,
+                "AVS4000_HOP_DWELL": the_hop[2]
+            }
+
+    def _tune_done_(self, tuner_id, the_future):
+        """
+        This is called once a retune requested by setTunerCenterFrequency or setTunerOutputSampleRate has been made.
+        When it was refused, or could not be made, the tuner status goes back to the values the device confirmed.
+
+        :param tuner_id:   The tuner id
+        :param the_future: The ControlFuture returned by DeviceController.request_tune
+
+        :return:
+            N/A
+        """
+        try:
+            the_confirmed = the_future.result()
+
+        except RuntimeError as the_error:
+            self._baseLog.error("Tuner <{}> was not retuned, because <{}>".format(tuner_id, str(the_error)))
+            the_confirmed = False
+
+        if not the_confirmed:
+            the_device = self.devices_[tuner_id]
+
+            self._baseLog.error("Tuner <{}> refused the retune".format(tuner_id))
+
+            self.frontend_tuner_status[tuner_id].center_frequency = the_device.center_frequency()
+            self.frontend_tuner_status[tuner_id].sample_rate      = the_device.sample_rate()
+
+        self._update_retune_status_()
+
+    def _push_data_(self, index, the_data, the_time):
+        """
+        This is the pusher stage of the DataPipeline for a tuner.
+
+        :param index:    The tuner id
+        :param the_data: The block converted by DeviceController.convert_data_block
+        :param the_time: The time the block was read from the data socket, time.time()
+
+        :return:
+            N/A
+        """
+        if self.devices_[index].output_format() == AVS4000Transceiver.VITA49OutputFormat:
+            self._push_vita49_(index, the_data)
+        else:
+            self._push_complex_(index, the_data, self._complex_timestamp_(index, the_data, the_time))
+
+    def _start_pipeline_(self, tuner_id):
+        """
+        This is a utility method that starts the reader, parser and pusher threads of a tuner.  When
+        avs4000_data_reader is EPOLL, the data socket is read by the DataEngine instead of a reader thread.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        self._baseLog.debug("--> _start_pipeline_()")
+
+        self._stop_pipeline_(tuner_id)
+
+        the_device = self.devices_[tuner_id]
+        the_depth  = int(self.avs4000_pipeline_depth)
+
+        #
+        # One receive buffer for every block that can be queued, plus the one each stage is working on.
+        #
+        the_device.set_buffer_pool_capacity(2 * the_depth + 3)
+
+        the_use_engine = self.avs4000_data_reader == enums.avs4000_data_reader.EPOLL
+
+        the_pipeline = AVS4000Transceiver.DataPipeline\
+            (
+                the_device.stream_id(),
+                None if the_use_engine else the_device.read_data_block,
+                the_device.convert_data_block,
+                lambda the_data, the_time: self._push_data_(tuner_id, the_data, the_time),
+                the_queue_depth=the_depth,
+                the_release=the_device.release_buffer
+            )
+
+        the_pipeline.start()
+        self.pipelines_[tuner_id] = the_pipeline
+
+        if the_use_engine:
+            if not self.data_engine_.add(the_device, the_pipeline):
+                self._baseLog.error("The data socket of tuner <{}> is not connected".format(tuner_id))
+
+            self.data_engine_.start()
+
+        self._baseLog.debug("<-- _start_pipeline_()")
+
+    def _stop_pipeline_(self, tuner_id):
+        """
+        This is a utility method that stops the reader, parser and pusher threads of a tuner, if running.
+
+        :param tuner_id: The tuner id
+
+        :return:
+            N/A
+        """
+        self._baseLog.debug("--> _stop_pipeline_()")
+
+        the_pipeline = self.pipelines_.pop(tuner_id, None)
+
+        #
+        # The data socket has to leave the DataEngine before it is closed by disable()
+        #
+        self.data_engine_.remove(self.devices_[tuner_id])
+
+        if the_pipeline is not None:
+            if not the_pipeline.stop():
+                self._baseLog.error("The data threads of tuner <{}> did not stop".format(tuner_id))
+
+            self._baseLog.info("\nTUNER {}: {}".format(tuner_id, the_pipeline))
+
+        self._baseLog.debug("<-- _stop_pipeline_()")
+
+    def _update_pipeline_status_(self):
+        """
+        This is a utility method that refreshes the avs4000_pipeline_status property from the running pipelines.
+
+        :return:
+            N/A
+        """
+        the_status = []
+
+        for tuner_id, the_pipeline in sorted(self.pipelines_.items()):
+            the_pool = self.devices_[tuner_id].buffer_pool()
+
+            the_pool_buffers, the_pool_in_use, the_pool_exhausted = 0, 0, 0
+
+            if the_pool is not None:
+                the_pool_buffers   = the_pool.allocated()
+                the_pool_in_use    = the_pool.in_use()
+                the_pool_exhausted = the_pool.exhausted()
+
+            the_status.append\
+                (
+                    self.avs4000_pipeline_status___struct
+                        (
+                            tuner_number    = tuner_id,
+                            queue_depth     = the_pipeline.queue_depth(),
+                            read_queue_size = the_pipeline.read_queue_size(),
+                            push_queue_size = the_pipeline.push_queue_size(),
+                            read_high_water = the_pipeline.read_high_water(),
+                            push_high_water = the_pipeline.push_high_water(),
+                            blocks_read     = the_pipeline.blocks_read(),
+                            blocks_pushed   = the_pipeline.blocks_pushed(),
+                            blocks_dropped  = the_pipeline.blocks_dropped(),
+                            stalls          = the_pipeline.stalls(),
+                            pool_buffers    = the_pool_buffers,
+                            pool_in_use     = the_pool_in_use,
+                            pool_exhausted  = the_pool_exhausted
+                        )
+                )
+
+        self.avs4000_pipeline_status = the_status
 
     '''
     *************************************************************
@@ -603,9 +1374,23 @@ class AVS4000_i(AVS4000_base):
             self._baseLog.debug("<-- getTunerCenterFrequency()")
             raise FRONTEND.BadParameterException("Center frequency cannot be less than 0")
 
-        # set hardware to new value. Raise an exception if it's not possible
+        #
+        # Retune the hardware while the data keeps flowing.  The status is updated first, so the SRI pushed where
+        # the change takes effect carries the new value.  Requests close together are merged, see
+        # avs4000_tune_window.
+        #
+        the_previous = self.frontend_tuner_status[idx].center_frequency
         self.frontend_tuner_status[idx].center_frequency = freq
 
+        the_future = self.devices_[idx].request_tune(the_center_frequency=freq)
+
+        if the_future.done() and not the_future.result():
+            self.frontend_tuner_status[idx].center_frequency = the_previous
+            self._baseLog.debug("<-- getTunerCenterFrequency()")
+            raise FRONTEND.BadParameterException("Unable to tune to <{}>".format(freq))
+
+        the_future.add_done_callback(lambda the_future: self._tune_done_(idx, the_future))
+
         self._baseLog.debug("<-- getTunerCenterFrequency()")
 
     def getTunerCenterFrequency(self,allocation_id):
@@ -737,10 +1522,20 @@ class AVS4000_i(AVS4000_base):
             raise FRONTEND.BadParameterException("Sample rate cannot be less than 0")
 
         #
-        # set hardware to new value. Raise an exception if it's not possible
+        # Retune the hardware while the data keeps flowing, see setTunerCenterFrequency.
         #
-
+        the_previous = self.frontend_tuner_status[idx].sample_rate
         self.frontend_tuner_status[idx].sample_rate = sr
+
+        the_future = self.devices_[idx].request_tune(the_sample_rate=sr)
+
+        if the_future.done() and not the_future.result():
+            self.frontend_tuner_status[idx].sample_rate = the_previous
+            self._baseLog.debug("<-- setTunerOutputSampleRate()")
+            raise FRONTEND.BadParameterException("Unable to set the sample rate to <{}>".format(sr))
+
+        the_future.add_done_callback(lambda the_future: self._tune_done_(idx, the_future))
+
         self._baseLog.debug("<-- setTunerOutputSampleRate()")
 
     def getTunerOutputSampleRate(self, allocation_id):
@@ -806,18 +1601,23 @@ class AVS4000_i(AVS4000_base):
 
         try:
             #
-            # FIXME: Need to periodically query the GPS.
-            #
-            # Make a request to the device for the GPS information, assume that
-            # it is stationary.
+            # Make a request to the device for the GPS information, so the first SRI has it.  From then on the
+            # status is refreshed in the background, see _start_status_poller_.
             #
             self.devices_[tuner_id].query_gps()
+            self._reset_sri_(tuner_id)
             self.devices_[tuner_id].enable()
 
             #
-            # FIXME: I should create an initializtion method to centralize setting up values.
+            # Read, convert and push the data on separate threads, so that the data socket is drained
+            # while the previous block is being pushed.
             #
-            self.expected_frame_count_ = -1
+            if self.devices_[tuner_id].read_data_flag() and self.avs4000_pipeline_depth > 0:
+                self._start_pipeline_(tuner_id)
+
+            self._start_hops_(tuner_id)
+            self._start_status_poller_(tuner_id)
+            self._start_supervisor_(tuner_id)
             self._baseLog.debug("Device:\n{}".format(self.devices_[tuner_id]))
 
         except RuntimeError as the_error:
@@ -841,6 +1641,11 @@ class AVS4000_i(AVS4000_base):
         self._baseLog.debug("    fts<{}>".format(fts))
         self._baseLog.debug("    tuner_id<{}>".format(tuner_id))
 
+        self._stop_supervisor_(tuner_id)
+        self._stop_status_poller_(tuner_id)
+        self._stop_hops_(tuner_id)
+        self._stop_pipeline_(tuner_id)
+
         try:
             self._baseLog.debug("    calling disable()")
             self.devices_[tuner_id].disable()
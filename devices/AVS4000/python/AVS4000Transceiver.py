@@ -14,8 +14,16 @@ import json
 import array
 import threading
 import time
-import distutils.util
+import math
+import errno
+import functools
+import os
+import select
 import struct
+import Queue
+import collections
+import distutils.util
+import numpy
 import Vita49
 
 
@@ -28,6 +36,21 @@ VITA49OutputFormat   = 'Vita49Data'
 BIGOutputEndian    = "Big"
 LITTLEOutputEndian = "Little"
 
+LISTPayloadMode  = 'ListPayload'   # Samples are returned as Python lists/tuples of signed 16bit values
+NUMPYPayloadMode = 'NumPyPayload'  # Samples are returned as NumPy int16 arrays, viewing the receive buffer
+
+FIXEDBlockMode = 'FixedBlock'  # Each read is block_packets packets
+AUTOBlockMode  = 'AutoBlock'   # Each read is sized from the sample rate and block_latency
+
+IGNOREGapPolicy   = 'IgnoreGaps'    # The payloads either side of missing packets are joined
+ZEROFILLGapPolicy = 'ZeroFillGaps'  # Missing samples are replaced by zeros
+HOLDLASTGapPolicy = 'HoldLastGaps'  # Missing samples are replaced by the sample before them
+SPLITGapPolicy    = 'SplitGaps'     # A new block, with its own timestamp, is started after missing samples
+
+DEVICEClockReference  = 'Device'   # The device started the data at a known time, see SampleClock
+STATUSClockReference  = 'RxStat'   # Fit of the RxStat sample count against the host time
+ARRIVALClockReference = 'Arrival'  # Fit of the block positions against the host time they were read
+
 BASE_CONTROL_PORT = 12900
 BASE_RECEIVE_PORT = 12700
 
@@ -567,7 +590,7 @@ class RX:
                 self.startUTCInt_ = value
 
             elif key == "UserDelay":
-                self.startUTCInt_ = value
+                self.userDelay_ = value
 
             else:
                 self.logger_.debug("LEAVE")
@@ -1379,12 +1402,431 @@ class GPS:
         return self.updates_
 
 
+class ReplyReader:
+    """
+    This class frames the replies read from an avs4000d control port.  Each reply is a JSON document terminated by a
+    newline.  A large reply may arrive over several reads, and the replies to pipelined requests may arrive together,
+    so the bytes that follow a newline are kept for the next reply.
+    """
+    _chunk_size_ = 65536   # The most bytes taken from the socket by one recv
+
+    def __init__(self):
+        self.chunks_ = []  # Bytes received that are not part of a returned reply, only the last may hold a newline
+
+    def reset(self):
+        """
+        Use this method to discard any bytes received, when the connection is replaced.
+        """
+        self.chunks_ = []
+
+    def read_line(self, the_socket):
+        """
+        Use this method to read the next reply from the_socket as a string, without the newline.
+
+        :param the_socket: The connected control socket
+
+        :return:
+            The string holding the reply
+
+        :raises EOFError:     the connection was closed before a whole reply was received
+        :raises socket.error: the socket failed or timed out
+        """
+        while True:
+            the_line = self._next_line_()
+
+            if the_line is not None:
+                if the_line.strip():
+                    return the_line
+                continue
+
+            the_data = the_socket.recv(self._chunk_size_)
+
+            if not the_data:
+                raise EOFError("Connection closed with <{}> bytes of a reply received".format(self.pending()))
+
+            self.chunks_.append(the_data)
+
+    def read_reply(self, the_socket):
+        """
+        Use this method to read the next reply from the_socket as JSON.
+
+        :param the_socket: The connected control socket
+
+        :return:
+            The decoded reply
+
+        :raises ValueError:   the reply is not valid JSON, the reply is consumed
+        :raises EOFError:     the connection was closed before a whole reply was received
+        :raises socket.error: the socket failed or timed out
+        """
+        return json.loads(self.read_line(the_socket))
+
+    def _next_line_(self):
+        """
+        This is a utility method that removes the first whole line from the bytes received.
+
+        :return:
+            == None, no whole line received yet
+            != None, the line
+        """
+        if not self.chunks_:
+            return None
+
+        the_last  = self.chunks_[-1]
+        the_index = the_last.find("\n")
+
+        if the_index < 0:
+            return None
+
+        the_line  = "".join(self.chunks_[:-1]) + the_last[:the_index]
+        the_rest  = the_last[the_index + 1:]
+
+        self.chunks_ = [the_rest] if the_rest else []
+
+        return the_line
+
+    def pending(self):
+        """
+        Accessor method, that returns the number of bytes received that are not part of a returned reply.
+        """
+        return sum(len(the_chunk) for the_chunk in self.chunks_)
+
+
+class Transaction:
+    """
+    This class collects the group changes and group queries to be made on a Device Controller in one round trip,
+    see DeviceController.transact.  The changes are merged into a single SET request and the queries into a single
+    GET request.
+    """
+    _groups_ = ("rx", "rxdata", "rxstat", "gps", "master")   # The groups that may be queried
+
+    def __init__(self):
+        self.sets_ = {}   # group name -> map of parameter name to value
+        self.gets_ = []   # group names, in the order requested
+
+    def set(self, the_group, the_values):
+        """
+        Use this method to add parameter changes for a group, changes to the same group are merged.
+
+        :param the_group:  The group name, "rxdata" for instance
+        :param the_values: map of parameter name to value
+
+        :return:
+            The Transaction, so calls can be chained
+        """
+        self.sets_.setdefault(the_group, {}).update(the_values)
+        return self
+
+    def get(self, *the_groups):
+        """
+        Use this method to add groups to query.
+
+        :param the_groups: The group names
+
+        :return:
+            The Transaction, so calls can be chained
+
+        :raises ValueError: if a group is not one that can be queried
+        """
+        for the_group in the_groups:
+            if the_group not in self._groups_:
+                raise ValueError("Unable to query group <{}>, use one of <{}>".format(the_group, self._groups_))
+
+            if the_group not in self.gets_:
+                self.gets_.append(the_group)
+
+        return self
+
+    def requests(self):
+        """
+        Use this method to obtain the requests to send, the SET request comes first so the GET reflects the changes.
+
+        :return:
+            List of zero, one or two requests
+        """
+        the_requests = []
+
+        if self.sets_:
+            the_requests.append(["set", self.sets_])
+
+        if self.gets_:
+            the_requests.append(["get", list(self.gets_)])
+
+        return the_requests
+
+    """
+    Quick element accessor methods
+    """
+    def sets(self):
+        return self.sets_
+
+    def gets(self):
+        return self.gets_
+
+
+class ControlFuture:
+    """
+    This class holds the result of a Transaction submitted to a ControlChannel, once the worker has made it.
+    """
+
+    def __init__(self):
+        self.done_event_ = threading.Event()
+        self.lock_       = threading.Lock()   # Guards callbacks_
+        self.callbacks_  = []
+        self.result_     = None
+        self.error_      = None
+
+    def set_result(self, the_result):
+        self.result_ = the_result
+        self._finish_()
+
+    def set_error(self, the_error):
+        self.error_ = the_error
+        self._finish_()
+
+    def add_done_callback(self, the_callback):
+        """
+        Use this method to have the_callback called with the future once it is done, straight away if it already is.
+        The callback is called on the thread that finishes the future.
+        """
+        with self.lock_:
+            if not self.done_event_.is_set():
+                self.callbacks_.append(the_callback)
+                return
+
+        the_callback(self)
+
+    def _finish_(self):
+        with self.lock_:
+            self.done_event_.set()
+            the_callbacks, self.callbacks_ = self.callbacks_, []
+
+        for the_callback in the_callbacks:
+            the_callback(self)
+
+    def done(self):
+        return self.done_event_.is_set()
+
+    def result(self, the_timeout=None):
+        """
+        Use this method to wait for the transaction to be made.
+
+        :param the_timeout: The number of seconds to wait, None waits until it is made
+
+        :return:
+            The value returned by DeviceController.transact
+
+        :raises RuntimeError: the transaction failed, or was not made within the_timeout.  Any other error raised
+                              while making it is given as a RuntimeError, see ControlChannel._run_.
+        """
+        if not self.done_event_.wait(the_timeout):
+            raise RuntimeError("Transaction not made within <{}> seconds".format(the_timeout))
+
+        if self.error_ is not None:
+            raise self.error_
+
+        return self.result_
+
+
+class ControlChannel:
+    """
+    This class makes the transactions of a Device Controller one at a time, from a single worker thread, in the
+    order they were submitted.  Any thread may submit a transaction and either wait on the ControlFuture returned or
+    carry on, the requests and replies of different threads are never interleaved on the control socket.
+
+    A query (a Transaction with no changes) that is already waiting for the worker is not queued again, the
+    submitter is given the future of the waiting one.
+    """
+
+    def __init__(self, the_execute, the_name, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_execute: callable that makes a Transaction and returns its result, DeviceController._transact_
+        :param the_name:    The name of the worker thread
+        :param loglevel:    The log level to use
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.ControlChannel')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.execute_ = the_execute
+        self.name_    = the_name
+
+        self.queue_    = Queue.Queue()
+        self.lock_     = threading.Lock()   # Guards pending_gets_, thread_ and stopping_
+        self.thread_   = None               # The worker, until it has taken the stop request off the queue
+        self.stopping_ = False              # A stop request is queued
+
+        self.pending_gets_ = {}            # Groups queried -> ControlFuture of the waiting query
+
+        #
+        # Metrics
+        #
+        self.submitted_  = 0   # Transactions submitted
+        self.coalesced_  = 0   # Queries given the future of a waiting query
+        self.high_water_ = 0   # Most transactions waiting at one time
+
+    def submit(self, the_transaction):
+        """
+        Use this method to queue a transaction, the worker is started if it is not running.
+
+        :param the_transaction: Transaction object
+
+        :return:
+            ControlFuture object
+        """
+        the_key = None
+
+        if not the_transaction.sets():
+            the_key = tuple(sorted(the_transaction.gets()))
+
+        with self.lock_:
+            self.submitted_ += 1
+
+            if the_key is not None and the_key in self.pending_gets_:
+                self.coalesced_ += 1
+                return self.pending_gets_[the_key]
+
+            the_future = ControlFuture()
+
+            if the_key is not None:
+                self.pending_gets_[the_key] = the_future
+
+            if self.thread_ is None:
+                self._start_worker_()
+
+            self.queue_.put((the_key, the_transaction, the_future))
+            self.high_water_ = max(self.high_water_, self.queue_.qsize())
+
+        return the_future
+
+    def _start_worker_(self):
+        """
+        This is a utility method that starts a worker on the queue.
+
+        NOTE:
+            The caller must hold the lock_, and there must be no other worker.
+        """
+        self.thread_ = threading.Thread(target=self._run_, name=self.name_)
+        self.thread_.daemon = True
+        self.thread_.start()
+
+    def in_worker(self):
+        """
+        Use this method to find out if the calling thread is the worker, which must not wait on a future.
+        """
+        return self.thread_ is not None and threading.current_thread() is self.thread_
+
+    def stop(self, the_timeout=5.0):
+        """
+        Use this method to stop the worker once the transactions already queued have been made.  A later submit
+        starts it again.
+
+        Notes:
+          The worker stays the worker until it takes the stop request off the queue, so there is never more than one.
+          The transactions submitted after the stop request are made by a new worker, once the old one has stopped.
+
+        :param the_timeout: The number of seconds to wait for the worker to finish
+
+        :return:
+            == True,  the worker finished
+            == False, the worker did not finish
+        """
+        with self.lock_:
+            the_thread = self.thread_
+
+            if the_thread is None:
+                return True
+
+            if not self.stopping_:
+                self.queue_.put(None)
+                self.stopping_ = True
+
+        if the_thread is threading.current_thread():
+            return True
+
+        the_thread.join(the_timeout)
+
+        if the_thread.is_alive():
+            self.logger_.error("Thread <{}> did not finish".format(the_thread.name))
+            return False
+
+        return True
+
+    def _run_(self):
+        self.logger_.debug("ENTER")
+
+        while True:
+            the_item = self.queue_.get()
+
+            if the_item is None:
+                with self.lock_:
+                    self.stopping_ = False
+
+                    #
+                    # The transactions submitted after the stop request go to a new worker, it only starts once
+                    # this one has finished with the queue.
+                    #
+                    if self.queue_.empty():
+                        self.thread_ = None
+                    else:
+                        self._start_worker_()
+                break
+
+            the_key, the_transaction, the_future = the_item
+
+            #
+            # Once the query is being made, a new one is queued rather than given a reply that may predate it.
+            #
+            if the_key is not None:
+                with self.lock_:
+                    self.pending_gets_.pop(the_key, None)
+
+            try:
+                the_future.set_result(self.execute_(the_transaction))
+
+            except RuntimeError as the_error:
+                the_future.set_error(the_error)
+
+            except Exception as the_error:
+                #
+                # The callers only handle RuntimeError, see ControlFuture.result.
+                #
+                self.logger_.error("Transaction failed, because <{}>".format(str(the_error)))
+                the_future.set_error(RuntimeError("Transaction failed, because <{}>".format(str(the_error))))
+
+        self.logger_.debug("LEAVE")
+
+    """
+    Quick element accessor methods
+    """
+    def running(self):
+        return self.thread_ is not None
+
+    def submitted(self):
+        return self.submitted_
+
+    def coalesced(self):
+        return self.coalesced_
+
+    def high_water(self):
+        return self.high_water_
+
+
 class DeviceManager:
     """
     This class represents the Device Manager (DM) provided by the AVS4000 daemon.  The DM, is
     responsible for manageing all of the Device Controllers (DC)'s present.
     """
 
+    _verify_interval_ = 0.05   # Seconds between checks for the first packets, see verify_synchronized_start
+
     def __init__(self, the_host='localhost', the_port=BASE_CONTROL_PORT, loglevel=logging.DEBUG):
         """
         Constructor
@@ -1513,9 +1955,9 @@ class DeviceManager:
 
             the_string = json.dumps(the_request) + '\n'
 
-            self.socket_.send(the_string)
+            self.socket_.sendall(the_string)
 
-            the_data = self.socket_.recv(8192)
+            the_data = ReplyReader().read_line(self.socket_)
 
             self.logger_.debug("the_data <{}>".format(the_data))
 
@@ -1533,6 +1975,108 @@ class DeviceManager:
         self.logger_.debug("LEAVE")
         return the_map
 
+    def start_synchronized(self, the_controllers, the_lead=2.0):
+        """
+        Use this method to start the data of several Device Controllers on the same sample.  Every controller is armed
+        with the same timed start (see DeviceController.enable_at), on the first whole second at least the_lead
+        seconds away, and then enabled.  The devices hold their data until that second.
+
+        If a controller can not be armed, the controllers that were are disabled again, a partial start is of no use
+        for coherent processing.
+
+        Notes:
+          the_lead has to cover arming every controller, the controllers are armed concurrently.
+
+        :param the_controllers: map of key to DeviceController object, the controllers to start
+        :param the_lead:        The minimum number of seconds from now to the start
+
+        :return:
+            The UTC start time, in whole seconds since the epoch, see verify_synchronized_start
+
+        :raises RuntimeError: if a controller could not be armed
+        """
+        self.logger_.debug("ENTER")
+
+        the_start = int(math.ceil(time.time() + the_lead))
+        the_fleet = DeviceFleet(the_controllers)
+
+        the_arguments = dict((the_key, (the_start, 0)) for the_key in the_controllers)
+
+        the_results, the_errors = the_fleet.run("enable_at", the_arguments)
+
+        the_failed = sorted(the_errors.keys() + [the_key for the_key in the_results if not the_results[the_key]])
+
+        if the_failed:
+            the_fleet.run("disable", dict((the_key, ()) for the_key in the_results if the_key not in the_failed))
+
+            self.logger_.debug("LEAVE")
+            raise RuntimeError("Unable to arm a synchronized start of <{}>".format(the_failed))
+
+        self.logger_.info("Synchronized start of <{}> at <{}>".format(sorted(the_controllers.keys()), the_start))
+
+        self.logger_.debug("LEAVE")
+        return the_start
+
+    def verify_synchronized_start(self, the_controllers, the_start, the_timeout=5.0):
+        """
+        Use this method to check that the controllers started by start_synchronized started together, the UTC
+        second of the first Vita49 packet of every controller must be the_start, see DeviceController.first_timestamp.
+
+        Notes:
+          The data has to be read while waiting, by a DataPipeline, a DataEngine or the caller.  Controllers that are
+          not reading Vita49 data have no timestamps to compare, and are left out.  A first packet whose time is not
+          related to UTC can not be checked, and fails the check.
+
+        :param the_controllers: map of key to DeviceController object, the controllers started
+        :param the_start:       The UTC start time returned by start_synchronized
+        :param the_timeout:     The number of seconds after the_start to wait for the first packets
+
+        :return:
+            Tuple of two elements:
+                Item 1: == True,  every controller started on the_start
+                        == False, a controller started on another second, no packet with a UTC time was received
+                                  in time, or no controller reads Vita49 data
+                Item 2: map of key to the UTC second of the first packet, None when it could not be checked
+        """
+        self.logger_.debug("ENTER")
+
+        the_checked = dict((the_key, the_controller) for the_key, the_controller in the_controllers.items()
+                           if the_controller.read_data_flag() and the_controller.rxdata().useV49())
+
+        if not the_checked:
+            self.logger_.error\
+                (
+                    "Synchronized start at <{}> can not be verified, none of <{}> reads Vita49 data".format
+                    (
+                        the_start, sorted(the_controllers.keys())
+                    )
+                )
+
+            self.logger_.debug("LEAVE")
+            return False, {}
+
+        the_deadline = the_start + the_timeout
+
+        while time.time() < the_deadline:
+            if all(the_controller.first_timestamp() is not None for the_controller in the_checked.values()):
+                break
+
+            time.sleep(self._verify_interval_)
+
+        the_timestamps = \
+            dict((the_key, the_controller.first_timestamp()) for the_key, the_controller in the_checked.items())
+
+        the_result = all(the_timestamp == the_start for the_timestamp in the_timestamps.values())
+
+        if not the_result:
+            self.logger_.error\
+                (
+                    "Synchronized start at <{}> failed, first timestamps <{}>".format(the_start, the_timestamps)
+                )
+
+        self.logger_.debug("LEAVE")
+        return the_result, the_timestamps
+
 
 class DeviceController:
     """
@@ -1541,12 +2085,25 @@ class DeviceController:
     #
     # Constants
     #
-    _vita49_expected_shorts_    = 4080
-    _le_vita49_payload_unpack_str_ = 'h' * _vita49_expected_shorts_
-    _be_vita49_payload_unpack_str_ = '>'+ 'h' * _vita49_expected_shorts_
-
-    _le_complex_unpack_str_ = "<" + 'h' * (256 * 1024)  # See complex_buffer_ below, WORKING!!!, Little Endian
-    _be_complex_unpack_str_ = ">" + 'h' * (256 * 1024)  # See complex_buffer_ below, WORKING!!!, Big Endian
+    _vita49_expected_shorts_ = Vita49.VRT_PAYLOAD_SHORTS
+
+    _block_unit_size_   = 8192   # Bytes in a Vita49 packet, also used as the unit of complex data (2048 samples)
+
+    _transient_settings_ = ("run", "conEnable", "startMode", "startUTCInt", "startUTCFrac")  # Not restored by reconnect
+    _group_objects_ = \
+        {
+            "rx":     "rx_",
+            "rxdata": "rx_data_",
+            "rxstat": "rx_stat_",
+            "gps":    "gps_",
+            "master": "master_"
+        }
+    _data_timeout_      = 0.10   # Seconds a read from the data socket waits for data
+    _min_block_packets_ = 1
+    _max_block_packets_ = 256    # 2MB
+
+    _le_sample_dtype_ = numpy.dtype("<i2")  # Signed 16bit I or Q, Little Endian
+    _be_sample_dtype_ = numpy.dtype(">i2")  # Signed 16bit I or Q, Big Endian
 
     def __init__(self, the_device_number, the_address, the_serial_number, the_model, the_type, loglevel=logging.INFO):
         """
@@ -1563,6 +2120,23 @@ class DeviceController:
             1. Added a lock on the data_socket_ because the REDHAWK SDR may call a get_data, while the data_socket_
                is being manipulated.  Need to ensure that the value of that parameter is protected.
 
+            2. A read that times out part way through a block keeps the bytes received in read_buffer_, the next
+               call resumes filling the same buffer at read_offset_.  Data is not lost and the stream stays aligned.
+
+            3. shadow_ holds the last values the daemon confirmed for each group, keyed by group then parameter name
+               as the daemon reports it.  transact only sends the changes that differ from it, and the group
+               objects (rx_, rx_data_, master_, ...) are only updated with confirmed values.  It is cleared when the
+               control port is connected, as the device may have been changed while disconnected.
+
+            4. The transactions of every thread (the status poller, a hop scheduler, the REDHAWK threads) are
+               queued on control_channel_ and made one at a time by its worker, so their requests and replies are
+               never interleaved.  The control port is connected by the worker, see connect_control.
+               control_lock_ is held for each exchange on the control socket, for callers of send_command(s).
+
+            5. In the Vita49 output format the buffers of the buffer pool start with a packet of headroom, the data is
+               received after it (see _block_headroom_).  The partial packet at the end of a block is copied into the
+               headroom of the next buffer, just before its data, so the stream is parsed without joining buffers.
+
         """
         self.logger_ = logging.getLogger('AVS4000Transceiver.DeviceController')
 
@@ -1602,8 +2176,14 @@ class DeviceController:
         self.data_port_        = BASE_RECEIVE_PORT + self.dn_.dn()   # The data port to read from
 
         self.control_socket_   = None                                      # Socket attached to control port
+        self.reply_reader_     = ReplyReader()                             # Frames the replies on control_socket_
+        self.control_channel_  = ControlChannel(self._transact_, self.stream_id_ + "_control")  # See Note 4.
+        self.shadow_           = {}                                        # See Note 3.
+        self.status_times_     = {}                                        # When each group was last queried
+        self.settings_         = {}                                        # Changes confirmed, see reconnect
         self.data_socket_      = None                                      # Socket attached to data port
         self.data_lock_        = threading.Lock()                          # See Note 1.
+        self.control_lock_     = threading.RLock()                         # See Note 4.
 
         #
         # Objects representing AVS4000 groups
@@ -1617,11 +2197,70 @@ class DeviceController:
 
         self.allocation_id_    = ''                        # REDHAWK specific.
         self.sri_change_flag_  = False                     # Has the user changed the RX Tuning parameters.
+        self.streaming_        = False                     # Has enable turned the data on, see connection_lost
+        self.data_lost_        = False                     # Was the data socket closed or failed while reading
         self.read_data_        = True                      # Determines if this object will attach to data_port_
+        self.payload_mode_     = LISTPayloadMode           # How samples are returned by the get_data_x methods
+
+        self.buffer_pool_          = None                   # Receive buffers for the active format, see _buffer_pool_()
+        self.buffer_pool_capacity_ = 2                      # Most receive buffers the pool may allocate
+        self.data_buffer_          = None                   # Buffer checked out by the get_data_x methods
+        self.block_mode_           = FIXEDBlockMode         # How the size of each read is chosen, see block_packets()
+        self.block_packets_        = 64                     # Packets per read in FIXEDBlockMode, 64 ~= 512K
+        self.block_latency_        = 50.0                   # Target latency in ms of each read in AUTOBlockMode
+        self.bulk_receive_         = False                  # Receive each block with MSG_WAITALL, see set_bulk_receive
+        self.receive_flags_        = 0                      # Flags passed to recv_into
+        self.read_buffer_          = None                   # Buffer being filled from the data socket, see Note 2.
+        self.read_offset_          = 0                      # Number of bytes of read_buffer_ already filled
+        self.pending_buffer_       = None                   # Partially filled buffer of read_data_block
+        self.vita49_payload_array_ = None                   # Aggregated payload, see get_data_vita49_single_timestamp
+        self.vita49_carry_         = (0, 0)                 # [start, end) of the partial packet kept for the next read
+        self.vita49_first_         = 0                      # Offset of the bytes carried in data_buffer_, see Note 5.
+        self.vita49_residual_      = numpy.zeros(Vita49.VRT_PACKET_SIZE, dtype=numpy.uint8)  # See convert_data_block
+        self.vita49_residual_size_ = 0                      # Number of bytes of vita49_residual_ kept
+        self.vita49_synchronizer_  = Vita49.Vita49Synchronizer(Vita49.LITTLE_ENDIAN)
+        self.continuity_           = Vita49.Vita49ContinuityTracker()  # Packets missing from the Vita49 stream
+        self.gap_policy_           = IGNOREGapPolicy        # How missing samples are handled, see set_gap_policy
+        self.gap_fill_limit_       = 1.0                    # Seconds of missing samples that may be filled
+        self.gaps_concealed_       = 0                      # Gaps filled by ZEROFILLGapPolicy/HOLDLASTGapPolicy
+        self.samples_concealed_    = 0                      # Samples filled in by them
+        self.blocks_split_         = 0                      # Blocks started after samples were missing
+        self.vita49_last_time_     = None                   # (seconds, picoseconds) of the last packet received
+        self.vita49_last_sample_   = None                   # Last I/Q value received, see HOLDLASTGapPolicy
 
-        self.complex_buffer_       = bytearray(1024 * 512)  # How much data to allocate for reads from data_port
-        self.vita49_data_buffer_   = bytearray(8192 * 64)   # 64 Vita49 packets ~= 512K
-        self.vita49_packet_buffer_ = bytearray(8192 * 64)   # 1024 packets
+        #
+        # Live retune, see retune and advance_samples
+        #
+        self.bytes_received_       = 0                      # Bytes read from the data socket since it was connected
+        self.samples_produced_     = 0                      # Samples returned by the data methods since then
+        self.bytes_parsed_         = 0                      # Bytes of the data stream the parser is past
+        self.samples_pushed_       = 0                      # Samples passed to advance_samples since then
+        self.pending_markers_      = collections.deque()    # (bytes received, previous rate, start time) to place
+        self.retune_markers_       = collections.deque()    # (sample position, previous sample rate) of each retune
+        self.vita49_packet_bytes_  = None                   # Stream position of each packet of the last block
+        self.retune_count_         = 0
+        self.retune_latency_       = 0.0                    # Seconds the last retune took to be confirmed
+        self.retune_latency_max_   = 0.0
+
+        #
+        # Merging of tuning requests, see request_tune
+        #
+        self.tune_window_          = 0.0                    # Seconds the requests are merged for
+        self.tune_lock_            = threading.Lock()       # Guards pending_tune_
+        self.pending_tune_         = None                   # [center frequency, sample rate, ControlFuture] waiting
+        self.tunes_coalesced_      = 0                      # Tuning values replaced before they were sent
+
+        #
+        # Synchronized start, see enable_at and DeviceManager.verify_synchronized_start
+        #
+        self.first_timestamp_      = None                   # UTC second of the first Vita49 packet
+        self.first_packet_seen_    = False                  # The first Vita49 packet was received
+
+        #
+        # Timing of the complex samples, see block_time
+        #
+        self.sample_clock_         = SampleClock()
+        self.run_origin_           = 0                      # Position of the sample RxStat.Sample counts from
 
     def __str__(self):
         """
@@ -1634,15 +2273,12 @@ class DeviceController:
         unpack_format = ""
 
         if self.rx_data_.useV49():
-            if self.rx_data_.useBE():
-                unpack_format = self._be_vita49_payload_unpack_str_[0] + " (BE V49)"
-            else:
-                unpack_format = self._le_vita49_payload_unpack_str_[0] + " (LE V49)"
+            unpack_format = self._le_sample_dtype_.str + " (LE V49)"
         else:
             if self.rx_data_.useBE():
-                unpack_format = self._be_complex_unpack_str_[0] + " (BE CMP)"
+                unpack_format = self._be_sample_dtype_.str + " (BE CMP)"
             else:
-                unpack_format = self._le_complex_unpack_str_[0] + " (LE CMP)"
+                unpack_format = self._le_sample_dtype_.str + " (LE CMP)"
 
 
         the_string = "{}\n"\
@@ -1656,7 +2292,12 @@ class DeviceController:
                      "  data_socket    : {}\n"\
                      "  read_data      : {}\n"\
                      "  stream id      : {}\n"\
-                     "  complex unpack : {}\n".format\
+                     "  complex unpack : {}\n"\
+                     "  payload mode   : {}\n"\
+                     "  block mode     : {}\n"\
+                     "  block size     : {}\n"\
+                     "  pool capacity  : {}\n"\
+                     "  bulk receive   : {}\n".format\
             (
                 self.dn_,
                 self.rx_,
@@ -1668,7 +2309,12 @@ class DeviceController:
                 self.data_socket_,
                 self.read_data_,
                 self.stream_id_,
-                unpack_format
+                unpack_format,
+                self.payload_mode_,
+                self.block_mode_,
+                self.block_size(),
+                self.buffer_pool_capacity_,
+                self.bulk_receive_
             )
 
         return the_string
@@ -1689,16 +2335,92 @@ class DeviceController:
 
                     self.data_socket_ = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                     self.data_socket_.setblocking(1)
-                    self.data_socket_.settimeout(0.10)
+                    self.data_socket_.settimeout(self._data_timeout_)
                     self.data_socket_.connect((self.host_, self.data_port_))
 
-                except Exception as the_error:
-                    self.data_socket_ = None
-                    self.logger_.debug("LEAVE")
+                    self._configure_data_socket_()
+
+                    #
+                    # A new connection starts on a packet boundary, drop anything kept from the previous one.
+                    #
+                    self.vita49_carry_         = (0, 0)
+                    self.vita49_residual_size_ = 0
+                    self.vita49_synchronizer_.reset()
+                    self.continuity_.reset()
+                    self._reset_read_()
+
+                    self.vita49_last_time_   = None
+                    self.vita49_last_sample_ = None
+
+                    self.bytes_received_   = 0
+                    self.bytes_parsed_     = 0
+                    self.samples_produced_ = 0
+                    self.samples_pushed_   = 0
+                    self.pending_markers_.clear()
+                    self.retune_markers_.clear()
+                    self.first_timestamp_   = None
+                    self.first_packet_seen_ = False
+                    self.data_lost_         = False
+
+                    self.sample_clock_.reset(self.sample_rate())
+                    self.run_origin_ = 0
+
+                except Exception as the_error:
+                    self.data_socket_ = None
+                    self.logger_.debug("LEAVE")
                     raise RuntimeError("ERROR: Unable to connect to device because <{}>".format(str(the_error)))
 
         self.logger_.debug("LEAVE")
 
+    def _configure_data_socket_(self):
+        """
+        This is a utility method that sets how the data socket waits for data.
+
+            Normally the socket has a timeout, and each recv_into returns whatever has arrived.
+
+            With bulk receive the socket is left blocking with a SO_RCVTIMEO receive timeout, so recv_into with
+            MSG_WAITALL only returns once the whole block has arrived (or the timeout expires), one system call per
+            block instead of one per TCP segment.
+
+        NOTE:
+            The caller must hold the data_lock_ and ensure that data_socket_ is not None.
+
+        :return:
+            N/A
+        """
+        if self.bulk_receive_:
+            the_seconds      = int(self._data_timeout_)
+            the_microseconds = int((self._data_timeout_ - the_seconds) * 1000000)
+
+            self.data_socket_.settimeout(None)
+            self.data_socket_.setsockopt\
+                (
+                    socket.SOL_SOCKET,
+                    socket.SO_RCVTIMEO,
+                    struct.pack("ll", the_seconds, the_microseconds)
+                )
+            self.receive_flags_ = socket.MSG_WAITALL
+        else:
+            self.data_socket_.settimeout(self._data_timeout_)
+            self.receive_flags_ = 0
+
+    def _reset_read_(self):
+        """
+        This is a utility method that drops any partially filled buffer.
+
+        NOTE:
+            The caller must hold the data_lock_.
+
+        :return:
+            N/A
+        """
+        if self.pending_buffer_ is not None:
+            self.release_buffer(self.pending_buffer_)
+
+        self.pending_buffer_ = None
+        self.read_buffer_    = None
+        self.read_offset_    = 0
+
     def disconnect_data(self):
         """
         This method will gracefully shutdown the data connection to the device controller
@@ -1721,10 +2443,15 @@ class DeviceController:
     def connect_control(self):
         """
         This is a utility routine used to connect to the device controller's control port.
-        :param the_host:
+
+        NOTE:
+            It is only called by _transact_, on the worker of control_channel_ with control_lock_ held, so the
+            socket, the reply reader and the shadow state are never reset part way through a transaction.
 
         :return:
+            N/A
 
+        :raises RuntimeError: Unable to connect to the device controller
         """
         self.logger_.debug("ENTER")
 
@@ -1732,6 +2459,8 @@ class DeviceController:
             try:
                 self.control_socket_ = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.control_socket_.connect((self.host_, self.control_port_))
+                self.reply_reader_.reset()
+                self.clear_shadow()
                 self.logger_.debug("connected <{}>".format(self.control_socket_))
 
             except Exception as the_error:
@@ -1755,6 +2484,8 @@ class DeviceController:
             self.control_socket_.close()
             self.control_socket_ = None
 
+        self.reply_reader_.reset()
+
         self.logger_.debug("LEAVE")
 
     def send_command(self, the_request):
@@ -1777,42 +2508,232 @@ class DeviceController:
 
         self.logger_.debug("ENTER, request type <{}>".format(type(the_request)))
 
-        the_string = json.dumps(the_request) + "\n"
+        the_reply = self.send_commands([the_request])[0]
 
-        try:
-            the_number_bytes = self.control_socket_.send(the_string)
-        except Exception:
-            self.control_socket_ = None
-            return False, None
+        self.logger_.debug("LEAVE")
+        return the_reply
 
-        self.logger_.debug("sent number bytes<{}>".format(the_number_bytes))
+    def send_commands(self, the_requests):
+        """
+        Use this method to send several JSON requests to the control port together, and then read the replies.  The
+        daemon answers the requests in the order they were sent, so the cost is a single round trip instead of one
+        per request.
 
-        try:
-            the_data = self.control_socket_.recv(8912)
-        except Exception:
-            self.control_socket_ = None
-            return False, None
+        Notes:
+          When the connection fails the control socket is closed, the request it failed on and those after it are
+          reported as failed.
 
-        self.logger_.debug("received <{}".format(the_data))
+        :param the_requests: list of JSON/(Python list/dictionary) requests to send
 
-        try:
-            the_response = json.loads(the_data)
-        except ValueError:
-            return False, None
+        :return:
+            List holding a tuple for each request, in order, as returned by send_command.
+        """
+        self.logger_.debug("ENTER, number requests <{}>".format(len(the_requests)))
 
-        self.logger_.debug("response: {}".format(json.dumps(the_response, indent=2)))
-        self.logger_.debug("returning <{}>".format(json.dumps(the_response[0])))
+        with self.control_lock_:
+            the_replies = []
 
-        if len(the_response) > 1:
-            #
-            # Make sure to return the string representation of the data, so that the objects can process it themselves
-            # using their update method.
-            #
-            self.logger_.debug("LEAVE")
-            return the_response[0], json.dumps(the_response[1])
+            if self.control_socket_ is None:
+                self.logger_.debug("LEAVE")
+                return [(False, None)] * len(the_requests)
+
+            the_string = "".join(json.dumps(the_request) + "\n" for the_request in the_requests)
+
+            try:
+                self.control_socket_.sendall(the_string)
+            except Exception as the_error:
+                self.logger_.debug("send failed <{}>".format(the_error))
+                self.disconnect_control()
+                self.logger_.debug("LEAVE")
+                return [(False, None)] * len(the_requests)
+
+            self.logger_.debug("sent number bytes<{}>".format(len(the_string)))
+
+            for the_request in the_requests:
+                try:
+                    the_response = self.reply_reader_.read_reply(self.control_socket_)
+
+                except ValueError:
+                    #
+                    # The reply was not JSON, the framing is intact so the next reply can still be read.
+                    #
+                    the_replies.append((False, None))
+                    continue
+
+                except Exception as the_error:
+                    self.logger_.debug("receive failed <{}>".format(the_error))
+                    self.disconnect_control()
+                    break
+
+                self.logger_.debug("response: {}".format(json.dumps(the_response, indent=2)))
+
+                if len(the_response) > 1:
+                    #
+                    # Make sure to return the string representation of the data, so that the objects can process it
+                    # themselves using their update method.
+                    #
+                    the_replies.append((the_response[0], json.dumps(the_response[1])))
+                else:
+                    the_replies.append((the_response[0], None))
+
+            the_replies.extend([(False, None)] * (len(the_requests) - len(the_replies)))
+
+        self.logger_.debug("LEAVE")
+        return the_replies
+
+    def transact(self, the_transaction):
+        """
+        Use this method to make all of the changes and queries of the_transaction in one round trip.  The SET and
+        GET requests are pipelined, see send_commands.
+
+        The transaction is made by the worker of control_channel_, after those submitted before it by any thread,
+        see transact_async.
+
+        :param the_transaction: Transaction object
+
+        :return:
+            map of group name to the object updated from the reply (RX, RxData, RxStat, GPS or Master), for each
+            group queried.
+
+        :raises RuntimeError: Unable to communicate with Device Controller, or a request was refused
+        """
+        if self.control_channel_.in_worker():
+            return self._transact_(the_transaction)
+
+        return self.control_channel_.submit(the_transaction).result()
+
+    def transact_async(self, the_transaction):
+        """
+        Use this method to queue the_transaction without waiting for it to be made, a query that is already queued
+        is not queued again.
+
+        :param the_transaction: Transaction object
+
+        :return:
+            ControlFuture object, its result is the value transact would return
+        """
+        return self.control_channel_.submit(the_transaction)
+
+    def _transact_(self, the_transaction):
+        """
+        This is a utility method that makes the_transaction for transact, it runs on the worker of control_channel_.
+        """
+        self.logger_.debug("ENTER")
+
+        with self.control_lock_:
+            self.connect_control()
+
+            the_requests = self._remove_unchanged_(the_transaction).requests()
+            the_snapshot = {}
+
+            if not the_requests:
+                self.logger_.debug("nothing changed")
+                self.logger_.debug("LEAVE")
+                return the_snapshot
+
+            the_replies = self.send_commands(the_requests)
+
+            for the_request, (valid, data) in zip(the_requests, the_replies):
+                if the_request[0] == "set":
+                    for the_group, the_values in the_request[1].items():
+                        if valid:
+                            self._confirm_(the_group, the_values)
+                            self.settings_.setdefault(the_group, {}).update(the_values)
+                        else:
+                            self._forget_(the_group, the_values)
+
+                if not valid:
+                    self.logger_.debug("LEAVE")
+                    raise RuntimeError("Daemon refused <{}> request, received <{}>".format(the_request[0], data))
+
+                if the_request[0] == "get":
+                    the_reply = json.loads(data)
+
+                    for the_group in the_request[1]:
+                        self._confirm_(the_group, the_reply.get(the_group, {}))
+                        self.status_times_[the_group] = time.time()
+                        the_snapshot[the_group] = getattr(self, self._group_objects_[the_group])
+
+                        if the_group == "rxstat":
+                            self._observe_rx_stat_(self.status_times_[the_group])
 
         self.logger_.debug("LEAVE")
-        return the_response[0], None
+        return the_snapshot
+
+    @staticmethod
+    def _parameter_name_(the_name):
+        """
+        This is a utility method that returns the name of a parameter as the daemon reports it ("SampleRate"), the
+        requests use either form ("sampleRate").
+        """
+        return the_name[:1].upper() + the_name[1:]
+
+    def _remove_unchanged_(self, the_transaction):
+        """
+        This is a utility method that returns a copy of the_transaction without the changes that match the shadow
+        state, see Note 3 of the constructor.  The queries are kept.
+
+        :return:
+            Transaction object
+        """
+        the_changes = Transaction()
+
+        for the_group, the_values in the_transaction.sets().items():
+            the_shadow  = self.shadow_.get(the_group, {})
+            the_changed = {}
+
+            for the_name, the_value in the_values.items():
+                the_key = self._parameter_name_(the_name)
+
+                if the_key not in the_shadow or the_shadow[the_key] != the_value:
+                    the_changed[the_name] = the_value
+
+            if the_changed:
+                the_changes.set(the_group, the_changed)
+
+        the_changes.get(*the_transaction.gets())
+
+        return the_changes
+
+    def _confirm_(self, the_group, the_values):
+        """
+        This is a utility method that records values the daemon has confirmed for the_group, in the shadow state and
+        in the object representing the group.
+        """
+        the_values = dict((self._parameter_name_(the_name), the_value) for the_name, the_value in the_values.items())
+
+        self.shadow_.setdefault(the_group, {}).update(the_values)
+
+        if the_group in self._group_objects_:
+            getattr(self, self._group_objects_[the_group]).update(json.dumps({the_group: the_values}))
+
+    def _forget_(self, the_group, the_values):
+        """
+        This is a utility method used when a change to the_group is refused.  The object representing the group is
+        returned to the last confirmed values, and those values are dropped from the shadow state as the daemon may
+        have applied part of the change.
+        """
+        the_shadow = self.shadow_.get(the_group, {})
+        the_known  = {}
+
+        for the_name in the_values:
+            the_key = self._parameter_name_(the_name)
+
+            if the_key in the_shadow:
+                the_known[the_key] = the_shadow.pop(the_key)
+
+        if the_known and the_group in self._group_objects_:
+            getattr(self, self._group_objects_[the_group]).update(json.dumps({the_group: the_known}))
+
+    def clear_shadow(self):
+        """
+        Use this method when the device may have been changed by another client, so the next transaction sends
+        every change.
+
+        :return:
+            N/A
+        """
+        self.shadow_ = {}
 
     def setup(self):
         """
@@ -1825,24 +2746,16 @@ class DeviceController:
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
-
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata" :
-                        {
-                            "run":       False,
-                            "conEnable": False
-                        }
-                }
-            ]
+        try:
+            self.transact(Transaction().set("rxdata", {"run": False, "conEnable": False}))
 
-        valid, data = self.send_command(the_request)
+        except RuntimeError as the_error:
+            self.logger_.debug("<{}>".format(the_error))
+            self.logger_.debug("LEAVE")
+            return False
 
         self.logger_.debug("LEAVE")
-        return valid
+        return True
 
     def teardown(self):
         """
@@ -1855,24 +2768,20 @@ class DeviceController:
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
+        valid = True
 
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata" :
-                        {
-                            "run":       False,
-                            "conEnable": False
-                        }
-                }
-            ]
+        self.streaming_ = False
 
-        valid, data = self.send_command(the_request)
+        try:
+            self.transact(Transaction().set("rxdata", {"run": False, "conEnable": False}))
+
+        except RuntimeError as the_error:
+            self.logger_.debug("<{}>".format(the_error))
+            valid = False
 
         self.disconnect_data()
         self.disconnect_control()
+        self.control_channel_.stop()
 
         self.logger_.debug("LEAVE")
         return valid
@@ -1892,26 +2801,14 @@ class DeviceController:
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
-
         #
-        # Tell device to create data socket
+        # Tell device to create data socket and turn the data on, in a single request.
         #
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata":
-                    {
-
-                        "conEnable": True,
-                    }
-                }
-            ]
-
-        valid, data = self.send_command(the_request)
+        try:
+            self.transact(Transaction().set("rxdata", {"conEnable": True, "run": True}))
 
-        if not valid:
+        except RuntimeError as the_error:
+            self.logger_.debug("<{}>".format(the_error))
             self.logger_.debug("LEAVE")
             return False
 
@@ -1923,30 +2820,52 @@ class DeviceController:
         #
         # Create data connection
         #
+        self.streaming_ = True
+
         if self.read_data_:
             self.logger_.debug("read_data_ <True>")
             self.connect_data()
         else:
             self.logger_.debug("read_data_ <False>")
 
-        #
-        # Turn the data on
-        #
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata":
-                    {
-                        "run": True
-                    }
-                }
-            ]
+        self.logger_.debug("LEAVE")
+        return True
+
+    def enable_at(self, the_start_utc_int, the_start_utc_frac=0):
+        """
+        Use this method to start data flowing at a given time, the RX group is set for a timed start (StartMode
+        OnTime) before the data is turned on.  The device holds the data until the start time, so that devices
+        enabled with the same start time start on the same sample, see DeviceManager.start_synchronized.
+
+        :param the_start_utc_int:  Whole seconds since the epoch of the start, StartUTCInt
+        :param the_start_utc_frac: Master clock ticks past the_start_utc_int of the start, StartUTCFrac
+
+        :return:
+            == True,  successfully armed and turned the data on
+            == False, unable to start data.
+        """
+        self.logger_.debug("ENTER")
+
+        the_arm = {"startMode": "OnTime", "startUTCInt": the_start_utc_int, "startUTCFrac": the_start_utc_frac}
+
+        try:
+            self.transact(Transaction().set("rx", the_arm))
+
+        except RuntimeError as the_error:
+            self.logger_.error("Unable to arm the start, because {}.".format(str(the_error)))
+            self.logger_.debug("LEAVE")
+            return False
+
+        the_result = self.enable()
 
-        valid, data = self.send_command(the_request)
+        if the_result:
+            the_master_rate = self.master_.sampleRate()
+            the_fraction    = the_start_utc_frac / float(the_master_rate) if the_master_rate > 0 else 0.0
+
+            self.sample_clock_.anchor(self.samples_produced_, the_start_utc_int + the_fraction)
 
         self.logger_.debug("LEAVE")
-        return valid
+        return the_result
 
     def disable(self):
         """
@@ -1960,60 +2879,28 @@ class DeviceController:
 
         self.logger_.debug("ENTER")
 
-        #
-        # Make sure I have a control connection
-        #
-        self.connect_control()
+        self.streaming_ = False
 
         #
         # Issue the request to stop the data.
         #
         #  - conEnable: needs to be sent to ensure socket is closed on server
         #  - run:       needs to be sent to ensure that the data is turned off.
+        #  - startMode: a timed start (see enable_at and arm_start) is cleared, so the next enable starts
+        #               immediately rather than waiting on a start time that has passed.
         #
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata":
-                    {
-                        "run": False
-                    }
-                }
-            ]
-
-        #
-        # Send the request to stop the data
-        #
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("rxdata.run valid <{}>, <{}>".format(valid, data))
-
-        if not valid:
-            self.disconnect_data()
-            self.logger_.debug("LEAVE")
-            raise RuntimeError("Unable to update rxdata.run, received <{}>".format(data))
+        the_stop = Transaction().set("rxdata", {"run": False, "conEnable": False})
 
-        the_request = \
-            [
-                "set",
-                {
-                    "rxdata":
-                        {
-                            "conEnable":  False
-                        }
-                }
-            ]
+        if self.shadow_.get("rx", {}).get("StartMode", "Immediate") != "Immediate":
+            the_stop.set("rx", {"startMode": "Immediate"})
 
-        #
-        # Send the request to teardown socket
-        #
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("rxdata.conEnable valid <{}>, <{}>".format(valid, data))
+        try:
+            self.transact(the_stop)
 
-        if not valid:
+        except RuntimeError as the_error:
             self.disconnect_data()
             self.logger_.debug("LEAVE")
-            raise RuntimeError("Unable to update rxdata.conEnable, received <{}>".format(data))
+            raise RuntimeError("Unable to update rxdata.run/conEnable, <{}>".format(the_error))
 
         #
         # Disconnect the data port
@@ -2021,14 +2908,14 @@ class DeviceController:
         self.disconnect_data()
         self.logger_.debug("LEAVE")
 
-
-    def _create_tune_request(self, the_data_port, the_rx_object, the_rx_data_object):
+    def _create_tune_request(self, the_data_port, the_center_frequency, the_sample_rate, the_rx_data_object):
         '''
         This is a utility method to create the JSON message to configure the receiver for tuning
 
-        :param the_data_port:      The TCP port that the data consumer/sink will read from
-        :param the_rx_object:      The object representing the RX group
-        :param the_rx_data_object: The object representing the RXDATA group
+        :param the_data_port:        The TCP port that the data consumer/sink will read from
+        :param the_center_frequency: Where to tune
+        :param the_sample_rate:      The sample rate
+        :param the_rx_data_object:   The object representing the RXDATA group
 
         :return:
             List that may be converted to a JSON object, and conforms to the AVS4000 API
@@ -2054,8 +2941,8 @@ class DeviceController:
                     },
                     "rx" :
                     {
-                        "sampleRate": the_rx_object.sampleRate(),
-                        "freq":       the_rx_object.freq()
+                        "sampleRate": the_sample_rate,
+                        "freq":       the_center_frequency
                     }
                 }
             ]
@@ -2079,162 +2966,530 @@ class DeviceController:
 
         self.logger_.debug("ENTER")
 
-        self.connect_control()
-
-        self.rx_.config(Freq=the_center_frequency, SampleRate=the_sample_rate)
-
-        self.logger_.debug("<{}>".format(self.rx_))
-
-        the_request = self._create_tune_request(self.data_port_, self.rx_, self.rx_data_)
+        #
+        # The request is built from the arguments, rx_ is only updated once the daemon confirms the values, see Note 3
+        # of the constructor.
+        #
+        the_request = self._create_tune_request(self.data_port_, the_center_frequency, the_sample_rate, self.rx_data_)
 
-        valid, data = self.send_command(the_request)
+        the_transaction = Transaction()
 
-        self.sri_change_flag_ = True
+        for the_group, the_values in the_request[1].items():
+            the_transaction.set(the_group, the_values)
 
         #
-        # Query the device for the current master sample rate.
+        # Query the device for the current master sample rate, along with the tune.
         # This value will be used when calculating the fractional sample rate when receiving vita49 packets
         #
+        the_transaction.get("master")
+
+        self.sri_change_flag_ = True
+
         try:
-            self.query_master()
+            self.transact(the_transaction)
         except Exception as the_error:
             self.logger_.debug("LEAVE")
-            self.logger_.error("Unable to obtain master sample rate, because {}.".format(str(the_error)))
+            self.logger_.error("Unable to tune or obtain master sample rate, because {}.".format(str(the_error)))
             return False
 
-        self.logger_.debug("LEAVE")
-        return valid
-
-    def delete_tune(self):
-        self.logger_.debug("ENTER")
-
-        #
-        # FIXME: Not sure what I should do here
-        #
-
         self.logger_.debug("LEAVE")
         return True
 
-    def query_rx(self):
+    def retune(self, the_center_frequency=None, the_sample_rate=None):
         """
-        Use this method to make a request to the Device Controller for the current rx information
+        Use this method to change the center frequency and/or the sample rate while the data keeps flowing.  Unlike
+        set_tune, rxdata is left alone and only the RX parameters that changed are sent.
 
-        :return:
-           RX: an object representing the rx information
+        The position in the data stream at the moment the change is confirmed is recorded, so the new SRI can go out
+        with the first sample received after it, see _mark_position_ and advance_samples.
 
-        :raises RunTimeError: Unable to communciate with Device Controller
+        :param the_center_frequency: Where to tune in Hz, None to leave it unchanged
+        :param the_sample_rate:      The sample rate in Hz, None to leave it unchanged
+
+        :return:
+            == True,  the retune was confirmed
+            == False, the retune was refused
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
+        the_transaction = Transaction()
 
-        the_request = ['get', ['rx']]
+        if the_center_frequency is not None:
+            the_transaction.set("rx", {"freq": the_center_frequency})
 
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("data <{}>".format(data))
+        if the_sample_rate is not None:
+            #
+            # The master sample rate is used to calculate the fractional timestamp of vita49 packets.
+            #
+            the_transaction.set("rx", {"sampleRate": the_sample_rate}).get("master")
 
-        if valid:
-            self.rx_.update(data)
-        else:
+        the_previous_rate = self.sample_rate()
+        the_start         = time.time()
+
+        try:
+            self.transact(the_transaction)
+        except RuntimeError as the_error:
+            self.logger_.error("Unable to retune, because {}.".format(str(the_error)))
             self.logger_.debug("LEAVE")
-            raise RuntimeError("Daemon refused status request.")
+            return False
 
-        self.logger_.debug("LEAVE")
-        return self.rx_
+        the_latency = time.time() - the_start
 
-    def query_rxstat(self):
+        self._mark_position_(the_previous_rate)
+
+        self.retune_count_       += 1
+        self.retune_latency_      = the_latency
+        self.retune_latency_max_  = max(self.retune_latency_max_, the_latency)
+
+        self.logger_.debug("retune confirmed in <{:.6f}> seconds".format(the_latency))
+        self.logger_.debug("LEAVE")
+        return True
+
+    def request_tune(self, the_center_frequency=None, the_sample_rate=None):
         """
-        Use this method to make a request to the Device Controller for the current rxstatus information.
+        Use this method to retune when the requests may come in bursts, from a user turning a knob for instance.
+        The requests made within tune_window seconds of the first are merged, each value replacing the one before
+        it, and a single retune is made with the latest values once the window closes.  The requests replaced are
+        counted, see tunes_coalesced.
+
+        With a tune_window of 0 the retune is made before returning.
+
+        :param the_center_frequency: Where to tune in Hz, None to leave it unchanged
+        :param the_sample_rate:      The sample rate in Hz, None to leave it unchanged
 
         :return:
-           RxStatus: an object representing the rxstat status
+            ControlFuture object shared by the requests merged, its result is the value retune returns
+        """
+        self.logger_.debug("ENTER")
 
-        :raises RunTimeError: Unable to communicate to Device Controller
+        with self.tune_lock_:
+            the_first = self.pending_tune_ is None
+
+            if the_first:
+                self.pending_tune_ = [None, None, ControlFuture()]
+
+            the_pending = self.pending_tune_
+
+            for index, the_value in enumerate((the_center_frequency, the_sample_rate)):
+                if the_value is not None:
+                    if the_pending[index] is not None:
+                        self.tunes_coalesced_ += 1
+
+                    the_pending[index] = the_value
+
+        if the_first:
+            if self.tune_window_ > 0:
+                the_timer = threading.Timer(self.tune_window_, self._flush_tune_)
+                the_timer.daemon = True
+                the_timer.start()
+            else:
+                self._flush_tune_()
+
+        self.logger_.debug("LEAVE")
+        return the_pending[2]
+
+    def _flush_tune_(self):
+        """
+        This is a utility method that makes the retune merged by request_tune.  It runs on the timer thread, so an
+        error is given to the ControlFuture rather than raised, where it would leave the requests waiting forever.
+        """
+        with self.tune_lock_:
+            the_center_frequency, the_sample_rate, the_future = self.pending_tune_
+            self.pending_tune_ = None
+
+        try:
+            the_result = self.retune(the_center_frequency=the_center_frequency, the_sample_rate=the_sample_rate)
+
+        except Exception as the_error:
+            self.logger_.error("Unable to retune, because <{}>.".format(str(the_error)))
+            the_future.set_error(RuntimeError("Unable to retune, because <{}>".format(str(the_error))))
+            return
+
+        the_future.set_result(the_result)
+
+    def arm_start(self, the_start_time, the_center_frequency=None, the_sample_rate=None):
+        """
+        Use this method to restart the data at the_start_time, optionally on a new center frequency and/or sample
+        rate.  The data is turned off, the RX group is set for a timed start (StartMode OnTime) and the data is turned
+        back on, the device then holds the data until the start time.
+
+        Like retune, the position in the data stream is recorded so the new SRI goes out with the first sample of the
+        restarted data, see advance_samples.
+
+        Notes:
+          StartUTCFrac is given in ticks of the master sample clock, the units of the fractional timestamp of the
+          Vita49 packets.
+
+        :param the_start_time:       UTC time, in seconds since the epoch, of the first sample
+        :param the_center_frequency: Where to tune in Hz, None to leave it unchanged
+        :param the_sample_rate:      The sample rate in Hz, None to leave it unchanged
+
+        :return:
+            == True,  the start was armed
+            == False, the device refused a request
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
+        the_previous_rate = self.sample_rate()
 
-        the_request = ['get', ['rxstat']]
+        the_stop = Transaction().set("rxdata", {"run": False})
 
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("    data <{}>".format(data))
+        if the_center_frequency is not None:
+            the_stop.set("rx", {"freq": the_center_frequency})
 
-        if valid:
-            self.rx_stat_.update(data)
-        else:
+        if the_sample_rate is not None:
+            the_stop.set("rx", {"sampleRate": the_sample_rate}).get("master")
+
+        try:
+            self.transact(the_stop)
+
+            #
+            # The fraction is converted once the master sample rate for the new sample rate is known.
+            #
+            the_whole    = int(the_start_time)
+            the_fraction = int(round((the_start_time - the_whole) * self.master_.sampleRate()))
+
+            the_arm = {"startMode": "OnTime", "startUTCInt": the_whole, "startUTCFrac": the_fraction}
+
+            self.transact(Transaction().set("rx", the_arm))
+
+            self.transact(Transaction().set("rxdata", {"run": True}))
+
+        except RuntimeError as the_error:
+            self.logger_.error("Unable to arm the start, because {}.".format(str(the_error)))
             self.logger_.debug("LEAVE")
-            raise RuntimeError("Daemon refused status request.")
+            return False
+
+        self._mark_position_(the_previous_rate, the_start_time)
 
         self.logger_.debug("LEAVE")
-        return self.rx_stat_
+        return True
 
-    def query_txstatus(self):
+    def _mark_position_(self, the_previous_rate, the_start_time=None):
         """
-        Use this method to make a request to the Device Controller for the current txstatus information.
+        This is a utility method that records where a change confirmed by the device takes effect in the data stream.
+        The bytes received so far came before the change, including those of blocks read but not converted yet, so
+        the position is recorded in bytes received and turned into a position in the samples produced once the parser
+        gets there, see _place_markers_.
+
+        :param the_previous_rate: The sample rate of the samples before the change
+        :param the_start_time:    UTC time of the first sample after the change, when the data was restarted by a
+                                  timed start, None otherwise
+        """
+        self.pending_markers_.append((self.bytes_received_, the_previous_rate, the_start_time))
+
+    def _place_markers_(self, the_offsets, the_samples):
+        """
+        This is a utility method that places the markers recorded by _mark_position_ that the parser has got to.  The
+        samples of the units of the block (complex samples or Vita49 packets) starting before the bytes received when
+        the change was confirmed came before it, the bytes skipped and the packet overhead are not samples.
+
+        NOTE:
+            Called before the samples of the block are added to samples_produced_.
+
+        :param the_offsets: numpy array, the position in the data stream of the first byte of each unit of the block
+        :param the_samples: numpy array, the samples produced by the block up to the end of each unit
+        """
+        while self.pending_markers_ and self.pending_markers_[0][0] <= self.bytes_parsed_:
+            the_bytes, the_previous_rate, the_start_time = self.pending_markers_.popleft()
+
+            the_units    = int(numpy.searchsorted(the_offsets, the_bytes))
+            the_position = self.samples_produced_ + (int(the_samples[the_units - 1]) if the_units > 0 else 0)
+
+            self.retune_markers_.append((the_position, the_previous_rate))
+
+            if the_start_time is not None:
+                #
+                # The data restarts at the start time, so the samples are timed from there.  The RxStat sample count
+                # starts again from 0 when the data is turned on.
+                #
+                self.sample_clock_.set_sample_rate(self.sample_rate(), the_position)
+                self.sample_clock_.anchor(the_position, the_start_time)
+                self.run_origin_ = the_position
+
+    def cancel_timed_start(self):
+        """
+        Use this method to have the data start as soon as it is turned on again, undoing arm_start.
 
         :return:
-            TxStatus: an object representing the tx status
+            == True,  StartMode is Immediate
+            == False, the device refused the request
+        """
+        try:
+            self.transact(Transaction().set("rx", {"startMode": "Immediate"}))
 
-        :raises NotImplementedError: Unable to communicate to Device Controller
+        except RuntimeError as the_error:
+            self.logger_.error("Unable to cancel the timed start, because {}.".format(str(the_error)))
+            return False
+
+        return True
+
+    def _samples_in_bytes_(self, the_bytes):
         """
-        self.logger_.debug("ENTER")
+        This is a utility method that returns the number of complex samples carried by the_bytes of the data stream.
+        """
+        if self.output_format() == VITA49OutputFormat:
+            return (the_bytes / self._block_unit_size_) * (self._vita49_expected_shorts_ / 2)
 
-        raise NotImplementedError("TX statusing is not available yet.")
-        self.logger_.debug("LEAVE")
+        return the_bytes / 4
 
-    def query_gps(self):
+    def _observe_rx_stat_(self, the_time):
+        """
+        This is a utility method that gives the sample count RxStat reported to the sample clock, while the data is
+        flowing.
+
+        :param the_time: The host time the RxStat values were received
+        """
+        the_sample = self.rx_stat_.samplee()
+
+        if self.streaming_ and the_sample >= 0:
+            self.sample_clock_.observe(self.run_origin_ + the_sample, the_time, STATUSClockReference)
+
+    def block_time(self, the_samples, the_arrival):
+        """
+        Use this method as each block of complex samples is pushed, in stream order and before advance_samples, to
+        obtain the time of its first sample from the sample clock rather than the time it was read.  The arrival of
+        the block is also given to the sample clock, it is used when there is no better reference.
+
+        :param the_samples: The number of complex samples in the block
+        :param the_arrival: The host time the block was read, time.time()
+
+        :return:
+            == None, the time is not known yet
+            != None, UTC time, in seconds since the epoch, of the first sample of the block
+        """
+        the_first = self.samples_pushed_
+
+        if self.sample_rate() > 0:
+            self.sample_clock_.set_sample_rate(self.sample_rate(), the_first)
+
+        self.sample_clock_.observe(the_first + the_samples, the_arrival, ARRIVALClockReference)
+
+        return self.sample_clock_.time_of(the_first)
+
+    def advance_samples(self, the_samples):
+        """
+        Use this method as each block of data is pushed, in stream order, to find where a live retune takes effect.
+
+        :param the_samples: The number of complex samples in the block
+
+        :return:
+            == None, no retune took effect in the block
+            != None, tuple of the index in the block of the first sample received after the retune was confirmed,
+                     and the sample rate of the samples before it.
+        """
+        the_start = self.samples_pushed_
+        self.samples_pushed_ += the_samples
+
+        the_result = None
+
+        while self.retune_markers_ and self.retune_markers_[0][0] < self.samples_pushed_:
+            the_position, the_previous_rate = self.retune_markers_.popleft()
+
+            if the_result is None:
+                the_result = (max(0, the_position - the_start), the_previous_rate)
+
+        return the_result
+
+    def refresh_status(self, the_ttls):
+        """
+        Use this method to refresh the cached status groups that have expired.  The groups whose values are older
+        than their time to live are queried in a single GET, the others are left as they are.  This is what keeps
+        the values returned by rxstatus(), gps() and master() current, see StatusPoller.
+
+        Notes:
+          When the GPS position changes the SRI is flagged as changed, so the GEOLOCATION_GPS keywords are pushed
+          again, see sri_changed.
+
+        :param the_ttls: map of group name to the number of seconds its values stay valid, 0 is never refreshed
+
+        :return:
+            list of the groups queried whose values changed
+
+        :raises RuntimeError: Unable to communicate with Device Controller, or the request was refused
+        """
+        the_due = []
+
+        for the_group, the_ttl in sorted(the_ttls.items()):
+            the_age = self.status_age(the_group)
+
+            if the_ttl > 0 and (the_age is None or the_age >= the_ttl):
+                the_due.append(the_group)
+
+        if not the_due:
+            return []
+
+        the_before   = dict((the_group, dict(self.shadow_.get(the_group, {}))) for the_group in the_due)
+        the_position = self._gps_position_()
+
+        self.transact(Transaction().get(*the_due))
+
+        the_changed = [the_group for the_group in the_due if self.shadow_.get(the_group, {}) != the_before[the_group]]
+
+        if "gps" in the_changed and self._gps_position_() != the_position:
+            self.sri_change_flag_ = True
+
+        return the_changed
+
+    def _gps_position_(self):
+        return self.gps_.lat(), self.gps_.long(), self.gps_.alt()
+
+    def connection_lost(self):
+        """
+        Use this method to find out if the connection to the device controller has been lost, the control socket
+        failed or, while the data is on, the data socket was closed by the daemon.
+
+        :return:
+            == True,  reconnect is needed
+            == False, the connections are up
+        """
+        if self.control_socket_ is None:
+            return True
+
+        return self.streaming_ and self.read_data_ and (self.data_socket_ is None or self.data_lost_)
+
+    def reconnect(self):
         """
+        Use this method to rebuild the connection to the device controller, after the daemon was restarted for
+        instance.  Both sockets are connected again, the RX/RXDATA settings last confirmed are restored, and when the
+        data was on it is turned on again.
+
+        Notes:
+          A timed start (see arm_start) is not restored, the data starts straight away.
 
         :return:
+            N/A
+
+        :raises RuntimeError: Unable to reconnect, or the daemon refused the settings
         """
         self.logger_.debug("ENTER")
 
-        self.connect_control()
+        with self.control_lock_:
+            self.disconnect_control()
+
+        self.disconnect_data()
+
+        the_restore = Transaction()
+
+        for the_group in ("rx", "rxdata"):
+            the_values = dict((the_name, the_value) for the_name, the_value in self.settings_.get(the_group, {}).items()
+                              if the_name not in self._transient_settings_)
+
+            if the_values:
+                the_restore.set(the_group, the_values)
+
+        if "startMode" in self.settings_.get("rx", {}):
+            the_restore.set("rx", {"startMode": "Immediate"})
+
+        the_restore.set("rxdata", {"conEnable": False, "run": False})
+
+        self.transact(the_restore)
+
+        if self.streaming_ and not self.enable():
+            self.logger_.debug("LEAVE")
+            raise RuntimeError("Unable to turn the data on again")
 
         #
-        # Tell device to create data socket
+        # The data starts a new stream, so the SRI goes out again.
         #
-        the_request = ["get", ["gps"]]
+        self.sri_change_flag_ = True
 
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("data <{}>".format(data))
+        self.logger_.debug("LEAVE")
 
-        if valid:
-            self.gps_.update(data)
-        else:
-            self.logger_.debug("LEAVE")
-            raise RuntimeError("Daemon refused status request.")
+    def delete_tune(self):
+        self.logger_.debug("ENTER")
+
+        #
+        # FIXME: Not sure what I should do here
+        #
 
         self.logger_.debug("LEAVE")
-        return self.gps_
+        return True
 
-    def query_master(self):
+    def query_rx(self):
         """
-        Use this method to make a request to the AVS4000 for the vale of the MASTER group.
+        Use this method to make a request to the Device Controller for the current rx information, see transact.
 
         :return:
+           RX: an object representing the rx information
+
+        :raises RunTimeError: Unable to communciate with Device Controller
         """
-        self.logger_.debug("ENTER")
+        return self.transact(Transaction().get("rx"))["rx"]
 
-        self.connect_control()
+    def query_rxstat(self):
+        """
+        Use this method to make a request to the Device Controller for the current rxstatus information, see
+        transact.
 
-        #
-        # Tell device to create data socket
-        #
-        the_request = ["get", ["master"]]
+        :return:
+           RxStatus: an object representing the rxstat status
 
-        valid, data = self.send_command(the_request)
-        self.logger_.debug("data <{}>".format(data))
+        :raises RunTimeError: Unable to communicate to Device Controller
+        """
+        return self.transact(Transaction().get("rxstat"))["rxstat"]
 
-        if valid:
-            self.master_.update(data)
-        else:
-            self.logger_.debug("LEAVE")
-            raise RuntimeError("Daemon refused status request.")
+    def query_txstatus(self):
+        """
+        Use this method to make a request to the Device Controller for the current txstatus information.
+
+        :return:
+            TxStatus: an object representing the tx status
+
+        :raises NotImplementedError: Unable to communicate to Device Controller
+        """
+        self.logger_.debug("ENTER")
 
+        raise NotImplementedError("TX statusing is not available yet.")
         self.logger_.debug("LEAVE")
-        return self.master_
+
+    def query_gps(self):
+        """
+        Use this method to make a request to the Device Controller for the current gps information, see transact.
+
+        :return:
+           GPS: an object representing the gps information
+
+        :raises RunTimeError: Unable to communicate to Device Controller
+        """
+        return self.transact(Transaction().get("gps"))["gps"]
+
+    def query_master(self):
+        """
+        Use this method to make a request to the AVS4000 for the vale of the MASTER group, see transact.
+
+        :return:
+           Master: an object representing the master information
+
+        :raises RunTimeError: Unable to communicate to Device Controller
+        """
+        return self.transact(Transaction().get("master"))["master"]
+
+    def query_status(self):
+        """
+        Use this method to refresh the RX, RXSTAT, GPS and MASTER groups at once, see query_snapshot.
+
+        :return:
+            Tuple of the RX, RxStat, GPS and Master objects
+
+        :raises RunTimeError: Unable to communicate with Device Controller
+        """
+        the_snapshot = self.transact(Transaction().get("rx", "rxstat", "gps", "master"))
+
+        return the_snapshot["rx"], the_snapshot["rxstat"], the_snapshot["gps"], the_snapshot["master"]
+
+    def query_snapshot(self):
+        """
+        Use this method to refresh every group that can be queried with a single GET request, so the values are
+        consistent with each other.
+
+        :return:
+            map of group name ("rx", "rxdata", "rxstat", "gps", "master") to RX, RxData, RxStat, GPS and Master
+            objects
+
+        :raises RunTimeError: Unable to communicate with Device Controller
+        """
+        return self.transact(Transaction().get("rx", "rxdata", "rxstat", "gps", "master"))
 
 
 
@@ -2298,725 +3553,3686 @@ class DeviceController:
         This method will pull data from the data socket, and return a complex data as a list of two unsigned shorts.
         It is assumed that the Device Controller is configured to provide just complext data.
 
+        Notes:
+          When the payload mode is NUMPYPayloadMode, the result is a NumPy int16 array that views data_buffer_,
+          it is only valid until the next call.  Use the_array.reshape(-1, 2) to obtain the I/Q pairs.
+
         :return:
             == None, no data
-            != None, a list of unsigned short
+            != None, a list of signed short, or a NumPy int16 array (see payload_mode)
         """
 
         self.logger_.debug("ENTER")
 
-        current_view = memoryview(self.complex_buffer_)
-
-        toread = len(self.complex_buffer_)
-
         self.logger_.debug("waiting for lock")
         with self.data_lock_:
-            if self.data_socket_ is not None:
-                while toread > 0:
-                    try:
-                        self.logger_.debug("waiting for data")
-                        nbytes = self.data_socket_.recv_into(current_view, toread)
-                        self.logger_.debug("received nbytes <{}>".format(nbytes))
-
-                    except socket.error as the_error:
-                        self.logger_.debug("recieved <{}>".format(str(the_error)))
-                        self.logger_.debug("LEAVE")
-                        return None
-
-                    #
-                    # Added this in the instance when the data socket is closed by the device controller
-                    # because I called set "rxdata.conenable false" in a different thread.  This causes
-                    # the recv_into to return a 0.
-                    #
-                    if nbytes == 0:
-                        self.logger_.debug("LEAVE")
-                        return None
-
-                    current_view = current_view[nbytes:] # slicing views is cheap
-                    toread -= nbytes
-
-                #
-                # The following is used to unpack
-                #
-                #the_num_shorts = len(self.complex_buffer_) / 2
-                #the_list = struct.unpack('h' * the_num_shorts, self.complex_buffer_)
-
-                if self.rx_data_.useBE():
-                    self.logger_.debug("    unpacking using BE")
-                    the_list = struct.unpack(self._be_complex_unpack_str_, self.complex_buffer_)
-                else:
-                    self.logger_.debug("    unpacking using LE")
-                    the_list = struct.unpack(self._le_complex_unpack_str_, self.complex_buffer_)
-
+            if self.data_socket_ is None:
                 self.logger_.debug("LEAVE")
-                return the_list
+                return None
 
-            else:
+            the_buffer = self._data_buffer_()
+
+            if the_buffer is None or not self._receive_into_(the_buffer):
                 self.logger_.debug("LEAVE")
                 return None
 
-        self.logger_.debug("LEAVE")
-        return None
+            self.logger_.debug("LEAVE")
+            return self._convert_complex_(the_buffer)
 
-    def get_data_vita49(self):
+    def _data_buffer_(self):
         """
-        This method will pull data from the data socket, a series of Vita49DataPacket objects.
+        This is a utility method that returns the buffer used by the get_data_x methods, it is checked out of the
+        buffer pool once and kept until the block size changes.
 
-        Notes:
-          This method does not handle synchronizing to the Vita49 FAW it expects that byte 0 is the start of
-          the packet.  Therefore if there are any buffer overflows on the daemon, then no data will be returned.
+        NOTE:
+            The caller must hold the data_lock_.
 
         :return:
-            == None, no data
-            != None, A list of Vita49DataPackets objects
+            == None, no buffer available
+            != None, bytearray of _block_headroom_() + block_size() bytes
         """
-        self.logger_.debug("ENTER")
+        if self.data_buffer_ is not None and len(self.data_buffer_) != self._buffer_size_():
+            if self.read_buffer_ is self.data_buffer_:
+                self._reset_read_()
 
-        the_packet_list = []
+            self.release_buffer(self.data_buffer_)
+            self.data_buffer_  = None
+            self.vita49_carry_ = (0, 0)
 
-        current_view = memoryview(self.vita49_data_buffer_)
-        full_view    = current_view
+        if self.data_buffer_ is None:
+            self.data_buffer_ = self._buffer_pool_().acquire(0.10)
 
-        toread = len(self.vita49_data_buffer_)
+        return self.data_buffer_
 
-        self.logger_.debug("waiting for lock")
-        with self.data_lock_:
-            if self.data_socket_ is not None:
-                while toread > 0:
-                    try:
-                        self.logger_.debug("waiting for data")
-                        nbytes = self.data_socket_.recv_into( current_view, toread)
-                        self.logger_.debug("received nbytes <{}>".format(nbytes))
+    def _receive_into_(self, the_buffer, the_start=0, the_wait=True):
+        """
+        This is a utility method that will fill the_buffer from the data socket.
 
-                    except socket.error as the_error:
-                        self.logger_.debug("recieved <{}>".format(str(the_error)))
-                        self.logger_.debug("LEAVE")
-                        return None
+        If the socket times out part way through, the bytes received are kept (see Note 2 of the constructor) and
+        False is returned, calling again with the same buffer resumes where the previous call stopped.
 
-                    #
-                    # Added this in the instance when the data socket is closed by the device controller
-                    # because I called set "rxdata.conenable false" in a different thread.  This causes
-                    # the recv_into to return a 0.
-                    #
-                    if nbytes == 0:
-                        self.logger_.debug("read returned back 0 bytes, indicating data socket closed.")
-                        self.logger_.debug("LEAVE")
-                        return None
-
-                    current_view =  current_view[nbytes:] # slicing views is cheap
-                    toread -= nbytes
+        NOTE:
+            The caller must hold the data_lock_ and ensure that data_socket_ is not None.
 
-                #
-                # This loop will break the buffer up into separate packets based upon the
-                # information defined in the Vita49 module
-                #
-                # It will slice the associated memoryview on packet boundaries, then
-                # extract the VRL and VRT Header information and finally unpack the
-                # payload into signed 16bit values.
-                #
-                for index in range (0, len(self.vita49_data_buffer_)/Vita49.VRT_PACKET_SIZE):
-                    end = (index + 1) * Vita49.VRT_PACKET_SIZE
-                    value = index * Vita49.VRT_PACKET_SIZE
-                    if (value > 0):
-                        start = value
-                    else:
-                        start = 0
+        :param the_buffer: bytearray to fill
+        :param the_start:  offset of the first byte to fill, when not resuming a previous call
+        :param the_wait:   When False, a single non-blocking receive is made, taking only what is already waiting on
+                           the socket.
 
-                    self.logger_.debug("start <{}>, end <{}>".format(start,end))
-                    data =  full_view[start:end]
-                    self.logger_.debug("data length <{}> type <{}> ".format(len(data), data))
-                    self.logger_.debug("view is type <{}>".format( current_view))
+        :return:
+            == True,  buffer filled
+            == False, buffer not filled yet, socket timeout, socket error or socket closed.
+        """
+        if self.read_buffer_ is not the_buffer:
+            self.read_buffer_ = the_buffer
+            self.read_offset_ = the_start
 
-                    #
-                    # The following is used to unpack,
-                    #   vrl        = bytes[0 - 7]
-                    #   vrt header = bytes[8 - 28]
-                    #
-                    # self.vita49_data_buffer_[Vita49.VRL_OFFSET:Vita49.VRL_OFFSET + Vita49.VRL.SIZE],
-                    # self.vita49_data_buffer_[Vita49.VRT_OFFSET:Vita49.VRT_OFFSET + Vita49.VRT.HDR_SIZE],
-                    #
-                    the_vrl = Vita49.VRL\
-                        (
-                            data[Vita49.VRL_OFFSET:Vita49.VRL_OFFSET + Vita49.VRL.SIZE],
-                            Vita49.LITTLE_ENDIAN
-                        )
+        the_view  = memoryview(the_buffer)
+        the_size  = len(the_buffer)
+        the_flags = self.receive_flags_ if the_wait else socket.MSG_DONTWAIT
 
-                    the_vrt = Vita49.VRT\
-                        (
-                            data[Vita49.VRT_OFFSET:Vita49.VRT_OFFSET + Vita49.VRT.HDR_SIZE],
-                            Vita49.LITTLE_ENDIAN
-                        )
+        while self.read_offset_ < the_size:
+            try:
+                self.logger_.debug("waiting for data")
+                nbytes = self.data_socket_.recv_into\
+                    (
+                        the_view[self.read_offset_:],
+                        the_size - self.read_offset_,
+                        the_flags
+                    )
+                self.logger_.debug("received nbytes <{}>".format(nbytes))
+
+            except socket.timeout:
+                self.logger_.debug("timeout, <{}> of <{}> bytes".format(self.read_offset_, the_size))
+                return False
+
+            except socket.error as the_error:
+                #
+                # SO_RCVTIMEO expiring is reported as EAGAIN, when using bulk receive.
+                #
+                if the_error.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                    self.logger_.debug("timeout, <{}> of <{}> bytes".format(self.read_offset_, the_size))
+                    return False
 
-                    if the_vrl.faw() != Vita49.VRL.EXPECTED_FAW:
-                        self.logger_.debug("{} = {}".format(the_vrl.faw(), Vita49.VRL.EXPECTED_FAW))
-                        self.logger_.debug\
-                             (
-                                "Invalid faw <{0:#010x}>, VRL: \n<{1}>, \nEXPECTED <{2:#010x}>".format
-                                (
-                                    the_vrl.faw(),
-                                    the_vrl,
-                                    Vita49.VRL.EXPECTED_FAW
-                                )
-                            )
-                        self.logger_.debug("LEAVE")
-                        return None
-
-                    if the_vrt.packet_size() != Vita49.VRT.EXPECTED_PACKET_SIZE:
-                        self.logger_.debug("Invalid packet_size, VRL: <{}>".format(the_vrt))
-                        self.logger_.debug("LEAVE")
-                        return None
+                self.logger_.debug("recieved <{}>".format(str(the_error)))
+                self.data_lost_   = True
+                self.read_buffer_ = None
+                self.read_offset_ = 0
+                return False
 
-                    #
-                    # Convert the buffer to unsigned short 16 Complex data, starting at 28 bytes from beginning of the
-                    # buffer.
-                    #  the_num_shorts should always be 4090.
-                    #  the_buffer_end is where payload stops and VEND begins.
-                    #
-                    #  Need to set the end of the buffer based upon that number otherwise the unpack will complain.
-                    #
-                    the_num_shorts = the_vrt.number_payload_words() * 2
-                    the_buffer_end = Vita49.VRT_PAYLOAD_OFFSET + (the_vrt.number_payload_words() * 4)
-
-                    if (the_num_shorts != self._vita49_expected_shorts_):
-                        self.logger_.debug\
-                            (
-                                "packet_size <{}>, buffer size <{}>, the_num_shorts <{}>".format
-                                (
-                                    the_vrt.number_payload_words(),
-                                    len(self.vita49_data_buffer_[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]),
-                                    the_num_shorts
-                                )
-                            )
-                    #self.vita49_data_buffer_[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]
-                    the_tuple = struct.unpack\
-                        (
-                            self._le_vita49_payload_unpack_str_,
-                            data[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]
-                        )
+            #
+            # Added this in the instance when the data socket is closed by the device controller
+            # because I called set "rxdata.conenable false" in a different thread.  This causes
+            # the recv_into to return a 0.
+            #
+            if nbytes == 0:
+                self.logger_.debug("read returned back 0 bytes, indicating data socket closed.")
+                self.data_lost_   = True
+                self.read_buffer_ = None
+                self.read_offset_ = 0
+                return False
 
-                    the_packet = Vita49.Vita49DataPacket(the_vrl, the_vrt, the_tuple)
-                    the_packet_list.append(the_packet)
+            self.read_offset_    += nbytes
+            self.bytes_received_ += nbytes
 
-                self.logger_.debug("good data")
-                self.logger_.debug("LEAVE")
-                return the_packet_list
+            if not the_wait and self.read_offset_ < the_size:
+                self.logger_.debug("no wait, <{}> of <{}> bytes".format(self.read_offset_, the_size))
+                return False
 
-            else:
-                self.logger_.debug("data_socket_ == None")
-                self.logger_.debug("LEAVE")
-                return None
+        self.read_buffer_ = None
+        self.read_offset_ = 0
 
-        #
-        # Here for completeness
-        #
-        self.logger_.debug("while loop failed.")
-        self.logger_.debug("LEAVE")
-        return None
+        return True
 
-    def get_data_vita49_single_timestamp(self):
+    def _convert_complex_(self, the_buffer):
         """
-        This method will pull data from the data socket and encapsulate it into a list of Vita49DataPacket object.
-        Currently this list has only one element.  This is being done to keep the return API the same as
-        get_data_vita49. Additionally this will combine the payload of multiple Vita49.0/1 packets together with
-        the first VRT,VRL being returned.
+        This is a utility method that converts a buffer of complex samples, read from the data socket, into the
+        samples returned to the caller.
 
-        Notes:
-          This method does not handle synchronizing to the Vita49 FAW it expects that byte 0 is the start of
-          the packet.  Therefore if there are any buffer overflows on the daemon, then no data will be returned.
+        :param the_buffer: bytearray holding the signed 16bit I and Q values
 
         :return:
-            == None, no data
-            != None, A list of Vita49DataPackets objects (1 element in size)
+            A list of signed short, or a NumPy int16 array viewing the_buffer (see payload_mode)
         """
-        self.logger_.debug("ENTER")
+        #
+        # View the buffer as signed 16bit values, Big Endian samples are swapped in place so the
+        # array is always in the native byte order.
+        #
+        if self.rx_data_.useBE():
+            the_array = numpy.frombuffer(the_buffer, dtype=self._be_sample_dtype_)
+        else:
+            the_array = numpy.frombuffer(the_buffer, dtype=self._le_sample_dtype_)
 
-        the_packet_list = []
+        if not the_array.dtype.isnative:
+            self.logger_.debug("    swapping to native byte order")
+            the_array = the_array.byteswap(True).view(the_array.dtype.newbyteorder())
 
-        current_view = memoryview(self.vita49_data_buffer_)
-        full_view = current_view
+        the_start          = self.bytes_parsed_
+        the_count          = len(the_array) / 2
+        self.bytes_parsed_ += len(the_buffer)
 
-        toread = len(self.vita49_data_buffer_)
+        if self.pending_markers_:
+            self._place_markers_(the_start + 4 * numpy.arange(the_count), numpy.arange(1, the_count + 1))
 
-        self.logger_.debug("waiting for lock")
-        with self.data_lock_:
-            if self.data_socket_ is not None:
-                the_packet = None
-                while toread > 0:
-                    try:
-                        self.logger_.debug("waiting for data")
-                        nbytes = self.data_socket_.recv_into(current_view, toread)
-                        self.logger_.debug("received nbytes <{}>".format(nbytes))
+        self.samples_produced_ += the_count
 
-                    except socket.error as the_error:
-                        self.logger_.debug("recieved <{}>".format(str(the_error)))
-                        self.logger_.debug("LEAVE")
-                        return None
+        if self.payload_mode_ == NUMPYPayloadMode:
+            return the_array
 
-                    #
-                    # Added this in the instance when the data socket is closed by the device controller
-                    # because I called set "rxdata.conenable false" in a different thread.  This causes
-                    # the recv_into to return a 0.
-                    #
-                    if nbytes == 0:
-                        self.logger_.debug("Read returned back 0 bytes, indicating data socket closed.")
-                        self.logger_.debug("LEAVE")
-                        return None
+        return the_array.tolist()
 
-                    current_view = current_view[nbytes:]  # slicing views is cheap
-                    toread -= nbytes
+    def _receive_vita49_data_(self):
+        """
+        This is a utility method that will fill data_buffer_ from the data socket.  Any bytes kept from the
+        previous read (see vita49_carry_) are moved into the headroom of the buffer first, just before the data, see
+        Note 5 of the constructor.
 
-                #
-                # This loop will break the buffer up into seperate packets based upon the
-                # information defined in the Vita49 module
-                #
-                # It will slice the associated memoryview on packet boundaries, then
-                # extract the VRL and VRT Header inforamtion and finally unpack the
-                # payload into signed 16bit values.
-                #
-                for index in range(0, len(self.vita49_data_buffer_) / Vita49.VRT_PACKET_SIZE):
-                    end = (index + 1) * Vita49.VRT_PACKET_SIZE
-                    value = index * Vita49.VRT_PACKET_SIZE
-                    if (value > 0):
-                        start = value
-                    else:
-                        start = 0
+        NOTE:
+            The caller must hold the data_lock_ and ensure that data_socket_ is not None.
 
-                    self.logger_.debug("start <{}>, end <{}>".format(start, end))
-                    data = full_view[start:end]
-                    self.logger_.debug("data length <{}> type <{}> ".format(len(data), data))
-                    self.logger_.debug("view is type <{}>".format(current_view))
+        :return:
+            == None, unable to fill the buffer, no buffer available, socket error or socket closed.
+            != None, the buffer filled, the stream starts at vita49_first_
+        """
+        self.logger_.debug("ENTER")
 
-                    #
-                    # The following is used to unpack,
-                    #   vrl        = bytes[0 - 7]
-                    #   vrt header = bytes[8 - 28]
-                    #
-                    # self.vita49_data_buffer_[Vita49.VRL_OFFSET:Vita49.VRL_OFFSET + Vita49.VRL.SIZE],
-                    # self.vita49_data_buffer_[Vita49.VRT_OFFSET:Vita49.VRT_OFFSET + Vita49.VRT.HDR_SIZE],
-                    #
-                    the_vrl = Vita49.VRL \
-                            (
-                            data[Vita49.VRL_OFFSET:Vita49.VRL_OFFSET + Vita49.VRL.SIZE],
-                            Vita49.LITTLE_ENDIAN
-                        )
+        the_buffer = self._data_buffer_()
 
-                    the_vrt = Vita49.VRT \
-                            (
-                            data[Vita49.VRT_OFFSET:Vita49.VRT_OFFSET + Vita49.VRT.HDR_SIZE],
-                            Vita49.LITTLE_ENDIAN
-                        )
+        if the_buffer is None:
+            self.logger_.debug("LEAVE")
+            return None
 
-                    if the_vrl.faw() != Vita49.VRL.EXPECTED_FAW:
-                        self.logger_.debug("{} = {}".format(the_vrl.faw(), Vita49.VRL.EXPECTED_FAW))
-                        self.logger_.debug \
-                                (
-                                "invalid faw <{0:#010x}>, VRL: \n<{1}>, \nEXPECTED <{2:#010x}>".format
-                                    (
-                                    the_vrl.faw(),
-                                    the_vrl,
-                                    Vita49.VRL.EXPECTED_FAW
-                                )
-                            )
-                        self.logger_.debug("LEAVE")
-                        return None
-
-                    if the_vrt.packet_size() != Vita49.VRT.EXPECTED_PACKET_SIZE:
-                        self.logger_.debug("invalid packet_size, VRL: <{}>".format(the_vrt))
-                        self.logger_.debug("LEAVE")
-                        return None
+        the_start, the_end = self.vita49_carry_
+        the_headroom       = self._block_headroom_()
 
-                    #
-                    # Convert the buffer to unsigned short 16 Complex data, starting at 28 bytes from beginning of the
-                    # buffer.
-                    #  the_num_shorts should always be 4090.
-                    #  the_buffer_end is where payload stops and VEND begins.
-                    #
-                    #  Need to set the end of the buffer based upon that number otherwise the unpack will complain.
-                    #
-                    the_num_shorts = the_vrt.number_payload_words() * 2
-                    the_buffer_end = Vita49.VRT_PAYLOAD_OFFSET + (the_vrt.number_payload_words() * 4)
-
-                    if (the_num_shorts != self._vita49_expected_shorts_):
-                        self.logger_.debug \
-                                (
-                                "packet_size <{}>, buffer size <{}>, the_num_shorts <{}>".format
-                                    (
-                                    the_vrt.number_payload_words(),
-                                    len(self.vita49_data_buffer_[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]),
-                                    the_num_shorts
-                                )
-                            )
-                    # self.vita49_data_buffer_[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]
-                    the_tuple = struct.unpack \
-                            (
-                            self._le_vita49_payload_unpack_str_,
-                            data.tobytes()[Vita49.VRT_PAYLOAD_OFFSET:the_buffer_end]
-                        )
+        #
+        # Only a new read starts with the bytes kept, a resumed read already has them before the data.
+        #
+        if self.read_buffer_ is not the_buffer:
+            self.vita49_first_ = the_headroom - (the_end - the_start)
 
-                    if the_packet == None:
-                        the_packet = Vita49.Vita49DataPacket(the_vrl, the_vrt, the_tuple)
-                    else:
-                        the_packet.extend(the_tuple)
+            if the_end > the_start:
+                the_buffer[self.vita49_first_:the_headroom] = the_buffer[the_start:the_end]
 
-                self.logger_.debug("good data")
-                self.logger_.debug("LEAVE")
-                return [the_packet]
+        self.vita49_carry_ = (0, 0)
 
-            else:
-                self.logger_.debug("data_socket_ == None")
-                self.logger_.debug("LEAVE")
-                return None
+        if not self._receive_into_(the_buffer, the_headroom):
+            self.logger_.debug("LEAVE")
+            return None
 
-        #
-        # Here for completeness
-        #
-        self.logger_.debug("while loop failed.")
         self.logger_.debug("LEAVE")
-        return None
+        return the_buffer
 
-    def get_data_vita49_raw(self):
+    def get_data_vita49_block(self):
         """
-        This method will pull data from the data socket, and return raw Vita49.0/1 packets without parsing or otherwise
-        inspecting the information.
+        This method will pull data from the data socket, and decode the VRL, VRT Header and VEND of every packet
+        read in one vectorized pass.
 
         Notes:
-          This method does not handle synchronizing to the Vita49 FAW it expects that byte 0 is the start of
-          the packet.  Therefore if there are any buffer overflows on the daemon, then no data will be returned.
+          The buffer is scanned for the Vita49 FAW, so the stream does not need to start on a packet boundary.  Bytes
+          that are not part of a valid packet are skipped (see vita49_bytes_skipped), and a trailing partial packet
+          is kept and completed by the next read.
+
+          The block is a view of data_buffer_, it is only valid until the next get_data_vita49 call.
 
         :return:
             == None, no data
-            != None, A string containing one or more Vita49 packets.
+            != None, A Vita49.Vita49PacketBlock object
         """
         self.logger_.debug("ENTER")
 
-        view = memoryview(self.vita49_packet_buffer_)
-
-        toread = len(self.vita49_packet_buffer_)
-
         self.logger_.debug("waiting for lock")
         with self.data_lock_:
-            if self.data_socket_ is not None:
-                while toread > 0:
-                    try:
-                        self.logger_.debug("waiting for data")
-                        nbytes = self.data_socket_.recv_into(view, toread)
-                        self.logger_.debug("received nbytes <{}>".format(nbytes))
+            if self.data_socket_ is None:
+                self.logger_.debug("data_socket_ == None")
+                self.logger_.debug("LEAVE")
+                return None
 
-                    except socket.error as the_error:
-                        self.logger_.debug("recieved <{}>".format(str(the_error)))
-                        self.logger_.debug("LEAVE")
-                        return None, None
+            the_buffer = self._receive_vita49_data_()
 
-                    #
-                    # Added this in the instance when the data socket is closed by the device controller
-                    # because I called set "rxdata.conenable false" in a different thread.  This causes
-                    # the recv_into to return a 0.
-                    #
-                    if nbytes == 0:
-                        self.logger_.debug("read returned back 0 bytes, indicating data socket closed.")
-                        self.logger_.debug("LEAVE")
-                        return None, None
+            if the_buffer is None:
+                self.logger_.debug("LEAVE")
+                return None
 
-                    view = view[nbytes:] # slicing views is cheap
-                    toread -= nbytes
+            the_stream = numpy.frombuffer(the_buffer, dtype=numpy.uint8)[self.vita49_first_:]
 
-                self.logger_.debug("good data")
-                self.logger_.debug("LEAVE")
-                return None, self.vita49_packet_buffer_
+            the_block, the_keep = self._synchronize_vita49_(the_stream)
 
-            else:
-                self.logger_.debug("data_socket_ == None")
+            self.vita49_carry_ = (self.vita49_first_ + the_keep, len(the_buffer))
+
+            if the_block is None:
+                self.logger_.debug("no valid packets")
                 self.logger_.debug("LEAVE")
-                return None, None
+                return None
 
-        #
-        # Here for completeness
-        #
-        self.logger_.debug("while loop failed.")
+        self.logger_.debug("good data")
         self.logger_.debug("LEAVE")
-        return None, None
+        return the_block
 
-    """
-    Quick element accessor methods
-    """
-    def data_port(self):
+    def _synchronize_vita49_(self, the_buffer):
         """
-        Accessor method, that returns the value of the data port associated with this Device Controller
+        This is a utility method that locates the valid Vita49 packets in the_buffer.
+
+        :param the_buffer: bytearray holding the data read from the data socket
 
         :return:
-          integer representing the data port
+            Tuple of two elements:
+                Item 1:
+                    == None, no valid packets
+                    != None, A Vita49.Vita49PacketBlock object
+                Item 2:
+                    The offset of the first byte that has to be kept for the next read
         """
-        return(self.data_port_)
+        the_resync_events = self.vita49_synchronizer_.resync_events()
 
-    def allocation_id(self):
-        """
-        Accessor method, that returns the allocation id associated with this Device Controller
+        the_offsets, the_keep = self.vita49_synchronizer_.find_packets(the_buffer)
 
-        :return:
-           A string representing the allocation id
-        """
-        return(self.allocation_id_)
+        if self.vita49_synchronizer_.resync_events() != the_resync_events:
+            self.logger_.warning\
+                (
+                    "Lost synchronization with the Vita49 stream, resync events <{}>, bytes skipped <{}>".format
+                    (
+                        self.vita49_synchronizer_.resync_events(),
+                        self.vita49_synchronizer_.bytes_skipped()
+                    )
+                )
 
-    def stream_id(self):
-        """
-        Accessor method, that returns the current stream id associated with this Device Controller
+        the_block = self.vita49_synchronizer_.packet_block(the_buffer, the_offsets)
 
-        :return:
-            A string representing the current stream id.
-        """
-        return self.stream_id_
+        self.vita49_packet_bytes_  = self.bytes_parsed_ + the_offsets
+        self.bytes_parsed_        += the_keep
 
-    def center_frequency(self):
+        if the_block is not None and not self.first_packet_seen_:
+            self.first_packet_seen_ = True
+
+            #
+            # Only a time related to UTC can be compared with the start, the TSI of a GPS stream is converted
+            #
+            the_timestamps = self._block_timestamps_(the_block)
+
+            if the_timestamps is not None and the_timestamps.valid()[0]:
+                self.first_timestamp_ = int(the_timestamps.integer_seconds()[0])
+
+        return the_block, the_keep
+
+    def timestamp_sample_rate(self):
         """
-        Accessor method, that returns the current center frequency associated with this Device Controller
-        This is the value that was sent via tune
+        Accessor method, that returns the rate the Vita49 sample count timestamps are counted at, the
+        Master.realSampleRate, or the Master.sampleRate when the real rate has not been reported.
 
         :return:
-            The integer value of the center frequency sent to this Device Controller
+            == 0.0, the Master group has not been queried
+            >  0.0, the sample rate in Hz
         """
-        return self.rx_.freq()
+        the_rate = self.master_.realSampleRate()
 
-    def bandwidth(self):
-        """
-        Accessor method, that returns the current bandwidth associated with this Device Controller
+        if the_rate <= 0:
+            the_rate = self.master_.sampleRate()
 
-        Note:
-            Because the device produces complex data samples, the bandwidth will typically
-            equal the sample rate.
+        return float(the_rate)
 
-        :return:
-            The integer value of the bandwidth
+    def _block_timestamps_(self, the_block):
         """
-        return(self.rx_.sampleRate())
+        This is a utility method that decodes the timestamps of every packet of the_block, see
+        Vita49.Vita49PacketBlock.timestamps.
 
-    def sample_rate(self):
-        """
-        Accessor method, that returns the current sample rate associated with this Device Controller
+        :param the_block: Vita49.Vita49PacketBlock object
 
         :return:
-            The integer value of the sample rate
+            == None, the sample rate is not known yet
+            != None, Vita49.Vita49Timestamps object
         """
-        return(self.rx_.sampleRate())
+        try:
+            return the_block.timestamps(self.timestamp_sample_rate())
 
-    def output_format(self):
-        """
-        Accessor method, that returns the output_format of the Device Controller
+        except ValueError as the_error:
+            self.logger_.debug("No timestamps, because <{}>".format(the_error))
+            return None
 
-        :return:
-            COMPLEXOutputFormat: data_port will be producing signed 16bit complex data
-            VITA49OutputFormat:  data port will be producing Vita49.0/1 packets
+    def _inspect_block_(self, the_block):
         """
+        This is a utility method that decodes the timestamps of the_block and checks its continuity with the block
+        before it, see Vita49.Vita49ContinuityTracker.
 
-        the_format = COMPLEXOutputFormat
-
-        if self.rx_data_.useV49():
-            the_format = VITA49OutputFormat
+        :param the_block: Vita49.Vita49PacketBlock object
 
-        return the_format
-    
-    def loglevel(self):
-        """
-        Accessor method, that returns the current loglevel set for the Device Controller
         :return:
-            the logging level specified by the constructor, or set_log_level
+            Tuple of two elements:
+                Item 1:
+                    == None, the sample rate is not known yet
+                    != None, Vita49.Vita49Timestamps object
+                Item 2:
+                    numpy array of int64, the number of packets missing before each packet of the_block
         """
-        return self.logger_.getEffectiveLevel()
+        the_timestamps = self._block_timestamps_(the_block)
+        the_missing    = self.continuity_.update(the_block, the_timestamps)
 
-    def read_data_flag(self):
-        """
-        Accessor method, that returns whether or not this device controller should be performing the network
-        reads on the data socket.  When true data must be consumed using one of the get_data_x methods depending upon
-        the output_format specified.
+        if the_missing.any():
+            self.logger_.warning\
+                (
+                    "Missing <{}> packets of stream <{}>, <{}> dropped so far".format
+                    (
+                        int(the_missing.sum()), self.stream_id(), self.continuity_.dropped_packets()
+                    )
+                )
 
-        :return:
-            == True, then need to call get_data_x to obtain data based upon output_format
-            == False, Some other application/thread is reading the data from the data_port
-        """
-        return self.read_data_
+        return the_timestamps, the_missing
 
-    def sri_changed(self):
+    def _gap_samples_(self, the_timestamps, the_missing):
         """
-        Accessor method, that returns whether or not the signal related information has changed since the last call
-        to this method.
+        This is a utility method that returns the number of complex samples missing before each packet of a block.
+        When the timestamps of a packet and the one before it are valid, the number comes from the time between them,
+        which also finds a restart of the stream (timed start) and gaps too long for the frame count.  Otherwise it
+        comes from the packets missing from the frame count.
 
-        Notes:
-            - This method returns the current value, and resets the internal state to False.
-            - The set_tune method will set the internal state to True.
+        :param the_timestamps: Vita49.Vita49Timestamps of the block, or None
+        :param the_missing:    numpy array of the packets missing before each packet, see Vita49ContinuityTracker
 
-        :return:
-            == True, SRI has changed
-            == False, SRI has not changed.
+        :return: numpy array of int64, -1 where the time went backwards
         """
-        self.logger_.debug("ENTER")
+        the_samples_per_packet = Vita49.Vita49ContinuityTracker.SAMPLES_PER_PACKET
 
-        the_result = self.sri_change_flag_
-        self.sri_change_flag_ = False
+        the_gaps = the_missing * the_samples_per_packet
 
+        #
+        # The rate the timestamps were decoded with, see _block_timestamps_.
+        #
+        the_rate = self.timestamp_sample_rate()
 
-        self.logger_.debug("LEAVE")
-        return the_result
+        if the_timestamps is None or the_rate <= 0:
+            self.vita49_last_time_ = None
+            return the_gaps
 
-    def gps_geolocation_dictionary(self):
-        """
-        Accessor mehtod, that will return the gps information as a set of GEOLOCATION_GPS keywords
-        that are compatibalbe with REDHAWK.
+        the_seconds     = the_timestamps.integer_seconds()
+        the_picoseconds = the_timestamps.picoseconds()
+        the_valid       = the_timestamps.valid()
 
-        :return: Dictionary container GEOLOCATION_GPS keywords and values.
-        """
-        self.logger_.debug("ENTER")
-        the_gps_geolocation_struct = Vita49.GEOLOCATION_GPS_struct()
+        if self.vita49_last_time_ is None:
+            the_last_seconds, the_last_picoseconds, the_last_valid = the_seconds[0], the_picoseconds[0], False
+        else:
+            the_last_seconds, the_last_picoseconds, the_last_valid = self.vita49_last_time_ + (True,)
 
-        the_gps_geolocation_struct.config\
+        the_previous_valid = numpy.concatenate(([the_last_valid], the_valid[:-1])) & the_valid
+
+        the_elapsed = (the_seconds - numpy.concatenate(([the_last_seconds], the_seconds[:-1]))) \
+            * Vita49.PICOSECONDS_PER_SECOND \
+            + (the_picoseconds - numpy.concatenate(([the_last_picoseconds], the_picoseconds[:-1])))
+
+        #
+        # The device only drops whole packets, so the time is rounded to packets.
+        #
+        the_packets = numpy.round\
             (
-                time_seconds=self.gps_.time(),
-                latitude=self.gps_.lat(),
-                longitude=self.gps_.long(),
-                altitude=self.gps_.alt(),
-            )
+                the_elapsed * (the_rate / Vita49.PICOSECONDS_PER_SECOND) / the_samples_per_packet
+            ).astype(numpy.int64) - 1
 
-        self.logger_.debug("LEAVE")
-        return the_gps_geolocation_struct.to_dictionary()
+        the_time_gaps = numpy.where(the_packets < 0, -1, the_packets * the_samples_per_packet)
+        the_gaps      = numpy.where(the_previous_valid, the_time_gaps, the_gaps)
 
-    """
-    This set of methods are used to obtain the cached data without making a
-    request to the device
-    """
+        self.vita49_last_time_ = (the_seconds[-1], the_picoseconds[-1]) if the_valid[-1] else None
 
-    def master(self):
+        return the_gaps
+
+    def _aggregate_vita49_(self, the_block, the_reuse):
         """
-        Accessor method, that returns the cached value of the Master group data
+        This is a utility method that combines the payload of the packets of the_block, applying the gap policy
+        where samples are missing (see set_gap_policy):
 
-        NOTE:
-            Assumes that query_master has been performed.
+          IGNOREGapPolicy:   the payloads are joined as they are.
+          ZEROFILLGapPolicy: the missing samples are replaced by zeros.
+          HOLDLASTGapPolicy: the missing samples are replaced by the sample before them.
+          SPLITGapPolicy:    a new Vita49DataPacket, with its own timestamp, is started after each gap.
 
-        :return:
-            == None: query_master has not been called.
-            != None: Master object.
+        A gap longer than gap_fill_limit seconds, or where the time went backwards, is never filled, a new
+        Vita49DataPacket is started after it instead.
+
+        :param the_block: Vita49.Vita49PacketBlock object
+        :param the_reuse: True to combine the payload into vita49_payload_array_ when there is a single
+                          Vita49DataPacket, False to always allocate a new array.
+
+        :return: A list of Vita49DataPackets objects, in stream order
         """
-        return self.master_
+        the_timestamps, the_missing = self._inspect_block_(the_block)
 
+        the_payload = the_block.payload()
+        the_gaps    = self._gap_samples_(the_timestamps, the_missing)
+        the_count   = the_block.number_packets()
 
-    def rx(self):
-        return self.rx_
+        if self.gap_policy_ in (ZEROFILLGapPolicy, HOLDLASTGapPolicy):
+            the_limit    = int(self.gap_fill_limit_ * self.sample_rate())
+            the_fillable = (the_gaps > 0) & (the_gaps <= the_limit)
+        else:
+            the_fillable = numpy.zeros(the_count, dtype=bool)
 
-    def rxdata(self):
-        return self.rx_data_
+        if self.gap_policy_ == IGNOREGapPolicy:
+            the_breaks = numpy.zeros(the_count, dtype=bool)
+        else:
+            the_breaks = (the_gaps != 0) & ~the_fillable
 
-    def gps(self):
-        return self.gps_
+        the_breaks[0] = True
 
-    def rxstatus(self):
-        """
-        Accessor method, that returns the cached information obtained from a query_rxstatus request.
+        if self.pending_markers_:
+            the_sizes = numpy.where(the_fillable, the_gaps, 0) + the_payload.shape[1] / 2
+            self._place_markers_(self.vita49_packet_bytes_, numpy.cumsum(the_sizes))
 
-        :return:
-            None:      query_rxstatus never performed.
-            RxStatus : the cached results obtained from the query_rxstatus method.
+        the_starts = numpy.flatnonzero(the_breaks)
+        the_ends   = numpy.append(the_starts[1:], the_count)
+
+        the_packets = []
+
+        for the_start, the_end in zip(the_starts, the_ends):
+            the_fills = numpy.flatnonzero(the_fillable[the_start:the_end]) + the_start
+
+            if len(the_fills) == 0:
+                if the_reuse and len(the_starts) == 1 and self.payload_mode_ == NUMPYPayloadMode:
+                    the_samples = self._aggregate_payload_array_(the_count)
+                    the_samples.reshape(the_payload.shape)[:] = the_payload
+                else:
+                    the_samples = numpy.ascontiguousarray(the_payload[the_start:the_end]).ravel()
+            else:
+                the_pieces = []
+
+                for index in range(the_start, the_end):
+                    if the_fillable[index]:
+                        the_pieces.append(self._gap_fill_(the_gaps[index], the_payload, index))
+
+                    the_pieces.append(the_payload[index])
+
+                the_samples = numpy.concatenate(the_pieces)
+
+                self.gaps_concealed_    += len(the_fills)
+                self.samples_concealed_ += int(the_gaps[the_fills].sum())
+
+            the_gap = 0
+
+            if self.gap_policy_ != IGNOREGapPolicy and not the_fillable[the_start]:
+                the_gap = int(the_gaps[the_start])
+
+            if the_gap != 0:
+                self.blocks_split_ += 1
+
+            the_packets.append\
+                (
+                    Vita49.Vita49DataPacket
+                        (
+                            the_block.vrl(the_start),
+                            the_block.vrt(the_start),
+                            the_samples if self.payload_mode_ == NUMPYPayloadMode else the_samples.tolist(),
+                            the_timestamps[the_start:the_end] if the_timestamps is not None else None,
+                            the_gap,
+                            int(the_gaps[the_start]) if the_fillable[the_start] else 0
+                        )
+                )
+
+            self.samples_produced_ += len(the_samples) / 2
+
+        self.vita49_last_sample_ = the_payload[-1, -2:].copy()
+
+        return the_packets
+
+    def _gap_fill_(self, the_samples, the_payload, the_index):
         """
-        return self.rx_stat_
+        This is a utility method that returns the interleaved I/Q values concealing the_samples complex samples
+        missing before packet the_index of the_payload.
+        """
+        if self.gap_policy_ == ZEROFILLGapPolicy:
+            return numpy.zeros(2 * the_samples, dtype=numpy.int16)
 
-    def txstatus(self):
+        if the_index > 0:
+            the_last = the_payload[the_index - 1, -2:]
+        elif self.vita49_last_sample_ is not None:
+            the_last = self.vita49_last_sample_
+        else:
+            the_last = numpy.zeros(2, dtype=numpy.int16)
+
+        return numpy.tile(the_last, the_samples)
+
+    def get_data_vita49(self):
         """
-        Accessor method, that returns the cached information obtained from a query_txstatus request.
+        This method will pull data from the data socket, a series of Vita49DataPacket objects.
+
+        Notes:
+          Only the valid packets are returned, see get_data_vita49_block for how the stream is synchronized.
 
         :return:
-            None:      query_rxstatus never performed.
-            TxStatus : the cached results obtained from the query_rxstatus method.
+            == None, no data
+            != None, A list of Vita49DataPackets objects
         """
-        return self.tx_status_
+        self.logger_.debug("ENTER")
 
-    """
-    Mutator methods
-    """
-    def set_read_data_flag(self, the_value):
+        the_block = self.get_data_vita49_block()
+
+        if the_block is None:
+            self.logger_.debug("LEAVE")
+            return None
+
+        the_packet_list = []
+        the_payload     = the_block.payload()
+
+        the_timestamps, the_missing = self._inspect_block_(the_block)
+
+        for index in range(0, the_block.number_packets()):
+            if self.payload_mode_ == NUMPYPayloadMode:
+                the_packet_payload = the_payload[index]
+            else:
+                the_packet_payload = the_payload[index].tolist()
+
+            the_packet = Vita49.Vita49DataPacket\
+                (
+                    the_block.vrl(index),
+                    the_block.vrt(index),
+                    the_packet_payload,
+                    the_timestamps[index] if the_timestamps is not None else None
+                )
+            the_packet_list.append(the_packet)
+
+        if self.pending_markers_:
+            the_sizes = numpy.full(the_block.number_packets(), the_payload.shape[1] / 2, dtype=numpy.int64)
+            self._place_markers_(self.vita49_packet_bytes_, numpy.cumsum(the_sizes))
+
+        self.samples_produced_ += the_payload.size / 2
+
+        self.logger_.debug("LEAVE")
+        return the_packet_list
+
+    def _aggregate_payload_array_(self, the_number_packets):
         """
-        Mutator method, that is used to indicate to the device controller whether on not it should read from the TCP/IP
-        data port or not.
+        This is a utility method that returns the preallocated array used to aggregate the payload of
+        the_number_packets packets.  The array is only reallocated when the number of packets changes.
 
-            If set to True, then the data packets read from the data port may be obtained by
-            calling get_data_complex, get_data_vita49.
+        :param the_number_packets: The number of packets being aggregated
 
-            If set to False, then it is expected that some other process will be consuming data form the
-            data port.
+        :return: NumPy int16 array
+        """
+        the_size = the_number_packets * Vita49.VRT_PAYLOAD_SHORTS
 
-        :param the_value: Boolean
+        if self.vita49_payload_array_ is None or len(self.vita49_payload_array_) != the_size:
+            self.vita49_payload_array_ = numpy.empty(the_size, dtype=numpy.int16)
+
+        return self.vita49_payload_array_
+
+    def get_data_vita49_single_timestamp(self):
+        """
+        This method will pull data from the data socket and encapsulate it into a list of Vita49DataPacket object.
+        The list has only one element, unless packets were missing and the gap policy is SPLITGapPolicy (see
+        set_gap_policy).  This is being done to keep the return API the same as get_data_vita49. Additionally this
+        will combine the payload of multiple Vita49.0/1 packets together with the first VRT,VRL being returned.
+
+        Notes:
+          Only the valid packets are aggregated, see get_data_vita49_block for how the stream is synchronized.
+
+          When the payload mode is NUMPYPayloadMode, the payloads are copied into vita49_payload_array_ which
+          is preallocated once and reused, it is only valid until the next call.
 
         :return:
-            N/A
+            == None, no data
+            != None, A list of Vita49DataPackets objects (1 element in size, unless split after missing packets)
+        """
+        self.logger_.debug("ENTER")
+
+        the_block = self.get_data_vita49_block()
+
+        if the_block is None:
+            self.logger_.debug("LEAVE")
+            return None
+
+        the_packets = self._aggregate_vita49_(the_block, True)
+
+        self.logger_.debug("LEAVE")
+        return the_packets
+
+    def read_data_block(self):
         """
+        This method will pull one block of data from the data socket into a buffer checked out of the buffer pool,
+        without converting it.  This is the reader stage of a DataPipeline, see convert_data_block for the parser
+        stage.
+
+        Notes:
+          The caller owns the buffer, and must return it with release_buffer once the data is no longer needed.
 
+          When the read times out part way through the block, None is returned and the bytes received are kept,
+          the next call completes the same block.
+
+        :return:
+            == None, no data, or the buffer pool is exhausted
+            != None, bytearray holding block_size() bytes of data read, after _block_headroom_() bytes kept free
+                     for convert_data_block
+        """
         self.logger_.debug("ENTER")
 
-        self.logger_.debug("read_data_ <{}>".format(the_value))
-        self.read_data_ = the_value
+        self.logger_.debug("waiting for lock")
+        with self.data_lock_:
+            if self.data_socket_ is None:
+                self.logger_.debug("data_socket_ == None")
+                self.logger_.debug("LEAVE")
+                return None
+
+            the_buffer = self._read_pool_buffer_()
 
         self.logger_.debug("LEAVE")
+        return the_buffer
 
-    def set_loglevel(self, the_level):
+    def read_ready_block(self):
         """
-        Mutator method, that is used to indicate the loglevel to use for this Device Controller
+        This method is the non-blocking form of read_data_block, used by a DataEngine once epoll reports the data
+        socket readable.  The data already waiting on the socket is moved into the block being filled, and the block
+        is returned once it is full.
 
-        :param the_level: logging.{DEBUG, INFO, WARN....}
+        Notes:
+          The caller owns the buffer, and must return it with release_buffer once the data is no longer needed.
 
         :return:
-            N/A
+            == None, the block is not full yet, or the buffer pool is exhausted
+            != None, bytearray holding block_size() bytes of data read, after _block_headroom_() bytes kept free
+                     for convert_data_block
+        """
+        with self.data_lock_:
+            if self.data_socket_ is None:
+                return None
+
+            return self._read_pool_buffer_(the_wait=False)
+
+    def _read_pool_buffer_(self, the_wait=True, the_start=None):
         """
+        This is a utility method that fills a buffer checked out of the buffer pool.  When the read times out part
+        way through, the buffer is kept in pending_buffer_ and the next call resumes filling it.
 
-        self.logger_.setLevel(the_level)
+        NOTE:
+            The caller must hold the data_lock_ and ensure that data_socket_ is not None.
 
-    def set_output_format(self, the_type):
+        :param the_wait:  When False, neither the buffer pool nor the socket is waited on.
+        :param the_start: Offset of the first byte to fill, None leaves the headroom free, see _block_headroom_
+
+        :return:
+            == None, no data, or the buffer pool is exhausted
+            != None, bytearray of _block_headroom_() + block_size() bytes holding the data read
         """
-        Mutator method, that is used to indicate to the device controller what kind of data to send over the
-        data port.
+        if the_start is None:
+            the_start = self._block_headroom_()
 
-        :param the_type: {COMPLEXDataFormat, VITA49DataFormat}
+        the_buffer = self.pending_buffer_
 
-        :raises ValueError: if the_type not one of the defined values.
+        if the_buffer is not None and len(the_buffer) != self._buffer_size_():
+            self._reset_read_()
+            the_buffer = None
+
+        if the_buffer is None:
+            the_buffer = self._buffer_pool_().acquire(0.10 if the_wait else 0)
+
+            if the_buffer is None:
+                self.logger_.debug("buffer pool exhausted")
+                return None
+
+        if not self._receive_into_(the_buffer, the_start, the_wait):
+            if self.read_buffer_ is the_buffer:
+                self.pending_buffer_ = the_buffer
+            else:
+                self.pending_buffer_ = None
+                self.release_buffer(the_buffer)
+
+            return None
+
+        self.pending_buffer_ = None
+
+        return the_buffer
+
+    def _buffer_pool_(self):
+        """
+        This is a utility method that returns the pool of receive buffers for the active output format.  The pool is
+        replaced when the output format or the capacity changes, buffers released to the old pool are ignored.
+
+        NOTE:
+            The caller must hold the data_lock_.
+
+        :return:
+            BufferPool object
+        """
+        the_size = self._buffer_size_()
+
+        if self.buffer_pool_ is None or\
+           self.buffer_pool_.buffer_size() != the_size or\
+           self.buffer_pool_.capacity() != self.buffer_pool_capacity_:
+            self.logger_.debug("creating pool of <{}> x <{}> bytes".format(self.buffer_pool_capacity_, the_size))
+            self.buffer_pool_ = BufferPool(the_size, self.buffer_pool_capacity_)
+
+        return self.buffer_pool_
+
+    def _block_headroom_(self):
+        """
+        This is a utility method that returns the number of bytes kept free at the start of each receive buffer, for
+        the partial Vita49 packet at the end of the previous block, see Note 5 of the constructor.
+
+        :return:
+            integer, a packet in the Vita49 output format, 0 otherwise
+        """
+        if self.output_format() == VITA49OutputFormat:
+            return Vita49.VRT_PACKET_SIZE
+
+        return 0
+
+    def _buffer_size_(self):
+        """
+        This is a utility method that returns the size of the receive buffers, the headroom and a block.
+        """
+        return self._block_headroom_() + self.block_size()
+
+    def release_buffer(self, the_buffer):
+        """
+        Use this method to return a buffer provided by read_data_block or get_data_vita49_raw.
+
+        :param the_buffer: The buffer being returned
 
         :return:
             N/A
         """
-        self.logger_.debug("ENTER, the_type <{}>".format(the_type))
+        the_pool = self.buffer_pool_
 
-        if the_type == COMPLEXOutputFormat:
-            self.rx_data_.config(UseV49=False)
+        if the_pool is not None:
+            the_pool.release(the_buffer)
 
-        elif the_type == VITA49OutputFormat:
-            self.rx_data_.config(UseV49=True)
+    def convert_data_block(self, the_buffer):
+        """
+        This method will convert a block returned by read_data_block into the data returned by get_data_complex or
+        get_data_vita49_single_timestamp, depending on the output format.  This is the parser stage of a
+        DataPipeline.
 
-        else:
+        Notes:
+          The blocks must be converted in the order they were read.  A partial Vita49 packet at the end of a block is
+          kept and completed by the next block.
+
+          In NUMPYPayloadMode the complex samples view the_buffer, so the_buffer must not be released until the
+          samples are no longer needed.  The Vita49 payload is copied into a new array, so the result is not
+          affected by the conversion of the next block.
+
+        :param the_buffer: bytearray returned by read_data_block
+
+        :return:
+            == None, no data
+            != None, a list/NumPy array of signed short, or a list of Vita49DataPackets objects (1 element in size,
+                     unless split after missing packets, see set_gap_policy)
+        """
+        self.logger_.debug("ENTER")
+
+        if not self.rx_data_.useV49():
             self.logger_.debug("LEAVE")
-            raise ValueError("invalid output type of <{}> requested.".format(the_type))
+            return self._convert_complex_(the_buffer)
+
+        #
+        # The partial packet kept from the previous block goes in the headroom, just before the data, see Note 5 of
+        # the constructor.  It is always shorter than a packet.
+        #
+        the_first  = self._block_headroom_() - self.vita49_residual_size_
+        the_stream = numpy.frombuffer(the_buffer, dtype=numpy.uint8)[the_first:]
+
+        the_stream[:self.vita49_residual_size_] = self.vita49_residual_[:self.vita49_residual_size_]
+
+        the_block, the_keep = self._synchronize_vita49_(the_stream)
+
+        self.vita49_residual_size_ = len(the_stream) - the_keep
+        self.vita49_residual_[:self.vita49_residual_size_] = the_stream[the_keep:]
+
+        if the_block is None:
+            self.logger_.debug("no valid packets")
+            self.logger_.debug("LEAVE")
+            return None
+
+        the_packets = self._aggregate_vita49_(the_block, False)
 
-        self.logger_.debug("output_format <{}>".format(the_type))
         self.logger_.debug("LEAVE")
+        return the_packets
 
-    def set_output_endian(self, the_type):
+    def get_data_vita49_raw(self):
         """
-        Mutator method, that is used to indicate to the device controller what endian format to use for
-        the integer values BIG or LITTLE
+        This method will pull data from the data socket, and return raw Vita49.0/1 packets without parsing or otherwise
+        inspecting the information.
 
-        :param the_type: {BIGOutputEndian, LITTLEOutputEndian}
+        Notes:
+          This method does not handle synchronizing to the Vita49 FAW it expects that byte 0 is the start of
+          the packet.  Therefore if there are any buffer overflows on the daemon, then no data will be returned.
 
-        :raises ValueError: if the_type not one of the defined values.
+          The buffer is checked out of the buffer pool, it is not reused until the caller returns it with
+          release_buffer.
 
         :return:
-            N/A
+            == None, no data
+            != None, A bytearray containing one or more Vita49 packets.
         """
-        self.logger_.debug("ENTER, the_type <{}>".format(the_type))
+        self.logger_.debug("ENTER")
 
-        if the_type == BIGOutputEndian:
-            self.rx_data_.config(UseBE=True)
+        self.logger_.debug("waiting for lock")
+        with self.data_lock_:
+            if self.data_socket_ is None:
+                self.logger_.debug("data_socket_ == None")
+                self.logger_.debug("LEAVE")
+                return None, None
 
-        elif the_type == LITTLEOutputEndian:
-            self.rx_data_.config(UseBE=False)
+            the_buffer = self._read_pool_buffer_(the_start=0)
 
-        else:
-            self.logger_.debug("LEAVE")
-            raise ValueError("Invalid endian type of <{}> requested.".format(the_type))
+            if the_buffer is None:
+                self.logger_.debug("LEAVE")
+                return None, None
 
-        self.logger_.debug("useBE <{}>".format(self.rx_data_.useBE()))
+        self.logger_.debug("good data")
         self.logger_.debug("LEAVE")
+        return None, the_buffer
+
+    """
+    Quick element accessor methods
+    """
+    def data_port(self):
+        """
+        Accessor method, that returns the value of the data port associated with this Device Controller
+
+        :return:
+          integer representing the data port
+        """
+        return(self.data_port_)
+
+    def data_fileno(self):
+        """
+        Accessor method, that returns the file descriptor of the data socket, used to register it with a DataEngine
+
+        :return:
+          == None, the data socket is not connected
+          != None, integer file descriptor
+        """
+        the_socket = self.data_socket_
+
+        if the_socket is None:
+            return None
+
+        return the_socket.fileno()
+
+    def allocation_id(self):
+        """
+        Accessor method, that returns the allocation id associated with this Device Controller
+
+        :return:
+           A string representing the allocation id
+        """
+        return(self.allocation_id_)
+
+    def stream_id(self):
+        """
+        Accessor method, that returns the current stream id associated with this Device Controller
+
+        :return:
+            A string representing the current stream id.
+        """
+        return self.stream_id_
+
+    def center_frequency(self):
+        """
+        Accessor method, that returns the current center frequency associated with this Device Controller
+        This is the value that was sent via tune
+
+        :return:
+            The integer value of the center frequency sent to this Device Controller
+        """
+        return self.rx_.freq()
+
+    def bandwidth(self):
+        """
+        Accessor method, that returns the current bandwidth associated with this Device Controller
+
+        Note:
+            Because the device produces complex data samples, the bandwidth will typically
+            equal the sample rate.
+
+        :return:
+            The integer value of the bandwidth
+        """
+        return(self.rx_.sampleRate())
+
+    def sample_rate(self):
+        """
+        Accessor method, that returns the current sample rate associated with this Device Controller
+
+        :return:
+            The integer value of the sample rate
+        """
+        return(self.rx_.sampleRate())
+
+    def output_format(self):
+        """
+        Accessor method, that returns the output_format of the Device Controller
+
+        :return:
+            COMPLEXOutputFormat: data_port will be producing signed 16bit complex data
+            VITA49OutputFormat:  data port will be producing Vita49.0/1 packets
+        """
+
+        the_format = COMPLEXOutputFormat
+
+        if self.rx_data_.useV49():
+            the_format = VITA49OutputFormat
+
+        return the_format
+
+    def block_mode(self):
+        """
+        Accessor method, that returns how the size of each read from the data port is chosen
+
+        :return:
+            FIXEDBlockMode: block_packets packets are read at a time
+            AUTOBlockMode:  the number of packets is chosen from the sample rate and the block latency
+        """
+        return self.block_mode_
+
+    def block_latency(self):
+        """
+        Accessor method, that returns the target latency in ms of each read when using AUTOBlockMode
+
+        :return:
+            float representing the latency in ms
+        """
+        return self.block_latency_
+
+    def block_packets(self):
+        """
+        Accessor method, that returns the number of Vita49 packets read from the data port at a time.  For the complex
+        output format it is the number of 8192 byte units (2048 complex samples) read at a time.
+
+        In AUTOBlockMode it is the number of packets holding block_latency ms of samples at the current sample rate,
+        limited to 1..256 packets.
+
+        :return:
+            integer representing the number of packets
+        """
+        if self.block_mode_ != AUTOBlockMode:
+            return self.block_packets_
+
+        if self.rx_data_.useV49():
+            the_samples_per_packet = Vita49.VRT_PAYLOAD_SHORTS / 2
+        else:
+            the_samples_per_packet = self._block_unit_size_ / 4
+
+        the_samples = float(self.sample_rate()) * self.block_latency_ / 1000.0
+        the_packets = int(math.ceil(the_samples / the_samples_per_packet))
+
+        return max(self._min_block_packets_, min(self._max_block_packets_, the_packets))
+
+    def block_size(self):
+        """
+        Accessor method, that returns the number of bytes read from the data port at a time for the active
+        output format.
+
+        :return:
+            integer representing the number of bytes
+        """
+        return self.block_packets() * self._block_unit_size_
+
+    def bulk_receive(self):
+        """
+        Accessor method, that returns whether blocks are received with MSG_WAITALL, see set_bulk_receive
+
+        :return:
+            == True,  bulk receive
+            == False, normal receive
+        """
+        return self.bulk_receive_
+
+    def buffer_pool(self):
+        """
+        Accessor method, that returns the pool of receive buffers
+
+        :return:
+            == None, no data has been read yet
+            != None, BufferPool object
+        """
+        return self.buffer_pool_
+
+    def buffer_pool_capacity(self):
+        """
+        Accessor method, that returns the most receive buffers the buffer pool may allocate
+
+        :return:
+            integer representing the number of buffers
+        """
+        return self.buffer_pool_capacity_
+    
+    def payload_mode(self):
+        """
+        Accessor method, that returns how samples are returned by the get_data_x methods.
+
+        :return:
+            LISTPayloadMode:  samples are returned as a list/tuple of signed 16bit values
+            NUMPYPayloadMode: samples are returned as a NumPy int16 array
+        """
+        return self.payload_mode_
+
+    def loglevel(self):
+        """
+        Accessor method, that returns the current loglevel set for the Device Controller
+        :return:
+            the logging level specified by the constructor, or set_log_level
+        """
+        return self.logger_.getEffectiveLevel()
+
+    def read_data_flag(self):
+        """
+        Accessor method, that returns whether or not this device controller should be performing the network
+        reads on the data socket.  When true data must be consumed using one of the get_data_x methods depending upon
+        the output_format specified.
+
+        :return:
+            == True, then need to call get_data_x to obtain data based upon output_format
+            == False, Some other application/thread is reading the data from the data_port
+        """
+        return self.read_data_
+
+    def vita49_bytes_skipped(self):
+        """
+        Accessor method, that returns the number of bytes discarded while synchronizing to the Vita49 stream.
+
+        :return:
+            integer
+        """
+        return self.vita49_synchronizer_.bytes_skipped()
+
+    def vita49_resync_events(self):
+        """
+        Accessor method, that returns the number of times synchronization with the Vita49 stream was lost.
+
+        :return:
+            integer
+        """
+        return self.vita49_synchronizer_.resync_events()
+
+    def retune_count(self):
+        return self.retune_count_
+
+    def gap_policy(self):
+        return self.gap_policy_
+
+    def gap_fill_limit(self):
+        return self.gap_fill_limit_
+
+    def gaps_concealed(self):
+        return self.gaps_concealed_
+
+    def samples_concealed(self):
+        return self.samples_concealed_
+
+    def blocks_split(self):
+        return self.blocks_split_
+
+    def continuity(self):
+        """
+        Accessor method, that returns the Vita49.Vita49ContinuityTracker of the Vita49 stream.
+        """
+        return self.continuity_
+
+    def sample_clock(self):
+        """
+        Accessor method, that returns the SampleClock timing the complex samples, see block_time.
+        """
+        return self.sample_clock_
+
+    def samples_produced(self):
+        """
+        Accessor method, that returns the number of complex samples returned by the data methods since the data
+        socket was connected, including the samples concealing gaps but not the bytes skipped to find the packets.
+        This is the position retunes are placed at, see _place_markers_ and advance_samples.
+        """
+        return self.samples_produced_
+
+    def samples_received(self):
+        """
+        Accessor method, that returns the number of samples received since the data socket was connected.
+        """
+        return self._samples_in_bytes_(self.bytes_received_)
+
+    def status_age(self, the_group):
+        """
+        Accessor method, that returns the number of seconds since the values of the_group were last queried, None if
+        they never were.
+        """
+        the_time = self.status_times_.get(the_group)
+
+        return None if the_time is None else time.time() - the_time
+
+    def first_timestamp(self):
+        """
+        Accessor method, that returns the UTC second of the first Vita49 packet received since the data was
+        connected, decoded from its TSI and TSF, see Vita49.Vita49PacketBlock.timestamps.  None until one is received,
+        or when its time is not related to UTC.
+        """
+        return self.first_timestamp_
+
+    def retune_latency(self):
+        """
+        Accessor method, that returns the number of seconds the last retune took to be confirmed by the daemon.
+        """
+        return self.retune_latency_
+
+    def retune_latency_max(self):
+        return self.retune_latency_max_
+
+    def tune_window(self):
+        return self.tune_window_
+
+    def tunes_coalesced(self):
+        return self.tunes_coalesced_
+
+    def sri_changed(self):
+        """
+        Accessor method, that returns whether or not the signal related information has changed since the last call
+        to this method.
+
+        Notes:
+            - This method returns the current value, and resets the internal state to False.
+            - The set_tune method will set the internal state to True.
+
+        :return:
+            == True, SRI has changed
+            == False, SRI has not changed.
+        """
+        self.logger_.debug("ENTER")
+
+        the_result = self.sri_change_flag_
+        self.sri_change_flag_ = False
+
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def gps_geolocation_dictionary(self):
+        """
+        Accessor mehtod, that will return the gps information as a set of GEOLOCATION_GPS keywords
+        that are compatibalbe with REDHAWK.
+
+        :return: Dictionary container GEOLOCATION_GPS keywords and values.
+        """
+        self.logger_.debug("ENTER")
+        the_gps_geolocation_struct = Vita49.GEOLOCATION_GPS_struct()
+
+        the_gps_geolocation_struct.config\
+            (
+                time_seconds=self.gps_.time(),
+                latitude=self.gps_.lat(),
+                longitude=self.gps_.long(),
+                altitude=self.gps_.alt(),
+            )
+
+        self.logger_.debug("LEAVE")
+        return the_gps_geolocation_struct.to_dictionary()
+
+    """
+    This set of methods are used to obtain the cached data without making a
+    request to the device
+    """
+
+    def master(self):
+        """
+        Accessor method, that returns the cached value of the Master group data
+
+        NOTE:
+            Assumes that query_master has been performed.
+
+        :return:
+            == None: query_master has not been called.
+            != None: Master object.
+        """
+        return self.master_
+
+
+    def rx(self):
+        """
+        Accessor method, that returns the RX group values last confirmed by the daemon, see Note 3 of the
+        constructor.  No request is made.
+        """
+        return self.rx_
+
+    def rxdata(self):
+        return self.rx_data_
+
+    def gps(self):
+        return self.gps_
+
+    def rxstatus(self):
+        """
+        Accessor method, that returns the cached information obtained from a query_rxstatus request.
+
+        :return:
+            None:      query_rxstatus never performed.
+            RxStatus : the cached results obtained from the query_rxstatus method.
+        """
+        return self.rx_stat_
+
+    def txstatus(self):
+        """
+        Accessor method, that returns the cached information obtained from a query_txstatus request.
+
+        :return:
+            None:      query_rxstatus never performed.
+            TxStatus : the cached results obtained from the query_rxstatus method.
+        """
+        return self.tx_status_
+
+    """
+    Mutator methods
+    """
+    def set_read_data_flag(self, the_value):
+        """
+        Mutator method, that is used to indicate to the device controller whether on not it should read from the TCP/IP
+        data port or not.
+
+            If set to True, then the data packets read from the data port may be obtained by
+            calling get_data_complex, get_data_vita49.
+
+            If set to False, then it is expected that some other process will be consuming data form the
+            data port.
+
+        :param the_value: Boolean
+
+        :return:
+            N/A
+        """
+
+        self.logger_.debug("ENTER")
+
+        self.logger_.debug("read_data_ <{}>".format(the_value))
+        self.read_data_ = the_value
+
+        self.logger_.debug("LEAVE")
+
+    def set_loglevel(self, the_level):
+        """
+        Mutator method, that is used to indicate the loglevel to use for this Device Controller
+
+        :param the_level: logging.{DEBUG, INFO, WARN....}
+
+        :return:
+            N/A
+        """
+
+        self.logger_.setLevel(the_level)
+
+    def set_output_format(self, the_type):
+        """
+        Mutator method, that is used to indicate to the device controller what kind of data to send over the
+        data port.
+
+        :param the_type: {COMPLEXDataFormat, VITA49DataFormat}
+
+        :raises ValueError: if the_type not one of the defined values.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_type <{}>".format(the_type))
+
+        if the_type == COMPLEXOutputFormat:
+            self.rx_data_.config(UseV49=False)
+
+        elif the_type == VITA49OutputFormat:
+            self.rx_data_.config(UseV49=True)
+
+        else:
+            self.logger_.debug("LEAVE")
+            raise ValueError("invalid output type of <{}> requested.".format(the_type))
+
+        self.logger_.debug("output_format <{}>".format(the_type))
+        self.logger_.debug("LEAVE")
+
+    def set_payload_mode(self, the_mode):
+        """
+        Mutator method, that is used to indicate how the get_data_x methods return samples.
+
+            If set to NUMPYPayloadMode, then payloads are NumPy int16 arrays that view the receive buffer, no
+            Python integers are created.  The arrays are only valid until the next get_data_x call.
+
+        :param the_mode: {LISTPayloadMode, NUMPYPayloadMode}
+
+        :raises ValueError: if the_mode not one of the defined values.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_mode <{}>".format(the_mode))
+
+        if the_mode not in (LISTPayloadMode, NUMPYPayloadMode):
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid payload mode of <{}> requested.".format(the_mode))
+
+        self.payload_mode_ = the_mode
+
+        self.logger_.debug("LEAVE")
+
+    def set_gap_policy(self, the_policy, the_fill_limit=1.0):
+        """
+        Mutator method, that is used to indicate how get_data_vita49_single_timestamp and convert_data_block handle
+        packets missing from the Vita49 stream, found from the frame count and timestamps of the packets.
+
+            If set to IGNOREGapPolicy, then the payloads either side of the gap are joined, the samples after it are
+            mistimed.
+            If set to ZEROFILLGapPolicy or HOLDLASTGapPolicy, then the missing samples are replaced by zeros or by the
+            sample before them, so the samples after the gap keep their time.
+            If set to SPLITGapPolicy, then a new Vita49DataPacket, with its own timestamp, is started after the gap,
+            see Vita49DataPacket.gap.
+
+        :param the_policy:     {IGNOREGapPolicy, ZEROFILLGapPolicy, HOLDLASTGapPolicy, SPLITGapPolicy}
+        :param the_fill_limit: The longest gap, in seconds, that is filled, longer gaps are split.
+
+        :raises ValueError: if the_policy not one of the defined values, or the_fill_limit is negative.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_policy <{}>".format(the_policy))
+
+        if the_policy not in (IGNOREGapPolicy, ZEROFILLGapPolicy, HOLDLASTGapPolicy, SPLITGapPolicy):
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid gap policy of <{}> requested.".format(the_policy))
+
+        if the_fill_limit < 0:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid fill limit of <{}> requested.".format(the_fill_limit))
+
+        self.gap_policy_     = the_policy
+        self.gap_fill_limit_ = the_fill_limit
+
+        self.logger_.debug("LEAVE")
+
+    def set_block_mode(self, the_mode):
+        """
+        Mutator method, that is used to indicate how the size of each read from the data port is chosen.
+
+            If set to FIXEDBlockMode, then block_packets packets are read at a time (see set_block_packets).
+            If set to AUTOBlockMode, then each read holds block_latency ms of samples at the tuned sample rate (see
+            set_block_latency), trading throughput for latency at low sample rates.
+
+        :param the_mode: {FIXEDBlockMode, AUTOBlockMode}
+
+        :raises ValueError: if the_mode not one of the defined values.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_mode <{}>".format(the_mode))
+
+        if the_mode not in (FIXEDBlockMode, AUTOBlockMode):
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid block mode of <{}> requested.".format(the_mode))
+
+        self.block_mode_ = the_mode
+
+        self.logger_.debug("LEAVE")
+
+    def set_block_packets(self, the_packets):
+        """
+        Mutator method, that is used to set the number of packets read at a time when using FIXEDBlockMode.
+
+        :param the_packets: integer 1..256
+
+        :raises ValueError: if the_packets is out of range.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_packets <{}>".format(the_packets))
+
+        if the_packets < self._min_block_packets_ or the_packets > self._max_block_packets_:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid block size of <{}> packets requested.".format(the_packets))
+
+        self.block_packets_ = int(the_packets)
+
+        self.logger_.debug("LEAVE")
+
+    def set_block_latency(self, the_latency):
+        """
+        Mutator method, that is used to set the target latency of each read when using AUTOBlockMode.
+
+        :param the_latency: The latency in ms, > 0
+
+        :raises ValueError: if the_latency is not greater than 0.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_latency <{}>".format(the_latency))
+
+        if the_latency <= 0:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid block latency of <{}> ms requested.".format(the_latency))
+
+        self.block_latency_ = float(the_latency)
+
+        self.logger_.debug("LEAVE")
+
+    def set_bulk_receive(self, the_value):
+        """
+        Mutator method, that is used to indicate how blocks are received from the data socket.
+
+            If set to True, then each block is received with MSG_WAITALL on a blocking socket with a receive timeout
+            (SO_RCVTIMEO), so the kernel returns the whole block in one system call.
+            If set to False, then recv_into is called for whatever data has arrived until the block is full.
+
+        :param the_value: {True, False}
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_value <{}>".format(the_value))
+
+        with self.data_lock_:
+            self.bulk_receive_ = bool(the_value)
+
+            if self.data_socket_ is not None:
+                self._configure_data_socket_()
+
+        self.logger_.debug("LEAVE")
+
+    def set_tune_window(self, the_window):
+        """
+        Mutator method, that sets how long tuning requests are merged for, see request_tune.
+
+        :param the_window: The number of seconds, 0 makes each request straight away
+
+        :return:
+            N/A
+
+        :raises ValueError: if the_window is negative
+        """
+        if the_window < 0:
+            raise ValueError("Invalid tune window <{}> requested.".format(the_window))
+
+        self.tune_window_ = the_window
+
+    def set_buffer_pool_capacity(self, the_capacity):
+        """
+        Mutator method, that is used to set the most receive buffers the buffer pool may allocate.  A DataPipeline
+        needs one buffer per block queued or being worked on by a stage.
+
+        :param the_capacity: integer >= 1
+
+        :raises ValueError: if the_capacity is less than 1.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_capacity <{}>".format(the_capacity))
+
+        if the_capacity < 1:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid buffer pool capacity of <{}> requested.".format(the_capacity))
+
+        self.buffer_pool_capacity_ = the_capacity
+
+        self.logger_.debug("LEAVE")
+
+    def set_output_endian(self, the_type):
+        """
+        Mutator method, that is used to indicate to the device controller what endian format to use for
+        the integer values BIG or LITTLE
+
+        :param the_type: {BIGOutputEndian, LITTLEOutputEndian}
+
+        :raises ValueError: if the_type not one of the defined values.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER, the_type <{}>".format(the_type))
+
+        if the_type == BIGOutputEndian:
+            self.rx_data_.config(UseBE=True)
+
+        elif the_type == LITTLEOutputEndian:
+            self.rx_data_.config(UseBE=False)
+
+        else:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid endian type of <{}> requested.".format(the_type))
+
+        self.logger_.debug("useBE <{}>".format(self.rx_data_.useBE()))
+        self.logger_.debug("LEAVE")
+
+
+class BufferPool:
+    """
+    This class hands out fixed size receive buffers (bytearray) and takes them back once the consumer is done with
+    them, so the same memory is reused from read to read.  Buffers are only allocated the first time they are needed,
+    and never more than the capacity of the pool.
+
+    When every buffer is checked out the pool is exhausted, acquire waits for a buffer to be released.
+    """
+
+    def __init__(self, the_buffer_size, the_capacity, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_buffer_size: The size in bytes of each buffer
+        :param the_capacity:    The maximum number of buffers allocated
+        :param loglevel:        The log level to use
+
+        :raises ValueError: if the_buffer_size or the_capacity is less than 1
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.BufferPool')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        if the_buffer_size < 1 or the_capacity < 1:
+            self.logger_.debug("LEAVE")
+            raise ValueError\
+                (
+                    "Invalid buffer pool of <{}> x <{}> bytes requested.".format(the_capacity, the_buffer_size)
+                )
+
+        self.buffer_size_ = the_buffer_size
+        self.capacity_    = the_capacity
+
+        self.condition_   = threading.Condition()
+        self.free_        = []      # Buffers available to be checked out
+        self.buffers_     = []      # Every buffer allocated by this pool
+
+        self.high_water_  = 0       # Most buffers checked out at once
+        self.exhausted_   = 0       # Number of times acquire found no buffer available
+
+        self.logger_.debug("LEAVE")
+
+    def __str__(self):
+        """
+        Helper function to display human readable representation of object.
+
+        :return:
+            A string representing the object
+        """
+        the_string = "BufferPool:\n"\
+                     "  buffer size: {}\n"\
+                     "  capacity:    {}\n"\
+                     "  allocated:   {}\n"\
+                     "  in use:      {} (high water {})\n"\
+                     "  exhausted:   {}"\
+                     .format\
+                        (
+                            self.buffer_size_,
+                            self.capacity_,
+                            self.allocated(),
+                            self.in_use(), self.high_water_,
+                            self.exhausted_
+                        )
+
+        return the_string
+
+    def acquire(self, the_timeout=None):
+        """
+        Use this method to check out a buffer.
+
+        :param the_timeout: The number of seconds to wait when the pool is exhausted, None waits forever.
+
+        :return:
+            == None, no buffer was released within the_timeout
+            != None, bytearray of buffer_size bytes, its content is undefined
+        """
+        with self.condition_:
+            if not self.free_ and len(self.buffers_) < self.capacity_:
+                the_buffer = bytearray(self.buffer_size_)
+                self.buffers_.append(the_buffer)
+                self.free_.append(the_buffer)
+
+            if not self.free_:
+                self.exhausted_ += 1
+                self.logger_.debug("pool exhausted, <{}> buffers in use".format(self.in_use()))
+
+                if the_timeout is None:
+                    while not self.free_:
+                        self.condition_.wait()
+                else:
+                    the_deadline = time.time() + the_timeout
+
+                    while not self.free_:
+                        the_remaining = the_deadline - time.time()
+
+                        if the_remaining <= 0:
+                            return None
+
+                        self.condition_.wait(the_remaining)
+
+            the_buffer = self.free_.pop()
+
+            self.high_water_ = max(self.high_water_, self.in_use())
+
+            return the_buffer
+
+    def release(self, the_buffer):
+        """
+        Use this method to return a buffer checked out with acquire.  Buffers that were not allocated by this pool,
+        for example after the pool was replaced, are ignored.
+
+        :param the_buffer: The buffer being returned
+
+        :return:
+            == True,  buffer returned to the pool
+            == False, buffer ignored
+        """
+        with self.condition_:
+            if not any(the_owned is the_buffer for the_owned in self.buffers_):
+                return False
+
+            if any(the_free is the_buffer for the_free in self.free_):
+                self.logger_.warning("Buffer released twice")
+                return False
+
+            self.free_.append(the_buffer)
+            self.condition_.notify()
+
+            return True
+
+    """
+    Quick element accessor methods
+    """
+    def buffer_size(self):
+        return self.buffer_size_
+
+    def capacity(self):
+        return self.capacity_
+
+    def allocated(self):
+        """
+        Accessor method, that returns the number of buffers allocated so far.
+        """
+        return len(self.buffers_)
+
+    def available(self):
+        """
+        Accessor method, that returns the number of buffers that can be checked out without waiting.
+        """
+        return len(self.free_) + self.capacity_ - len(self.buffers_)
+
+    def in_use(self):
+        """
+        Accessor method, that returns the number of buffers checked out.
+        """
+        return len(self.buffers_) - len(self.free_)
+
+    def high_water(self):
+        return self.high_water_
+
+    def exhausted(self):
+        return self.exhausted_
+
+
+class DataPipeline:
+    """
+    This class runs the data flow of a single Device Controller as three stages, each on its own thread:
+
+      reader: pulls raw blocks from the data socket
+      parser: converts the raw blocks into samples/packets
+      pusher: delivers the converted blocks to the consumer
+
+    The stages are joined by bounded queues, so the read of block N+1 overlaps the conversion and push of block N.
+    When a queue is full the stage feeding it waits, this is counted as a stall.
+
+    Each raw block is handed to the release callable once it has been pushed or dropped, so receive buffers can be
+    returned to a BufferPool.
+    """
+
+    def __init__(self, the_name, the_reader, the_parser, the_pusher, the_queue_depth=4, the_release=None,
+                 loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_name:        string used to name the threads and log messages
+        :param the_reader:      callable with no arguments returning the next raw block, None when there is no data.
+                                When None, no reader thread is started and blocks are provided through submit().
+        :param the_parser:      callable taking a raw block and returning the converted block, None to drop it
+        :param the_pusher:      callable taking the converted block and the time (time.time()) the block was read
+        :param the_queue_depth: The maximum number of blocks waiting in each queue
+        :param the_release:     callable taking a raw block once it is no longer needed, None when not required
+        :param loglevel:        The log level to use
+
+        :raises ValueError: if the_queue_depth is less than 1
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.DataPipeline')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        if the_queue_depth < 1:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid queue depth of <{}> requested.".format(the_queue_depth))
+
+        self.name_        = the_name
+        self.reader_      = the_reader
+        self.parser_      = the_parser
+        self.pusher_      = the_pusher
+        self.release_     = the_release
+        self.queue_depth_ = the_queue_depth
+
+        self.read_queue_  = Queue.Queue(the_queue_depth)   # Raw blocks waiting for the parser
+        self.push_queue_  = Queue.Queue(the_queue_depth)   # Converted blocks waiting for the pusher
+
+        self.running_     = False
+        self.threads_     = []
+
+        #
+        # Metrics
+        #
+        self.metrics_lock_          = threading.Lock()
+        self.read_high_water_       = 0   # Most blocks seen waiting in the read_queue_
+        self.push_high_water_       = 0   # Most blocks seen waiting in the push_queue_
+        self.blocks_read_           = 0
+        self.blocks_pushed_         = 0
+        self.blocks_dropped_        = 0   # Blocks the parser returned None for
+        self.stalls_                = 0   # Number of times a stage waited on a full queue
+
+        self.logger_.debug("LEAVE")
+
+    def __str__(self):
+        """
+        Helper function to display human readable representation of object.
+
+        :return:
+            A string representing the object
+        """
+        the_string = "DataPipeline:\n"\
+                     "  name:          {}\n"\
+                     "  running:       {}\n"\
+                     "  queue depth:   {}\n"\
+                     "  read queue:    {} (high water {})\n"\
+                     "  push queue:    {} (high water {})\n"\
+                     "  blocks read:   {}\n"\
+                     "  blocks pushed: {}\n"\
+                     "  dropped:       {}\n"\
+                     "  stalls:        {}"\
+                     .format\
+                        (
+                            self.name_,
+                            self.running_,
+                            self.queue_depth_,
+                            self.read_queue_.qsize(), self.read_high_water_,
+                            self.push_queue_.qsize(), self.push_high_water_,
+                            self.blocks_read_,
+                            self.blocks_pushed_,
+                            self.blocks_dropped_,
+                            self.stalls_
+                        )
+
+        return the_string
+
+    def start(self):
+        """
+        Use this method to start the stage threads.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER")
+
+        if self.running_:
+            self.logger_.debug("LEAVE")
+            return
+
+        self.running_ = True
+        self.threads_ = []
+
+        if self.reader_ is not None:
+            self.threads_.append(threading.Thread(target=self._reader_loop_, name=self.name_ + "_reader"))
+
+        self.threads_.append(threading.Thread(target=self._parser_loop_, name=self.name_ + "_parser"))
+        self.threads_.append(threading.Thread(target=self._pusher_loop_, name=self.name_ + "_pusher"))
+
+        for the_thread in self.threads_:
+            the_thread.daemon = True
+            the_thread.start()
+
+        self.logger_.debug("LEAVE")
+
+    def stop(self, the_timeout=2.0):
+        """
+        Use this method to stop the stage threads, any blocks still queued are discarded.
+
+        :param the_timeout: The number of seconds to wait for each thread to finish
+
+        :return:
+            == True,  all the threads finished
+            == False, at least one thread did not finish
+        """
+        self.logger_.debug("ENTER")
+
+        self.running_ = False
+
+        the_result = True
+
+        for the_thread in self.threads_:
+            the_thread.join(the_timeout)
+
+            if the_thread.is_alive():
+                self.logger_.error("Thread <{}> did not finish".format(the_thread.name))
+                the_result = False
+
+        self.threads_ = []
+
+        self._drain_(self.read_queue_)
+        self._drain_(self.push_queue_)
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def submit(self, the_block, the_time=None):
+        """
+        Use this method to provide a raw block to the parser stage, when the pipeline was created without a reader.
+
+        :param the_block: The raw block
+        :param the_time:  The time the block was read, defaults to now
+
+        :return:
+            == True,  block queued
+            == False, the pipeline is not running
+        """
+        if the_time is None:
+            the_time = time.time()
+
+        with self.metrics_lock_:
+            self.blocks_read_ += 1
+
+        if not self._put_(self.read_queue_, (the_time, the_block)):
+            self._release_(the_block)
+            return False
+
+        return True
+
+    def offer(self, the_block, the_time=None):
+        """
+        Use this method to provide a raw block to the parser stage without waiting, when the pipeline was created
+        without a reader.  Unlike submit, the block is not released when it can not be queued.
+
+        :param the_block: The raw block
+        :param the_time:  The time the block was read, defaults to now
+
+        :return:
+            == True,  block queued
+            == False, the pipeline is not running or the read queue is full, the caller still owns the_block
+        """
+        if not self.running_:
+            return False
+
+        if the_time is None:
+            the_time = time.time()
+
+        try:
+            self.read_queue_.put_nowait((the_time, the_block))
+
+        except Queue.Full:
+            return False
+
+        the_size = self.read_queue_.qsize()
+
+        with self.metrics_lock_:
+            self.blocks_read_     += 1
+            self.read_high_water_  = max(self.read_high_water_, the_size)
+
+        return True
+
+    def _put_(self, the_queue, the_item):
+        """
+        This is a utility method that places the_item on the_queue, waiting while the queue is full and the pipeline
+        is running.
+
+        :return:
+            == True,  item queued
+            == False, the pipeline is not running
+        """
+        the_stalled = False
+
+        while self.running_:
+            try:
+                the_queue.put(the_item, True, 0.1)
+
+            except Queue.Full:
+                if not the_stalled:
+                    the_stalled = True
+                    with self.metrics_lock_:
+                        self.stalls_ += 1
+                continue
+
+            the_size = the_queue.qsize()
+
+            with self.metrics_lock_:
+                if the_queue is self.read_queue_:
+                    self.read_high_water_ = max(self.read_high_water_, the_size)
+                else:
+                    self.push_high_water_ = max(self.push_high_water_, the_size)
+
+            return True
+
+        return False
+
+    def _get_(self, the_queue):
+        """
+        This is a utility method that takes the next item from the_queue.
+
+        :return:
+            == None, the pipeline is not running
+            != None, the item
+        """
+        while self.running_:
+            try:
+                return the_queue.get(True, 0.1)
+
+            except Queue.Empty:
+                continue
+
+        return None
+
+    def _drain_(self, the_queue):
+        """
+        This is a utility method that discards everything on the_queue, releasing the raw blocks.
+        """
+        try:
+            while True:
+                the_item = the_queue.get_nowait()
+                self._release_(the_item[-1])
+
+        except Queue.Empty:
+            pass
+
+    def _release_(self, the_block):
+        """
+        This is a utility method that hands a raw block that is no longer needed to the release callable.
+        """
+        if self.release_ is not None:
+            try:
+                self.release_(the_block)
+
+            except Exception as the_error:
+                self.logger_.error("<{}> release failed because <{}>".format(self.name_, the_error))
+
+    def _reader_loop_(self):
+        self.logger_.debug("ENTER")
+
+        while self.running_:
+            try:
+                the_block = self.reader_()
+
+            except Exception as the_error:
+                self.logger_.error("<{}> reader failed because <{}>".format(self.name_, the_error))
+                time.sleep(0.1)
+                continue
+
+            if the_block is None:
+                #
+                # No data, the socket is closed or timed out, give the other threads a chance to run.
+                #
+                time.sleep(0.01)
+                continue
+
+            the_time = time.time()
+
+            with self.metrics_lock_:
+                self.blocks_read_ += 1
+
+            if not self._put_(self.read_queue_, (the_time, the_block)):
+                self._release_(the_block)
+
+        self.logger_.debug("LEAVE")
+
+    def _parser_loop_(self):
+        self.logger_.debug("ENTER")
+
+        while self.running_:
+            the_item = self._get_(self.read_queue_)
+
+            if the_item is None:
+                break
+
+            the_time, the_block = the_item
+
+            try:
+                the_data = self.parser_(the_block)
+
+            except Exception as the_error:
+                self.logger_.error("<{}> parser failed because <{}>".format(self.name_, the_error))
+                the_data = None
+
+            if the_data is None:
+                with self.metrics_lock_:
+                    self.blocks_dropped_ += 1
+                self._release_(the_block)
+                continue
+
+            if not self._put_(self.push_queue_, (the_data, the_time, the_block)):
+                self._release_(the_block)
+
+        self.logger_.debug("LEAVE")
+
+    def _pusher_loop_(self):
+        self.logger_.debug("ENTER")
+
+        while self.running_:
+            the_item = self._get_(self.push_queue_)
+
+            if the_item is None:
+                break
+
+            the_data, the_time, the_block = the_item
+
+            try:
+                self.pusher_(the_data, the_time)
+
+            except Exception as the_error:
+                self.logger_.error("<{}> pusher failed because <{}>".format(self.name_, the_error))
+                self._release_(the_block)
+                continue
+
+            self._release_(the_block)
+
+            with self.metrics_lock_:
+                self.blocks_pushed_ += 1
+
+        self.logger_.debug("LEAVE")
+
+    """
+    Quick element accessor methods
+    """
+    def name(self):
+        return self.name_
+
+    def running(self):
+        return self.running_
+
+    def queue_depth(self):
+        return self.queue_depth_
+
+    def read_queue_size(self):
+        """
+        Accessor method, that returns the number of raw blocks waiting for the parser stage.
+        """
+        return self.read_queue_.qsize()
+
+    def push_queue_size(self):
+        """
+        Accessor method, that returns the number of converted blocks waiting for the pusher stage.
+        """
+        return self.push_queue_.qsize()
+
+    def read_high_water(self):
+        return self.read_high_water_
+
+    def push_high_water(self):
+        return self.push_high_water_
+
+    def blocks_read(self):
+        return self.blocks_read_
+
+    def blocks_pushed(self):
+        return self.blocks_pushed_
+
+    def blocks_dropped(self):
+        return self.blocks_dropped_
+
+    def stalls(self):
+        return self.stalls_
+
+
+class StatusPoller:
+    """
+    This class keeps the status groups (RxStat, GPS, Master, ...) of a Device Controller current, by refreshing each
+    group on its own interval from a background thread, see DeviceController.refresh_status.
+
+    The cached values are read with the controller's accessors (rxstatus(), gps(), master()), which never make a
+    request, so reading the status costs nothing and never waits on the control port.
+    """
+
+    _min_wait_  = 0.05   # Fewest seconds between refreshes
+    _idle_wait_ = 1.0    # Seconds between checks when every group is disabled
+
+    def __init__(self, the_controller, the_intervals, the_on_change=None, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_controller: DeviceController object
+        :param the_intervals:  map of group name to the number of seconds between refreshes, 0 disables the group
+        :param the_on_change:  callable taking the list of groups whose values changed, called after each refresh
+        :param loglevel:       The log level to use
+
+        :raises ValueError: if a group is unknown, or an interval is negative
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.StatusPoller')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        self.controller_ = the_controller
+        self.intervals_  = {}
+        self.on_change_  = the_on_change
+
+        self.stop_event_ = threading.Event()
+        self.thread_     = None
+
+        #
+        # Metrics
+        #
+        self.polls_  = 0     # Refreshes made
+        self.errors_ = 0     # Refreshes that failed
+
+        self.set_intervals(the_intervals)
+
+        self.logger_.debug("LEAVE")
+
+    def set_intervals(self, the_intervals):
+        """
+        Use this method to change how often each group is refreshed, it takes effect on the next refresh.
+
+        :param the_intervals: map of group name to the number of seconds between refreshes, 0 disables the group
+
+        :return:
+            N/A
+
+        :raises ValueError: if a group is unknown, or an interval is negative
+        """
+        for the_group, the_interval in the_intervals.items():
+            if the_group not in Transaction._groups_:
+                raise ValueError("Unknown group <{}> requested.".format(the_group))
+
+            if the_interval < 0:
+                raise ValueError("Invalid interval <{}> requested for group <{}>.".format(the_interval, the_group))
+
+        self.intervals_ = dict(the_intervals)
+
+    def start(self):
+        """
+        Use this method to start refreshing the status.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is not None:
+            self.logger_.debug("LEAVE")
+            return
+
+        self.stop_event_.clear()
+
+        self.thread_ = threading.Thread(target=self._run_, name=self.controller_.stream_id() + "_status")
+        self.thread_.daemon = True
+        self.thread_.start()
+
+        self.logger_.debug("LEAVE")
+
+    def stop(self, the_timeout=5.0):
+        """
+        Use this method to stop refreshing the status, the last values stay cached.
+
+        :param the_timeout: The number of seconds to wait for the thread to finish
+
+        :return:
+            == True,  the thread finished
+            == False, the thread did not finish
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is None:
+            self.logger_.debug("LEAVE")
+            return True
+
+        self.stop_event_.set()
+        self.thread_.join(the_timeout)
+
+        the_result = not self.thread_.is_alive()
+
+        if not the_result:
+            self.logger_.error("Thread <{}> did not finish".format(self.thread_.name))
+
+        self.thread_ = None
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def _run_(self):
+        self.logger_.debug("ENTER")
+
+        while not self.stop_event_.is_set():
+            the_intervals = self.intervals_
+
+            try:
+                the_changed = self.controller_.refresh_status(the_intervals)
+                the_wait    = self._next_wait_(the_intervals)
+                self.polls_ += 1
+
+            except RuntimeError as the_error:
+                self.logger_.warning("Unable to refresh the status, because <{}>".format(the_error))
+                self.errors_ += 1
+
+                #
+                # The expired groups are tried again after the shortest interval, not straight away.
+                #
+                the_changed = []
+                the_wait    = min([the_interval for the_interval in the_intervals.values() if the_interval > 0] +
+                                  [self._idle_wait_])
+
+            if the_changed and self.on_change_ is not None:
+                try:
+                    self.on_change_(the_changed)
+
+                except Exception as the_error:
+                    self.logger_.error("Status callback failed because <{}>".format(the_error))
+
+            self.stop_event_.wait(max(self._min_wait_, the_wait))
+
+        self.logger_.debug("LEAVE")
+
+    def _next_wait_(self, the_intervals):
+        """
+        This is a utility method that returns the number of seconds until the next group expires.
+        """
+        the_waits = []
+
+        for the_group, the_interval in the_intervals.items():
+            if the_interval > 0:
+                the_age = self.controller_.status_age(the_group)
+                the_waits.append(0.0 if the_age is None else the_interval - the_age)
+
+        return min(the_waits) if the_waits else self._idle_wait_
+
+    """
+    Quick element accessor methods
+    """
+    def intervals(self):
+        return self.intervals_
+
+    def running(self):
+        return self.thread_ is not None
+
+    def polls(self):
+        return self.polls_
+
+    def errors(self):
+        return self.errors_
+
+
+class HopScheduler:
+    """
+    This class steps a Device Controller through a list of hops, each a (center frequency, sample rate, dwell)
+    tuple, repeating the list until stopped.
+
+    Every hop is started with the timed start of the RX group (see DeviceController.arm_start), so its first sample is
+    taken at the scheduled UTC time however late the host thread runs.  The first hop starts on the next multiple of
+    the_boundary seconds, and each later hop starts the dwell of the previous hop after it.  A hop is armed the_lead
+    seconds before it starts, which is where the data of the hop before it stops.
+
+    A hop that can not be armed before it is due is skipped, and counted as late.
+    """
+
+    def __init__(self, the_controller, the_hops, the_lead=0.25, the_boundary=1.0, the_on_hop=None,
+                 loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_controller: DeviceController object
+        :param the_hops:       list of (center frequency Hz, sample rate Hz, dwell seconds)
+        :param the_lead:       Seconds before its start time that each hop is armed
+        :param the_boundary:   The first hop starts on a multiple of this many seconds
+        :param the_on_hop:     callable taking the hop index, the hop and its start time, called once a hop is armed
+        :param loglevel:       The log level to use
+
+        :raises ValueError: if there are no hops, the lead or boundary is not positive, or a dwell is not longer than
+                            the lead
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.HopScheduler')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        if not the_hops:
+            self.logger_.debug("LEAVE")
+            raise ValueError("At least one hop is required.")
+
+        if the_lead <= 0 or the_boundary <= 0:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid lead <{}> or boundary <{}> requested.".format(the_lead, the_boundary))
+
+        for the_hop in the_hops:
+            if the_hop[2] <= the_lead:
+                self.logger_.debug("LEAVE")
+                raise ValueError("The dwell of hop <{}> must be longer than the lead <{}>.".format(the_hop, the_lead))
+
+        self.controller_ = the_controller
+        self.hops_       = list(the_hops)
+        self.lead_       = the_lead
+        self.boundary_   = the_boundary
+        self.on_hop_     = the_on_hop
+
+        self.stop_event_ = threading.Event()
+        self.thread_     = None
+
+        #
+        # Metrics
+        #
+        self.hops_armed_  = 0
+        self.hops_late_   = 0     # Hops skipped because they could not be armed before their start time
+        self.hops_failed_ = 0     # Hops the device refused
+        self.current_hop_ = -1    # Index of the last hop armed
+        self.next_start_  = 0.0   # UTC start time of the next hop
+
+        self.logger_.debug("LEAVE")
+
+    def start(self):
+        """
+        Use this method to start stepping through the hops.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is not None:
+            self.logger_.debug("LEAVE")
+            return
+
+        self.stop_event_.clear()
+
+        self.thread_ = threading.Thread(target=self._run_, name=self.controller_.stream_id() + "_hops")
+        self.thread_.daemon = True
+        self.thread_.start()
+
+        self.logger_.debug("LEAVE")
+
+    def stop(self, the_timeout=5.0):
+        """
+        Use this method to stop stepping through the hops, the device is returned to an immediate start.  The data
+        continues on the current hop.
+
+        :param the_timeout: The number of seconds to wait for the thread to finish
+
+        :return:
+            == True,  the thread finished
+            == False, the thread did not finish
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is None:
+            self.logger_.debug("LEAVE")
+            return True
+
+        self.stop_event_.set()
+        self.thread_.join(the_timeout)
+
+        the_result = not self.thread_.is_alive()
+
+        if not the_result:
+            self.logger_.error("Thread <{}> did not finish".format(self.thread_.name))
+
+        self.thread_ = None
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def _run_(self):
+        self.logger_.debug("ENTER")
+
+        the_start = math.ceil((time.time() + self.lead_) / self.boundary_) * self.boundary_
+        the_index = 0
+
+        while not self.stop_event_.is_set():
+            the_hop = self.hops_[the_index]
+            self.next_start_ = the_start
+
+            if self.stop_event_.wait(max(0.0, the_start - self.lead_ - time.time())):
+                break
+
+            if time.time() >= the_start:
+                self.logger_.warning("Hop <{}> is late, skipped".format(the_index))
+                self.hops_late_ += 1
+
+            elif not self.controller_.arm_start(the_start, the_hop[0], the_hop[1]):
+                self.hops_failed_ += 1
+
+            else:
+                self.hops_armed_  += 1
+                self.current_hop_  = the_index
+
+                if self.on_hop_ is not None:
+                    try:
+                        self.on_hop_(the_index, the_hop, the_start)
+
+                    except Exception as the_error:
+                        self.logger_.error("Hop callback failed because <{}>".format(the_error))
+
+            the_start += the_hop[2]
+            the_index  = (the_index + 1) % len(self.hops_)
+
+        self.controller_.cancel_timed_start()
+
+        self.logger_.debug("LEAVE")
+
+    """
+    Quick element accessor methods
+    """
+    def hops(self):
+        return self.hops_
+
+    def running(self):
+        return self.thread_ is not None
+
+    def hops_armed(self):
+        return self.hops_armed_
+
+    def hops_late(self):
+        return self.hops_late_
+
+    def hops_failed(self):
+        return self.hops_failed_
+
+    def current_hop(self):
+        return self.current_hop_
+
+    def next_start(self):
+        return self.next_start_
+
+
+class ConnectionSupervisor:
+    """
+    This class watches the connections of a Device Controller and rebuilds them when they are lost, see
+    DeviceController.connection_lost and DeviceController.reconnect.  The attempts are spaced by a backoff that
+    doubles after each failure, up to the_max_backoff seconds, so a daemon that is restarting is not flooded.
+
+    Each outage is measured from when it was noticed to when the data was flowing again.  The samples lost are
+    estimated from the outage and the sample rate.
+    """
+
+    def __init__(self, the_controller, the_check_interval=1.0, the_min_backoff=0.5, the_max_backoff=30.0,
+                 the_on_recover=None, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_controller:     DeviceController object
+        :param the_check_interval: Seconds between checks of the connections
+        :param the_min_backoff:    Seconds before the second attempt of an outage
+        :param the_max_backoff:    Most seconds between attempts
+        :param the_on_recover:     callable taking the outage in seconds, called once the connections are rebuilt
+        :param loglevel:           The log level to use
+
+        :raises ValueError: if the interval or a backoff is not positive, or the_min_backoff exceeds the_max_backoff
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.ConnectionSupervisor')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        if the_check_interval <= 0 or the_min_backoff <= 0 or the_min_backoff > the_max_backoff:
+            self.logger_.debug("LEAVE")
+            raise ValueError\
+                (
+                    "Invalid check interval <{}> or backoff <{}> to <{}> requested.".format
+                    (
+                        the_check_interval, the_min_backoff, the_max_backoff
+                    )
+                )
+
+        self.controller_     = the_controller
+        self.check_interval_ = the_check_interval
+        self.min_backoff_    = the_min_backoff
+        self.max_backoff_    = the_max_backoff
+        self.on_recover_     = the_on_recover
+
+        self.stop_event_ = threading.Event()
+        self.thread_     = None
+
+        #
+        # Metrics
+        #
+        self.outages_       = 0     # Outages recovered from
+        self.attempts_      = 0     # Reconnect attempts that failed
+        self.last_outage_   = 0.0   # Seconds the last outage lasted
+        self.total_outage_  = 0.0   # Seconds of all of the outages
+        self.samples_lost_  = 0     # Samples estimated lost during the outages
+        self.in_outage_     = False
+
+        self.logger_.debug("LEAVE")
+
+    def start(self):
+        """
+        Use this method to start watching the connections.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is not None:
+            self.logger_.debug("LEAVE")
+            return
+
+        self.stop_event_.clear()
+
+        self.thread_ = threading.Thread(target=self._run_, name=self.controller_.stream_id() + "_supervisor")
+        self.thread_.daemon = True
+        self.thread_.start()
+
+        self.logger_.debug("LEAVE")
+
+    def stop(self, the_timeout=5.0):
+        """
+        Use this method to stop watching the connections, an outage in progress is given up.
+
+        :param the_timeout: The number of seconds to wait for the thread to finish
+
+        :return:
+            == True,  the thread finished
+            == False, the thread did not finish
+        """
+        self.logger_.debug("ENTER")
+
+        if self.thread_ is None:
+            self.logger_.debug("LEAVE")
+            return True
+
+        self.stop_event_.set()
+        self.thread_.join(the_timeout)
+
+        the_result = not self.thread_.is_alive()
+
+        if not the_result:
+            self.logger_.error("Thread <{}> did not finish".format(self.thread_.name))
+
+        self.thread_ = None
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def _run_(self):
+        self.logger_.debug("ENTER")
+
+        while not self.stop_event_.wait(self.check_interval_):
+            if self.controller_.connection_lost():
+                self._recover_()
+
+        self.logger_.debug("LEAVE")
+
+    def _recover_(self):
+        """
+        This is a utility method that reconnects until it succeeds, or the supervisor is stopped.
+        """
+        the_start   = time.time()
+        the_backoff = self.min_backoff_
+
+        self.in_outage_ = True
+        self.logger_.warning("Connection to <{}> lost, reconnecting".format(self.controller_.stream_id()))
+
+        while True:
+            try:
+                self.controller_.reconnect()
+                break
+
+            except RuntimeError as the_error:
+                self.attempts_ += 1
+                self.logger_.warning("Unable to reconnect, because <{}>".format(the_error))
+
+            if self.stop_event_.wait(the_backoff):
+                self.in_outage_ = False
+                return
+
+            the_backoff = min(2 * the_backoff, self.max_backoff_)
+
+        the_outage = time.time() - the_start
+
+        self.outages_       += 1
+        self.last_outage_    = the_outage
+        self.total_outage_  += the_outage
+        self.samples_lost_  += int(the_outage * self.controller_.sample_rate())
+        self.in_outage_      = False
+
+        self.logger_.warning("Reconnected to <{}> after <{:.3f}> s".format(self.controller_.stream_id(), the_outage))
+
+        if self.on_recover_ is not None:
+            try:
+                self.on_recover_(the_outage)
+
+            except Exception as the_error:
+                self.logger_.error("Recover callback failed because <{}>".format(the_error))
+
+    """
+    Quick element accessor methods
+    """
+    def running(self):
+        return self.thread_ is not None
+
+    def in_outage(self):
+        return self.in_outage_
+
+    def outages(self):
+        return self.outages_
+
+    def attempts(self):
+        return self.attempts_
+
+    def last_outage(self):
+        return self.last_outage_
+
+    def total_outage(self):
+        return self.total_outage_
+
+    def samples_lost(self):
+        return self.samples_lost_
+
+    def samples_recovered(self):
+        """
+        Accessor method, that returns the number of samples received since the last outage, 0 if there has not
+        been one.
+        """
+        return self.controller_.samples_received() if self.outages_ > 0 else 0
+
+
+class SampleClock:
+    """
+    This class models the time of each sample of a data stream, so blocks can be timestamped from their position in
+    the stream instead of the time they happened to be read.  The position is the number of samples since the data
+    socket was connected.
+
+    The model is anchored to the best reference available:
+
+      DEVICEClockReference,  the device started the data at a known UTC time (timed start), the time of each sample
+                             follows from the sample rate.
+      STATUSClockReference,  a least squares fit of the host time RxStat was queried against the sample count it
+                             reported.
+      ARRIVALClockReference, a least squares fit of the host time each block was read against the position of its
+                             last sample, when nothing better is available.
+
+    Observations from a reference worse than the one in use are ignored.  The fit also measures the drift of the host
+    clock against the device sample clock, and the jitter of the observations about it.
+    """
+
+    _preference_ = {None: 0, ARRIVALClockReference: 1, STATUSClockReference: 2, DEVICEClockReference: 3}
+
+    def __init__(self, the_sample_rate=0.0, the_window=32, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_sample_rate: The nominal sample rate in Hz, 0 when not known yet
+        :param the_window:      The number of observations the fit is made over
+        :param loglevel:        The log level to use
+
+        :raises ValueError: if the_window is less than 2
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.SampleClock')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        if the_window < 2:
+            raise ValueError("Invalid window <{}> requested.".format(the_window))
+
+        self.lock_         = threading.Lock()
+        self.observations_ = collections.deque(maxlen=the_window)   # (sample position, host time)
+
+        self.reset(the_sample_rate)
+
+    def reset(self, the_sample_rate=None):
+        """
+        Use this method to forget the model, when a new data stream starts.
+
+        :param the_sample_rate: The nominal sample rate in Hz, None to keep the current one
+
+        :return:
+            N/A
+        """
+        with self.lock_:
+            if the_sample_rate is not None:
+                self.sample_rate_ = float(the_sample_rate)
+
+            self.reference_ = None
+            self.anchor_    = None   # (sample position, UTC time)
+            self.fit_       = None   # (sample position, host time, seconds per sample)
+            self.jitter_    = 0.0
+            self.observations_.clear()
+
+    def set_sample_rate(self, the_sample_rate, the_sample):
+        """
+        Use this method when the sample rate changes part way through the stream.  The model is anchored where the
+        change takes effect, at the time it predicts for that sample, and the fit starts again.
+
+        :param the_sample_rate: The new nominal sample rate in Hz
+        :param the_sample:      The position of the first sample at the new rate
+
+        :return:
+            N/A
+        """
+        the_sample_rate = float(the_sample_rate)
+
+        if the_sample_rate == self.sample_rate_:
+            return
+
+        the_time = self.time_of(the_sample)
+
+        with self.lock_:
+            self.sample_rate_ = the_sample_rate
+            self.fit_         = None
+            self.observations_.clear()
+
+            if the_time is not None:
+                self.anchor_ = (the_sample, the_time)
+
+    def anchor(self, the_sample, the_time):
+        """
+        Use this method when the device reports the time of a sample, after a timed start for instance.
+
+        :param the_sample: The position of the sample
+        :param the_time:   UTC time, in seconds since the epoch, of the sample
+
+        :return:
+            N/A
+        """
+        with self.lock_:
+            self.reference_ = DEVICEClockReference
+            self.anchor_    = (the_sample, the_time)
+            self.fit_       = None
+            self.observations_.clear()
+
+    def observe(self, the_sample, the_time, the_reference=STATUSClockReference):
+        """
+        Use this method to add an observation of the host time a sample position was reached.
+
+        :param the_sample:    The sample position
+        :param the_time:      The host time, time.time()
+        :param the_reference: STATUSClockReference or ARRIVALClockReference
+
+        :return:
+            == True,  the observation was used
+            == False, a better reference is in use
+        """
+        with self.lock_:
+            the_current = self.reference_
+
+            if the_current == DEVICEClockReference and the_reference == STATUSClockReference:
+                #
+                # The device time is used, the status observations only measure the drift and jitter.
+                #
+                pass
+
+            elif self._preference_[the_reference] < self._preference_[the_current]:
+                return False
+
+            elif the_reference != the_current:
+                self.reference_ = the_reference
+                self.observations_.clear()
+
+            self.observations_.append((the_sample, the_time))
+            self._fit_()
+
+        return True
+
+    def _fit_(self):
+        """
+        This is a utility method that fits a line through the observations.
+
+        NOTE:
+            The caller must hold the lock_.
+        """
+        if len(self.observations_) < 2:
+            self.fit_ = None
+            return
+
+        the_origin_sample, the_origin_time = self.observations_[0]
+
+        x = numpy.array([the_sample - the_origin_sample for the_sample, _ in self.observations_], dtype=numpy.float64)
+        y = numpy.array([the_time - the_origin_time for _, the_time in self.observations_], dtype=numpy.float64)
+
+        dx = x - x.mean()
+        dy = y - y.mean()
+
+        the_spread = numpy.dot(dx, dx)
+
+        if the_spread == 0:
+            self.fit_ = None
+            return
+
+        the_slope = numpy.dot(dx, dy) / the_spread
+
+        self.fit_    = (the_origin_sample + x.mean(), the_origin_time + y.mean(), the_slope)
+        self.jitter_ = float(numpy.sqrt(numpy.mean((dy - the_slope * dx) ** 2)))
+
+    def time_of(self, the_sample):
+        """
+        Use this method to obtain the time of a sample.
+
+        :param the_sample: The sample position
+
+        :return:
+            == None, there is no reference yet
+            != None, UTC time, in seconds since the epoch, of the sample
+        """
+        with self.lock_:
+            if self.anchor_ is not None and (self.reference_ == DEVICEClockReference or self.fit_ is None):
+                the_sample_reference, the_time_reference = self.anchor_
+                the_period = 1.0 / self.sample_rate_ if self.sample_rate_ > 0 else 0.0
+
+            elif self.fit_ is not None:
+                the_sample_reference, the_time_reference, the_period = self.fit_
+
+            elif self.observations_ and self.sample_rate_ > 0:
+                the_sample_reference, the_time_reference = self.observations_[-1]
+                the_period = 1.0 / self.sample_rate_
+
+            else:
+                return None
+
+        return the_time_reference + (the_sample - the_sample_reference) * the_period
+
+    """
+    Quick element accessor methods
+    """
+    def sample_rate(self):
+        return self.sample_rate_
+
+    def reference(self):
+        return self.reference_
+
+    def observations(self):
+        return len(self.observations_)
+
+    def drift(self):
+        """
+        Accessor method, that returns how fast the host clock runs against the device sample clock, in parts per
+        million, 0.0 until there are enough observations.
+        """
+        the_fit = self.fit_
+
+        if the_fit is None or self.sample_rate_ <= 0:
+            return 0.0
+
+        return (the_fit[2] * self.sample_rate_ - 1.0) * 1.0e6
+
+    def jitter(self):
+        """
+        Accessor method, that returns the RMS in seconds of the observations about the fit.
+        """
+        return self.jitter_
+
+
+class SriCache:
+    """
+    This class keeps the content of the SRI last pushed for a tuner, so the SRI is only rebuilt where it changed and
+    only pushed when its content changed.
+
+    The content is made of header fields (streamID, xdelta, mode, ...) and keywords.  A keyword whose value is a
+    dictionary, GEOLOCATION_GPS for instance, is a structured keyword holding a keyword per entry.  Each keyword
+    is converted once, with the_converter, and the converted keyword is reused until its value changes.
+
+    The volatile entries of a structured keyword, the time of the GPS fix for instance, do not make the content
+    change by themselves, they are only refreshed when something else in the keyword changes.
+    """
+
+    def __init__(self, the_converter=None, the_volatile=(), loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_converter: Function taking (keyword id, value) and returning the keyword as it is pushed,
+                              CF.DataType for instance.  A structured keyword is given the list of its converted
+                              entries as its value.  By default the keyword is kept as a (keyword id, value) tuple.
+        :param the_volatile:  The ids of the entries of structured keywords that are volatile
+        :param loglevel:      The log level to use
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.SriCache')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.converter_ = the_converter if the_converter is not None else lambda the_id, the_value: (the_id, the_value)
+        self.volatile_  = frozenset(the_volatile)
+
+        self.lock_      = threading.Lock()
+        self.pushes_    = 0
+        self.unchanged_ = 0
+
+        self.reset()
+
+    def reset(self):
+        """
+        Use this method to forget the content, when a new stream starts, so the next update is pushed.
+
+        :return:
+            N/A
+        """
+        with self.lock_:
+            self.header_    = None
+            self.contents_  = collections.OrderedDict()   # keyword id -> value compared
+            self.converted_ = collections.OrderedDict()   # keyword id -> converted keyword
+
+    def _content_(self, the_value):
+        """
+        This is a utility method that returns the part of a keyword value that is compared.
+        """
+        if isinstance(the_value, dict):
+            return tuple(sorted((key, value) for key, value in the_value.items() if key not in self.volatile_))
+
+        return the_value
+
+    def _convert_(self, the_id, the_value):
+        """
+        This is a utility method that converts a keyword, and the entries of a structured keyword.
+        """
+        if isinstance(the_value, dict):
+            the_value = [self.converter_(key, the_value[key]) for key in sorted(the_value.keys())]
+
+        return self.converter_(the_id, the_value)
+
+    def update(self, the_header, the_keywords):
+        """
+        Use this method each time the SRI may have changed.  Only the keywords whose value changed are converted
+        again, the keywords no longer present are dropped.
+
+        :param the_header:   map of SRI header field to value
+        :param the_keywords: list of (keyword id, value), in the order they are pushed
+
+        :return:
+            list of the header fields and keyword ids that changed, empty when the SRI does not need to be pushed
+        """
+        with self.lock_:
+            the_changes = []
+
+            if self.header_ is None:
+                the_changes.extend(sorted(the_header.keys()))
+            else:
+                the_changes.extend(key for key in sorted(the_header.keys()) if self.header_.get(key) != the_header[key])
+
+            the_ids = [the_id for the_id, _ in the_keywords]
+
+            for the_id in list(self.contents_.keys()):
+                if the_id not in the_ids:
+                    del self.contents_[the_id]
+                    del self.converted_[the_id]
+                    the_changes.append(the_id)
+
+            for the_id, the_value in the_keywords:
+                the_content = self._content_(the_value)
+
+                if the_id in self.contents_ and self.contents_[the_id] == the_content:
+                    continue
+
+                self.contents_[the_id]  = the_content
+                self.converted_[the_id] = self._convert_(the_id, the_value)
+                the_changes.append(the_id)
+
+            #
+            # Keep the keywords in the order given, new keywords were added at the end.
+            #
+            if list(self.converted_.keys()) != the_ids:
+                self.contents_  = collections.OrderedDict((the_id, self.contents_[the_id]) for the_id in the_ids)
+                self.converted_ = collections.OrderedDict((the_id, self.converted_[the_id]) for the_id in the_ids)
+
+            self.header_ = dict(the_header)
+
+            if the_changes:
+                self.pushes_ += 1
+                self.logger_.debug("SRI changed <{}>".format(the_changes))
+            else:
+                self.unchanged_ += 1
+
+        return the_changes
+
+    """
+    Quick element accessor methods
+    """
+    def header(self):
+        return self.header_
+
+    def keywords(self):
+        """
+        Accessor method, that returns the converted keywords, in the order they are pushed.
+
+        :return: list
+        """
+        with self.lock_:
+            return list(self.converted_.values())
+
+    def pushes(self):
+        return self.pushes_
+
+    def unchanged(self):
+        return self.unchanged_
+
+
+class DataEngine:
+    """
+    This class reads the data sockets of any number of Device Controllers from a single thread, using select.epoll.
+
+    The thread sleeps in epoll until at least one data socket is readable, then moves the data already waiting on
+    each ready socket into the block being filled for that Device Controller (see read_ready_block).  Completed
+    blocks are handed to the parser stage of the Device Controller's DataPipeline, which is created without a
+    reader.  Only the ready sockets are serviced and no socket is ever waited on, so a slow tuner can not hold up
+    the others.
+
+    When a DataPipeline's read queue is full, the completed block is held and the socket is taken out of the epoll
+    interest set, the held blocks are offered again every _hold_retry_ seconds until they are queued.  This is the
+    only time epoll is called with a timeout.
+    """
+
+    _hold_retry_ = 0.01
+
+    def __init__(self, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param loglevel: The log level to use
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.DataEngine')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        self.lock_      = threading.Lock()
+        self.epoll_     = None
+        self.wake_pipe_ = None     # (read fd, write fd) used to wake the thread from epoll
+        self.entries_   = {}       # data socket fd -> [DeviceController, DataPipeline, held (time, block) or None]
+        self.running_   = False
+        self.thread_    = None
+
+        #
+        # Metrics
+        #
+        self.wakeups_     = 0      # Number of times epoll returned
+        self.blocks_read_ = 0
+        self.holds_       = 0      # Number of blocks held because the read queue was full
+
+        self.logger_.debug("LEAVE")
+
+    def __str__(self):
+        """
+        Helper function to display human readable representation of object.
+
+        :return:
+            A string representing the object
+        """
+        the_string = "DataEngine:\n"\
+                     "  running:       {}\n"\
+                     "  sockets:       {}\n"\
+                     "  wakeups:       {}\n"\
+                     "  blocks read:   {}\n"\
+                     "  holds:         {}"\
+                     .format\
+                        (
+                            self.running_,
+                            len(self.entries_),
+                            self.wakeups_,
+                            self.blocks_read_,
+                            self.holds_
+                        )
+
+        return the_string
+
+    def start(self):
+        """
+        Use this method to start the engine thread.
+
+        :return:
+            N/A
+        """
+        self.logger_.debug("ENTER")
+
+        with self.lock_:
+            if self.running_:
+                self.logger_.debug("LEAVE")
+                return
+
+            self.epoll_     = select.epoll()
+            self.wake_pipe_ = os.pipe()
+            self.epoll_.register(self.wake_pipe_[0], select.EPOLLIN)
+
+            for the_fd in self.entries_:
+                try:
+                    self.epoll_.register(the_fd, select.EPOLLIN)
+
+                except (IOError, OSError) as the_error:
+                    self.logger_.warning("register of <{}> failed because <{}>".format(the_fd, the_error))
+
+            self.running_ = True
+
+            self.thread_ = threading.Thread(target=self._run_, name="AVS4000_data_engine")
+            self.thread_.daemon = True
+            self.thread_.start()
+
+        self.logger_.debug("LEAVE")
+
+    def stop(self, the_timeout=2.0):
+        """
+        Use this method to stop the engine thread, any held blocks are released.  The Device Controllers remain
+        registered, calling start again resumes servicing them.
+
+        :param the_timeout: The number of seconds to wait for the thread to finish
+
+        :return:
+            == True,  the thread finished
+            == False, the thread did not finish
+        """
+        self.logger_.debug("ENTER")
+
+        with self.lock_:
+            if not self.running_:
+                self.logger_.debug("LEAVE")
+                return True
+
+            self.running_ = False
+            self._wake_()
+
+        the_result = True
+
+        self.thread_.join(the_timeout)
+
+        if self.thread_.is_alive():
+            self.logger_.error("Thread <{}> did not finish".format(self.thread_.name))
+            the_result = False
+
+        with self.lock_:
+            self.thread_ = None
+
+            for the_entry in self.entries_.values():
+                self._release_held_(the_entry)
+
+            self.epoll_.close()
+            os.close(self.wake_pipe_[0])
+            os.close(self.wake_pipe_[1])
+
+            self.epoll_     = None
+            self.wake_pipe_ = None
+
+        self.logger_.debug("LEAVE")
+        return the_result
+
+    def add(self, the_controller, the_pipeline):
+        """
+        Use this method to have the engine read the data socket of the_controller into the_pipeline.  The data
+        socket must be connected, see DeviceController.enable, and the_pipeline created without a reader.
+
+        :param the_controller: DeviceController object
+        :param the_pipeline:   DataPipeline object receiving the blocks read
+
+        :return:
+            == True,  the data socket was registered
+            == False, the data socket is not connected
+        """
+        self.logger_.debug("ENTER")
+
+        the_fd = the_controller.data_fileno()
+
+        if the_fd is None:
+            self.logger_.debug("LEAVE")
+            return False
+
+        self.remove(the_controller)
+
+        with self.lock_:
+            self.entries_[the_fd] = [the_controller, the_pipeline, None]
+
+            if self.epoll_ is not None:
+                self.epoll_.register(the_fd, select.EPOLLIN)
+
+        self.logger_.debug("LEAVE")
+        return True
+
+    def remove(self, the_controller):
+        """
+        Use this method to stop reading the data socket of the_controller, this must be done before the data socket
+        is closed.  Any held block is released.
+
+        :param the_controller: DeviceController object
+
+        :return:
+            == True,  the data socket was registered
+            == False, the_controller was not registered
+        """
+        self.logger_.debug("ENTER")
+
+        with self.lock_:
+            for the_fd, the_entry in self.entries_.items():
+                if the_entry[0] is the_controller:
+                    break
+            else:
+                self.logger_.debug("LEAVE")
+                return False
+
+            del self.entries_[the_fd]
+
+            self._release_held_(the_entry)
+
+            if self.epoll_ is not None:
+                self._unregister_(the_fd)
+
+        self.logger_.debug("LEAVE")
+        return True
+
+    def _wake_(self):
+        """
+        This is a utility method that wakes the engine thread from epoll.
+        """
+        try:
+            os.write(self.wake_pipe_[1], "x")
+
+        except OSError:
+            pass
+
+    def _unregister_(self, the_fd):
+        """
+        This is a utility method that removes the_fd from epoll, ignoring an fd that was already closed.
+        """
+        try:
+            self.epoll_.unregister(the_fd)
+
+        except (IOError, OSError, ValueError) as the_error:
+            self.logger_.debug("unregister of <{}> failed because <{}>".format(the_fd, the_error))
+
+    def _release_held_(self, the_entry):
+        """
+        This is a utility method that returns the block held for an entry to its Device Controller.
+        """
+        if the_entry[2] is not None:
+            the_entry[0].release_buffer(the_entry[2][1])
+            the_entry[2] = None
+
+    def _run_(self):
+        self.logger_.debug("ENTER")
+
+        while self.running_:
+            with self.lock_:
+                the_held = any(the_entry[2] is not None for the_entry in self.entries_.values())
+
+            try:
+                the_events = self.epoll_.poll(self._hold_retry_ if the_held else -1)
+
+            except IOError as the_error:
+                if the_error.errno == errno.EINTR:
+                    continue
+
+                self.logger_.error("epoll failed because <{}>".format(the_error))
+                break
+
+            with self.lock_:
+                if not self.running_:
+                    break
+
+                self.wakeups_ += 1
+
+                for the_fd, the_event in the_events:
+                    if the_fd == self.wake_pipe_[0]:
+                        os.read(the_fd, 4096)
+                        continue
+
+                    the_entry = self.entries_.get(the_fd)
+
+                    if the_entry is None or the_entry[2] is not None:
+                        continue
+
+                    self._service_(the_fd, the_entry, the_event)
+
+                self._offer_held_()
+
+        self.logger_.debug("LEAVE")
+
+    def _service_(self, the_fd, the_entry, the_event):
+        """
+        This is a utility method that reads a ready data socket, and hands the block to the pipeline once full.
+
+        NOTE:
+            The caller must hold the lock_.
+        """
+        the_controller, the_pipeline, _ = the_entry
+
+        try:
+            the_block = the_controller.read_ready_block()
+
+        except Exception as the_error:
+            self.logger_.error("<{}> read failed because <{}>".format(the_controller.stream_id(), the_error))
+            the_block = None
+
+        if the_block is None:
+            if the_event & (select.EPOLLHUP | select.EPOLLERR):
+                #
+                # The socket will be reported ready for as long as it is registered, stop servicing it until the
+                # tuner is enabled again.
+                #
+                self.logger_.warning("<{}> data socket closed".format(the_controller.stream_id()))
+                self._unregister_(the_fd)
+            return
+
+        self.blocks_read_ += 1
+
+        the_time = time.time()
+
+        if the_pipeline.offer(the_block, the_time):
+            return
+
+        if not the_pipeline.running():
+            the_controller.release_buffer(the_block)
+            return
+
+        self.holds_ += 1
+        the_entry[2] = (the_time, the_block)
+        self.epoll_.modify(the_fd, 0)
+
+    def _offer_held_(self):
+        """
+        This is a utility method that offers the held blocks to their pipelines again, and resumes reading the
+        sockets whose block was queued.
+
+        NOTE:
+            The caller must hold the lock_.
+        """
+        for the_fd, the_entry in self.entries_.items():
+            if the_entry[2] is None:
+                continue
+
+            the_time, the_block = the_entry[2]
+
+            if not the_entry[1].offer(the_block, the_time):
+                if the_entry[1].running():
+                    continue
+
+                the_entry[0].release_buffer(the_block)
+
+            the_entry[2] = None
+            self.epoll_.modify(the_fd, select.EPOLLIN)
+
+    """
+    Quick element accessor methods
+    """
+    def running(self):
+        return self.running_
+
+    def sockets(self):
+        return len(self.entries_)
+
+    def wakeups(self):
+        return self.wakeups_
+
+    def blocks_read(self):
+        return self.blocks_read_
+
+    def holds(self):
+        return self.holds_
+
+
+class DeviceFleet:
+    """
+    This class runs the control and data operations of many Device Controllers concurrently.
+
+    A Device Controller handles one command and reply at a time on its control socket, so the commands sent to the
+    controllers of a fleet are spread over a set of worker threads, one command per controller at a time.  A status
+    sweep or a retune of every tuner takes about as long as the slowest controller, instead of the sum of all of them.
+
+    The data of every controller with a connected data socket can be consumed from a single loop with iter_data,
+    the data sockets are read by a DataEngine.
+    """
+
+    def __init__(self, the_controllers, the_workers=16, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_controllers: map of key to DeviceController object, as returned by DeviceManager.get_controllers
+        :param the_workers:     The maximum number of commands in progress at one time
+        :param loglevel:        The log level to use
+
+        :raises ValueError: if the_workers is less than 1
+        """
+        self.logger_ = logging.getLogger('AVS4000Transceiver.DeviceFleet')
+        if not self.logger_.handlers:
+            ch = logging.StreamHandler()
+            formatter = logging.Formatter(MODULE_LOG_FORMAT)
+            ch.setFormatter(formatter)
+            self.logger_.addHandler(ch)
+        self.logger_.setLevel(loglevel)
+        self.logger_.propagate = False
+
+        self.logger_.debug("ENTER")
+
+        if the_workers < 1:
+            self.logger_.debug("LEAVE")
+            raise ValueError("Invalid number of workers <{}> requested.".format(the_workers))
+
+        self.controllers_ = the_controllers
+        self.workers_     = the_workers
+        self.loglevel_    = loglevel
+
+        self.logger_.debug("LEAVE")
+
+    def run(self, the_method, the_arguments=None):
+        """
+        Use this method to call a DeviceController method on the controllers of the fleet concurrently, returning
+        once every call has finished.
+
+        :param the_method:    The name of the DeviceController method to call
+        :param the_arguments: == None, the method is called with no arguments on every controller
+                              != None, map of key to tuple of arguments, only these controllers are called
+
+        :return:
+            Tuple of two elements:
+                Item 1: map of key to the value returned by the method
+                Item 2: map of key to the exception raised by the method
+        """
+        self.logger_.debug("ENTER, method <{}>".format(the_method))
+
+        if the_arguments is None:
+            the_arguments = dict((the_key, ()) for the_key in self.controllers_)
+
+        the_work    = Queue.Queue()
+        the_results = {}
+        the_errors  = {}
+
+        for the_key, the_args in the_arguments.items():
+            the_work.put((the_key, the_args))
+
+        the_threads = []
+
+        for index in range(min(self.workers_, len(the_arguments))):
+            the_thread = threading.Thread\
+                (
+                    target=self._worker_,
+                    name="AVS4000_fleet_{}".format(index),
+                    args=(the_method, the_work, the_results, the_errors)
+                )
+            the_thread.daemon = True
+            the_thread.start()
+            the_threads.append(the_thread)
+
+        for the_thread in the_threads:
+            the_thread.join()
+
+        for the_key, the_error in the_errors.items():
+            self.logger_.error("<{}> on <{}> failed because <{}>".format(the_method, the_key, the_error))
+
+        self.logger_.debug("LEAVE")
+        return the_results, the_errors
+
+    def _worker_(self, the_method, the_work, the_results, the_errors):
+        """
+        This is a utility method that makes the calls queued on the_work until there are none left.
+
+        NOTE:
+            Each key is only on the_work once, so the maps are never updated for the same key by two threads.
+        """
+        while True:
+            try:
+                the_key, the_args = the_work.get_nowait()
+
+            except Queue.Empty:
+                return
+
+            try:
+                the_results[the_key] = getattr(self.controllers_[the_key], the_method)(*the_args)
+
+            except Exception as the_error:
+                the_errors[the_key] = the_error
+
+    def setup(self):
+        return self.run("setup")
+
+    def teardown(self):
+        return self.run("teardown")
+
+    def enable(self):
+        return self.run("enable")
+
+    def disable(self):
+        return self.run("disable")
+
+    def query_rx(self):
+        return self.run("query_rx")
+
+    def query_rxstat(self):
+        return self.run("query_rxstat")
+
+    def query_gps(self):
+        return self.run("query_gps")
+
+    def query_master(self):
+        return self.run("query_master")
+
+    def set_tune(self, the_tunings):
+        """
+        Use this method to tune several controllers at once.
+
+        :param the_tunings: map of key to tuple of (center frequency, bandwidth, sample rate), see
+                            DeviceController.set_tune
+
+        :return:
+            See run
+        """
+        return self.run("set_tune", the_tunings)
+
+    def iter_data(self, the_queue_depth=4):
+        """
+        This generator yields the data of every controller whose data socket is connected, see
+        DeviceController.enable, in the order it arrives.  The data is converted as by convert_data_block, on a
+        DataPipeline per controller.
+
+        Notes:
+          The data is only valid until the next item is requested, its buffer is then returned to the buffer pool.
+          Copy the data to keep it longer.
+
+          The data sockets are released when the generator is closed.
+
+        :param the_queue_depth: The queue depth of the DataPipeline of each controller
+
+        :return:
+            Tuples of (key, data, time the block was read)
+        """
+        self.logger_.debug("ENTER")
+
+        the_engine    = DataEngine(self.loglevel_)
+        the_ready     = Queue.Queue()
+        the_closed    = threading.Event()
+        the_pipelines = []
+
+        for the_key, the_controller in sorted(self.controllers_.items()):
+            if the_controller.data_fileno() is None:
+                self.logger_.debug("<{}> data socket not connected".format(the_key))
+                continue
+
+            the_controller.set_buffer_pool_capacity(2 * the_queue_depth + 3)
+
+            the_pipeline = DataPipeline\
+                (
+                    the_controller.stream_id(),
+                    None,
+                    the_controller.convert_data_block,
+                    functools.partial(self._hand_over_, the_ready, the_closed, the_key),
+                    the_queue_depth=the_queue_depth,
+                    the_release=the_controller.release_buffer,
+                    loglevel=self.loglevel_
+                )
+
+            the_pipeline.start()
+            the_engine.add(the_controller, the_pipeline)
+            the_pipelines.append(the_pipeline)
+
+        if not the_pipelines:
+            self.logger_.debug("LEAVE")
+            return
+
+        the_engine.start()
+
+        try:
+            while True:
+                the_key, the_data, the_time, the_done = the_ready.get()
+
+                try:
+                    yield the_key, the_data, the_time
+
+                finally:
+                    the_done.set()
+
+        finally:
+            the_closed.set()
+            the_engine.stop()
+
+            for the_controller in self.controllers_.values():
+                the_engine.remove(the_controller)
+
+            for the_pipeline in the_pipelines:
+                the_pipeline.stop()
+
+            self.logger_.debug("LEAVE")
+
+    @staticmethod
+    def _hand_over_(the_ready, the_closed, the_key, the_data, the_time):
+        """
+        This is a utility method used as the pusher of the iter_data pipelines.  It waits until the consumer is done
+        with the data, so the buffer is not released while it is still in use.
+        """
+        the_done = threading.Event()
+        the_ready.put((the_key, the_data, the_time, the_done))
+
+        while not the_done.wait(0.1):
+            if the_closed.is_set():
+                return
+
+    """
+    Quick element accessor methods
+    """
+    def controllers(self):
+        return self.controllers_
+
+    def workers(self):
+        return self.workers_
+
 
 if __name__ == '__main__':
     the_dm = DeviceManager()
@@ -42,6 +42,23 @@ class enums:
         class output_endian:
             BIG = "BIG_Endian"
             LITTLE = "LITTLE_Endian"
+    
+        # Enumerated values for avs4000_output_configuration::block_mode
+        class block_mode:
+            FIXED = "FIXED_Block"
+            AUTO = "AUTO_Block"
+
+    # Enumerated values for avs4000_data_reader
+    class avs4000_data_reader:
+        EPOLL = "EPOLL_Reader"
+        THREAD = "THREAD_Reader"
+
+    # Enumerated values for avs4000_gap_policy
+    class avs4000_gap_policy:
+        IGNORE = "IGNORE_Gaps"
+        ZERO_FILL = "ZERO_FILL_Gaps"
+        HOLD_LAST = "HOLD_LAST_Gaps"
+        SPLIT = "SPLIT_Gaps"
 
 class AVS4000_base(CF__POA.Device, FrontendTunerDevice, digital_tuner_delegation, rfinfo_delegation, ThreadedComponent):
         # These values can be altered in the __init__ of your derived class
@@ -223,13 +240,49 @@ class AVS4000_base(CF__POA.Device, FrontendTunerDevice, digital_tuner_delegation
                                             defvalue="LITTLE_Endian"
                                             )
         
-            def __init__(self, tuner_number=0, output_format="COMPLEX_Format", output_source="TCP_Source", output_endian="LITTLE_Endian"):
+            block_mode = simple_property(
+                                         id_="avs4000_output_configuration::block_mode",
+                                         
+                                         name="block_mode",
+                                         type_="string",
+                                         defvalue="FIXED_Block"
+                                         )
+        
+            block_packets = simple_property(
+                                            id_="avs4000_output_configuration::block_packets",
+                                            
+                                            name="block_packets",
+                                            type_="ulong",
+                                            defvalue=64
+                                            )
+        
+            block_latency = simple_property(
+                                            id_="avs4000_output_configuration::block_latency",
+                                            
+                                            name="block_latency",
+                                            type_="double",
+                                            defvalue=50.0
+                                            )
+        
+            bulk_receive = simple_property(
+                                           id_="avs4000_output_configuration::bulk_receive",
+                                           
+                                           name="bulk_receive",
+                                           type_="boolean",
+                                           defvalue=False
+                                           )
+        
+            def __init__(self, tuner_number=0, output_format="COMPLEX_Format", output_source="TCP_Source", output_endian="LITTLE_Endian", block_mode="FIXED_Block", block_packets=64, block_latency=50.0, bulk_receive=False):
 
                 #print("--> avs4000_output_configuration___struct.__init__()")
                 self.tuner_number  = tuner_number
                 self.output_format = output_format
                 self.output_source = output_source
                 self.output_endian = output_endian
+                self.block_mode    = block_mode
+                self.block_packets = block_packets
+                self.block_latency = block_latency
+                self.bulk_receive  = bulk_receive
                 #print("<-- avs4000_output_configuration___struct.__init__()")
         
             def __str__(self):
@@ -239,6 +292,10 @@ class AVS4000_base(CF__POA.Device, FrontendTunerDevice, digital_tuner_delegation
                 d["output_format"] = self.output_format
                 d["output_source"] = self.output_source
                 d["output_endian"] = self.output_endian
+                d["block_mode"] = self.block_mode
+                d["block_packets"] = self.block_packets
+                d["block_latency"] = self.block_latency
+                d["bulk_receive"] = self.bulk_receive
                 return str(d)
         
             @classmethod
@@ -250,14 +307,670 @@ class AVS4000_base(CF__POA.Device, FrontendTunerDevice, digital_tuner_delegation
                 return True
         
             def getMembers(self):
-                return [("tuner_number",self.tuner_number),("output_format",self.output_format),("output_source",self.output_source),("output_endian",self.output_endian)]
+                return [("tuner_number",self.tuner_number),("output_format",self.output_format),("output_source",self.output_source),("output_endian",self.output_endian),("block_mode",self.block_mode),("block_packets",self.block_packets),("block_latency",self.block_latency),("bulk_receive",self.bulk_receive)]
 
         avs4000_output_configuration = structseq_property(id_="avs4000_output_configuration",
                                                           structdef=avs4000_output_configuration___struct,
-                                                          defvalue=[avs4000_output_configuration___struct(tuner_number=0,output_format="VITA49_Format",output_source="TCP_Source",output_endian="LITTLE_Endian")],
+                                                          defvalue=[avs4000_output_configuration___struct(tuner_number=0,output_format="VITA49_Format",output_source="TCP_Source",output_endian="LITTLE_Endian",block_mode="FIXED_Block",block_packets=64,block_latency=50.0,bulk_receive=False)],
                                                           configurationkind=("property",),
                                                           mode="readwrite")
 
+        avs4000_pipeline_depth = simple_property(id_="avs4000_pipeline_depth",
+                                                 type_="ulong",
+                                                 defvalue=4,
+                                                 mode="readwrite",
+                                                 action="external",
+                                                 kinds=("property",),
+                                                 description="""The maximum number of blocks waiting between the reader, parser and pusher threads of each tuner. A value of 0 disables the threads and the data is read by process(). Takes effect the next time a tuner is enabled.""")
+
+        avs4000_data_reader = simple_property(id_="avs4000_data_reader",
+                                              type_="string",
+                                              defvalue="EPOLL_Reader",
+                                              mode="readwrite",
+                                              action="external",
+                                              kinds=("property",),
+                                              description="""How the data sockets of the tuners are read when avs4000_pipeline_depth is not 0. EPOLL reads every data socket from a single thread that only services the sockets with data waiting, THREAD uses a reader thread per tuner. Takes effect the next time a tuner is enabled.""")
+
+        avs4000_gap_policy = simple_property(id_="avs4000_gap_policy",
+                                             type_="string",
+                                             defvalue="IGNORE_Gaps",
+                                             mode="readwrite",
+                                             action="external",
+                                             kinds=("property",),
+                                             description="""How packets missing from the Vita49 stream of each tuner are handled, found from their frame count and timestamps. IGNORE joins the payloads either side of the gap, so the samples after it are mistimed. ZERO_FILL and HOLD_LAST replace the missing samples by zeros or by the sample before them, so the samples after the gap keep their time. SPLIT starts a new block with its own timestamp after the gap, and pushes an SRI with the AVS4000_GAP_COUNT and AVS4000_GAP_SAMPLES keywords. Gaps longer than a second, or where the time goes backwards, are always split unless the policy is IGNORE.""")
+
+        avs4000_rxstat_interval = simple_property(id_="avs4000_rxstat_interval",
+                                                  type_="double",
+                                                  defvalue=1.0,
+                                                  mode="readwrite",
+                                                  action="external",
+                                                  kinds=("property",),
+                                                  description="""Seconds between refreshes of the RX status (gain, overflows) of each enabled tuner, 0 disables the refresh. The gain of frontend_tuner_status follows the RX status.""")
+
+        avs4000_gps_interval = simple_property(id_="avs4000_gps_interval",
+                                               type_="double",
+                                               defvalue=10.0,
+                                               mode="readwrite",
+                                               action="external",
+                                               kinds=("property",),
+                                               description="""Seconds between refreshes of the GPS of each enabled tuner, 0 disables the refresh. The GEOLOCATION_GPS keywords of the SRI are pushed again when the position changes.""")
+
+        avs4000_master_interval = simple_property(id_="avs4000_master_interval",
+                                                  type_="double",
+                                                  defvalue=10.0,
+                                                  mode="readwrite",
+                                                  action="external",
+                                                  kinds=("property",),
+                                                  description="""Seconds between refreshes of the Master group (sample clock) of each enabled tuner, 0 disables the refresh.""")
+
+        avs4000_tune_window = simple_property(id_="avs4000_tune_window",
+                                              type_="double",
+                                              defvalue=20.0,
+                                              mode="readwrite",
+                                              action="external",
+                                              kinds=("property",),
+                                              description="""Milliseconds that setTunerCenterFrequency and setTunerOutputSampleRate requests are merged for. The requests made within the window of the first are sent as a single retune with the latest values, and return without waiting for it. A retune that is refused is logged and the tuner status returned to the confirmed values. 0 makes each request before returning, raising BadParameterException when it is refused.""")
+
+        class avs4000_pipeline_status___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_pipeline_status::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            queue_depth = simple_property(
+                                          id_="avs4000_pipeline_status::queue_depth",
+                                          
+                                          name="queue_depth",
+                                          type_="ulong",
+                                          defvalue=0
+                                          )
+        
+            read_queue_size = simple_property(
+                                              id_="avs4000_pipeline_status::read_queue_size",
+                                              
+                                              name="read_queue_size",
+                                              type_="ulong",
+                                              defvalue=0
+                                              )
+        
+            push_queue_size = simple_property(
+                                              id_="avs4000_pipeline_status::push_queue_size",
+                                              
+                                              name="push_queue_size",
+                                              type_="ulong",
+                                              defvalue=0
+                                              )
+        
+            read_high_water = simple_property(
+                                              id_="avs4000_pipeline_status::read_high_water",
+                                              
+                                              name="read_high_water",
+                                              type_="ulong",
+                                              defvalue=0
+                                              )
+        
+            push_high_water = simple_property(
+                                              id_="avs4000_pipeline_status::push_high_water",
+                                              
+                                              name="push_high_water",
+                                              type_="ulong",
+                                              defvalue=0
+                                              )
+        
+            blocks_read = simple_property(
+                                          id_="avs4000_pipeline_status::blocks_read",
+                                          
+                                          name="blocks_read",
+                                          type_="ulonglong",
+                                          defvalue=0
+                                          )
+        
+            blocks_pushed = simple_property(
+                                            id_="avs4000_pipeline_status::blocks_pushed",
+                                            
+                                            name="blocks_pushed",
+                                            type_="ulonglong",
+                                            defvalue=0
+                                            )
+        
+            blocks_dropped = simple_property(
+                                             id_="avs4000_pipeline_status::blocks_dropped",
+                                             
+                                             name="blocks_dropped",
+                                             type_="ulonglong",
+                                             defvalue=0
+                                             )
+        
+            stalls = simple_property(
+                                     id_="avs4000_pipeline_status::stalls",
+                                     
+                                     name="stalls",
+                                     type_="ulonglong",
+                                     defvalue=0
+                                     )
+        
+            pool_buffers = simple_property(
+                                           id_="avs4000_pipeline_status::pool_buffers",
+                                           
+                                           name="pool_buffers",
+                                           type_="ulong",
+                                           defvalue=0
+                                           )
+        
+            pool_in_use = simple_property(
+                                          id_="avs4000_pipeline_status::pool_in_use",
+                                          
+                                          name="pool_in_use",
+                                          type_="ulong",
+                                          defvalue=0
+                                          )
+        
+            pool_exhausted = simple_property(
+                                             id_="avs4000_pipeline_status::pool_exhausted",
+                                             
+                                             name="pool_exhausted",
+                                             type_="ulonglong",
+                                             defvalue=0
+                                             )
+        
+            def __init__(self, tuner_number=0, queue_depth=0, read_queue_size=0, push_queue_size=0, read_high_water=0, push_high_water=0, blocks_read=0, blocks_pushed=0, blocks_dropped=0, stalls=0, pool_buffers=0, pool_in_use=0, pool_exhausted=0):
+                self.tuner_number = tuner_number
+                self.queue_depth = queue_depth
+                self.read_queue_size = read_queue_size
+                self.push_queue_size = push_queue_size
+                self.read_high_water = read_high_water
+                self.push_high_water = push_high_water
+                self.blocks_read = blocks_read
+                self.blocks_pushed = blocks_pushed
+                self.blocks_dropped = blocks_dropped
+                self.stalls = stalls
+                self.pool_buffers = pool_buffers
+                self.pool_in_use = pool_in_use
+                self.pool_exhausted = pool_exhausted
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["queue_depth"] = self.queue_depth
+                d["read_queue_size"] = self.read_queue_size
+                d["push_queue_size"] = self.push_queue_size
+                d["read_high_water"] = self.read_high_water
+                d["push_high_water"] = self.push_high_water
+                d["blocks_read"] = self.blocks_read
+                d["blocks_pushed"] = self.blocks_pushed
+                d["blocks_dropped"] = self.blocks_dropped
+                d["stalls"] = self.stalls
+                d["pool_buffers"] = self.pool_buffers
+                d["pool_in_use"] = self.pool_in_use
+                d["pool_exhausted"] = self.pool_exhausted
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_pipeline_status::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("queue_depth",self.queue_depth),("read_queue_size",self.read_queue_size),("push_queue_size",self.push_queue_size),("read_high_water",self.read_high_water),("push_high_water",self.push_high_water),("blocks_read",self.blocks_read),("blocks_pushed",self.blocks_pushed),("blocks_dropped",self.blocks_dropped),("stalls",self.stalls),("pool_buffers",self.pool_buffers),("pool_in_use",self.pool_in_use),("pool_exhausted",self.pool_exhausted)]
+
+        avs4000_pipeline_status = structseq_property(id_="avs4000_pipeline_status",
+                                                     structdef=avs4000_pipeline_status___struct,
+                                                     defvalue=[],
+                                                     configurationkind=("property",),
+                                                     mode="readonly")
+
+        class avs4000_retune_status___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_retune_status::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            retunes = simple_property(
+                                      id_="avs4000_retune_status::retunes",
+                                      
+                                      name="retunes",
+                                      type_="ulong",
+                                      defvalue=0
+                                      )
+        
+            last_latency = simple_property(
+                                           id_="avs4000_retune_status::last_latency",
+                                           
+                                           name="last_latency",
+                                           type_="double",
+                                           defvalue=0.0
+                                           )
+        
+            max_latency = simple_property(
+                                          id_="avs4000_retune_status::max_latency",
+                                          
+                                          name="max_latency",
+                                          type_="double",
+                                          defvalue=0.0
+                                          )
+        
+            coalesced = simple_property(
+                                        id_="avs4000_retune_status::coalesced",
+                                        
+                                        name="coalesced",
+                                        type_="ulong",
+                                        defvalue=0
+                                        )
+        
+            def __init__(self, tuner_number=0, retunes=0, last_latency=0.0, max_latency=0.0, coalesced=0):
+                self.tuner_number = tuner_number
+                self.retunes = retunes
+                self.last_latency = last_latency
+                self.max_latency = max_latency
+                self.coalesced = coalesced
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["retunes"] = self.retunes
+                d["last_latency"] = self.last_latency
+                d["max_latency"] = self.max_latency
+                d["coalesced"] = self.coalesced
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_retune_status::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("retunes",self.retunes),("last_latency",self.last_latency),("max_latency",self.max_latency),("coalesced",self.coalesced)]
+
+        avs4000_retune_status = structseq_property(id_="avs4000_retune_status",
+                                                   structdef=avs4000_retune_status___struct,
+                                                   defvalue=[],
+                                                   configurationkind=("property",),
+                                                   mode="readonly")
+
+        class avs4000_hop_plan___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_hop_plan::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            center_frequency = simple_property(
+                                               id_="avs4000_hop_plan::center_frequency",
+                                               
+                                               name="center_frequency",
+                                               type_="double",
+                                               defvalue=0.0
+                                               )
+        
+            sample_rate = simple_property(
+                                          id_="avs4000_hop_plan::sample_rate",
+                                          
+                                          name="sample_rate",
+                                          type_="double",
+                                          defvalue=0.0
+                                          )
+        
+            dwell = simple_property(
+                                    id_="avs4000_hop_plan::dwell",
+                                    
+                                    name="dwell",
+                                    type_="double",
+                                    defvalue=0.0
+                                    )
+        
+            def __init__(self, tuner_number=0, center_frequency=0.0, sample_rate=0.0, dwell=0.0):
+                self.tuner_number = tuner_number
+                self.center_frequency = center_frequency
+                self.sample_rate = sample_rate
+                self.dwell = dwell
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["center_frequency"] = self.center_frequency
+                d["sample_rate"] = self.sample_rate
+                d["dwell"] = self.dwell
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_hop_plan::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("center_frequency",self.center_frequency),("sample_rate",self.sample_rate),("dwell",self.dwell)]
+
+        avs4000_hop_plan = structseq_property(id_="avs4000_hop_plan",
+                                              structdef=avs4000_hop_plan___struct,
+                                              defvalue=[],
+                                              configurationkind=("property",),
+                                              mode="readwrite")
+
+        class avs4000_reconnect_status___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_reconnect_status::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            outages = simple_property(
+                                      id_="avs4000_reconnect_status::outages",
+                                      
+                                      name="outages",
+                                      type_="ulong",
+                                      defvalue=0
+                                      )
+        
+            in_outage = simple_property(
+                                        id_="avs4000_reconnect_status::in_outage",
+                                        
+                                        name="in_outage",
+                                        type_="boolean",
+                                        defvalue=False
+                                        )
+        
+            last_outage = simple_property(
+                                          id_="avs4000_reconnect_status::last_outage",
+                                          
+                                          name="last_outage",
+                                          type_="double",
+                                          defvalue=0.0
+                                          )
+        
+            total_outage = simple_property(
+                                           id_="avs4000_reconnect_status::total_outage",
+                                           
+                                           name="total_outage",
+                                           type_="double",
+                                           defvalue=0.0
+                                           )
+        
+            samples_lost = simple_property(
+                                           id_="avs4000_reconnect_status::samples_lost",
+                                           
+                                           name="samples_lost",
+                                           type_="ulonglong",
+                                           defvalue=0
+                                           )
+        
+            samples_recovered = simple_property(
+                                                id_="avs4000_reconnect_status::samples_recovered",
+                                                
+                                                name="samples_recovered",
+                                                type_="ulonglong",
+                                                defvalue=0
+                                                )
+        
+            def __init__(self, tuner_number=0, outages=0, in_outage=False, last_outage=0.0, total_outage=0.0, samples_lost=0, samples_recovered=0):
+                self.tuner_number = tuner_number
+                self.outages = outages
+                self.in_outage = in_outage
+                self.last_outage = last_outage
+                self.total_outage = total_outage
+                self.samples_lost = samples_lost
+                self.samples_recovered = samples_recovered
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["outages"] = self.outages
+                d["in_outage"] = self.in_outage
+                d["last_outage"] = self.last_outage
+                d["total_outage"] = self.total_outage
+                d["samples_lost"] = self.samples_lost
+                d["samples_recovered"] = self.samples_recovered
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_reconnect_status::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("outages",self.outages),("in_outage",self.in_outage),("last_outage",self.last_outage),("total_outage",self.total_outage),("samples_lost",self.samples_lost),("samples_recovered",self.samples_recovered)]
+
+        avs4000_reconnect_status = structseq_property(id_="avs4000_reconnect_status",
+                                                      structdef=avs4000_reconnect_status___struct,
+                                                      defvalue=[],
+                                                      configurationkind=("property",),
+                                                      mode="readonly")
+
+        class avs4000_clock_status___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_clock_status::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            reference = simple_property(
+                                        id_="avs4000_clock_status::reference",
+                                        
+                                        name="reference",
+                                        type_="string",
+                                        defvalue=""
+                                        )
+        
+            drift = simple_property(
+                                    id_="avs4000_clock_status::drift",
+                                    
+                                    name="drift",
+                                    type_="double",
+                                    defvalue=0.0
+                                    )
+        
+            jitter = simple_property(
+                                     id_="avs4000_clock_status::jitter",
+                                     
+                                     name="jitter",
+                                     type_="double",
+                                     defvalue=0.0
+                                     )
+        
+            observations = simple_property(
+                                           id_="avs4000_clock_status::observations",
+                                           
+                                           name="observations",
+                                           type_="ulong",
+                                           defvalue=0
+                                           )
+        
+            def __init__(self, tuner_number=0, reference="", drift=0.0, jitter=0.0, observations=0):
+                self.tuner_number = tuner_number
+                self.reference = reference
+                self.drift = drift
+                self.jitter = jitter
+                self.observations = observations
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["reference"] = self.reference
+                d["drift"] = self.drift
+                d["jitter"] = self.jitter
+                d["observations"] = self.observations
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_clock_status::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("reference",self.reference),("drift",self.drift),("jitter",self.jitter),("observations",self.observations)]
+
+        avs4000_clock_status = structseq_property(id_="avs4000_clock_status",
+                                                  structdef=avs4000_clock_status___struct,
+                                                  defvalue=[],
+                                                  configurationkind=("property",),
+                                                  mode="readonly")
+
+        class avs4000_continuity_status___struct(object):
+            tuner_number = simple_property(
+                                           id_="avs4000_continuity_status::tuner_number",
+                                           
+                                           name="tuner_number",
+                                           type_="long",
+                                           defvalue=0
+                                           )
+        
+            packets = simple_property(
+                                      id_="avs4000_continuity_status::packets",
+                                      
+                                      name="packets",
+                                      type_="ulonglong",
+                                      defvalue=0
+                                      )
+        
+            dropped_packets = simple_property(
+                                              id_="avs4000_continuity_status::dropped_packets",
+                                              
+                                              name="dropped_packets",
+                                              type_="ulonglong",
+                                              defvalue=0
+                                              )
+        
+            dropped_samples = simple_property(
+                                              id_="avs4000_continuity_status::dropped_samples",
+                                              
+                                              name="dropped_samples",
+                                              type_="ulonglong",
+                                              defvalue=0
+                                              )
+        
+            gaps = simple_property(
+                                   id_="avs4000_continuity_status::gaps",
+                                   
+                                   name="gaps",
+                                   type_="ulong",
+                                   defvalue=0
+                                   )
+        
+            packet_count_errors = simple_property(
+                                                  id_="avs4000_continuity_status::packet_count_errors",
+                                                  
+                                                  name="packet_count_errors",
+                                                  type_="ulong",
+                                                  defvalue=0
+                                                  )
+        
+            loss_rate = simple_property(
+                                        id_="avs4000_continuity_status::loss_rate",
+                                        
+                                        name="loss_rate",
+                                        type_="double",
+                                        defvalue=0.0
+                                        )
+        
+            last_gap_time = simple_property(
+                                            id_="avs4000_continuity_status::last_gap_time",
+                                            
+                                            name="last_gap_time",
+                                            type_="double",
+                                            defvalue=0.0
+                                            )
+        
+            gaps_concealed = simple_property(
+                                             id_="avs4000_continuity_status::gaps_concealed",
+                                             
+                                             name="gaps_concealed",
+                                             type_="ulong",
+                                             defvalue=0
+                                             )
+        
+            samples_concealed = simple_property(
+                                                id_="avs4000_continuity_status::samples_concealed",
+                                                
+                                                name="samples_concealed",
+                                                type_="ulonglong",
+                                                defvalue=0
+                                                )
+        
+            blocks_split = simple_property(
+                                           id_="avs4000_continuity_status::blocks_split",
+                                           
+                                           name="blocks_split",
+                                           type_="ulong",
+                                           defvalue=0
+                                           )
+        
+            def __init__(self, tuner_number=0, packets=0, dropped_packets=0, dropped_samples=0, gaps=0, packet_count_errors=0, loss_rate=0.0, last_gap_time=0.0, gaps_concealed=0, samples_concealed=0, blocks_split=0):
+                self.tuner_number = tuner_number
+                self.packets = packets
+                self.dropped_packets = dropped_packets
+                self.dropped_samples = dropped_samples
+                self.gaps = gaps
+                self.packet_count_errors = packet_count_errors
+                self.loss_rate = loss_rate
+                self.last_gap_time = last_gap_time
+                self.gaps_concealed = gaps_concealed
+                self.samples_concealed = samples_concealed
+                self.blocks_split = blocks_split
+        
+            def __str__(self):
+                """Return a string representation of this structure"""
+                d = {}
+                d["tuner_number"] = self.tuner_number
+                d["packets"] = self.packets
+                d["dropped_packets"] = self.dropped_packets
+                d["dropped_samples"] = self.dropped_samples
+                d["gaps"] = self.gaps
+                d["packet_count_errors"] = self.packet_count_errors
+                d["loss_rate"] = self.loss_rate
+                d["last_gap_time"] = self.last_gap_time
+                d["gaps_concealed"] = self.gaps_concealed
+                d["samples_concealed"] = self.samples_concealed
+                d["blocks_split"] = self.blocks_split
+                return str(d)
+        
+            @classmethod
+            def getId(cls):
+                return "avs4000_continuity_status::"
+        
+            @classmethod
+            def isStruct(cls):
+                return True
+        
+            def getMembers(self):
+                return [("tuner_number",self.tuner_number),("packets",self.packets),("dropped_packets",self.dropped_packets),("dropped_samples",self.dropped_samples),("gaps",self.gaps),("packet_count_errors",self.packet_count_errors),("loss_rate",self.loss_rate),("last_gap_time",self.last_gap_time),("gaps_concealed",self.gaps_concealed),("samples_concealed",self.samples_concealed),("blocks_split",self.blocks_split)]
+
+        avs4000_continuity_status = structseq_property(id_="avs4000_continuity_status",
+                                                       structdef=avs4000_continuity_status___struct,
+                                                       defvalue=[],
+                                                       configurationkind=("property",),
+                                                       mode="readonly")
+
 
 
         # Rebind tuner status property with custom struct definition
@@ -1,5 +1,9 @@
 import struct
 import logging
+import math
+import fractions
+import collections
+import numpy
 
 """
 This file is specific to the AVS4000
@@ -17,6 +21,24 @@ VRT_OFFSET          = 8 # Number of bytes from start of frame VRT Header is loca
 VRT_PAYLOAD_OFFSET = 28 # Number of bytes from start of VRL + VRT frame payload in bytes.
 
 VRT_PACKET_SIZE    = 8192
+VRT_PAYLOAD_SHORTS = 4080 # Number of signed 16bit values between the VRT Header and the VEND trailer.
+
+#
+# The values of the VRT TSI (integer seconds timestamp) and TSF (fractional seconds timestamp) fields.
+#
+TSI_NONE  = 0x0 # No integer seconds timestamp
+TSI_UTC   = 0x1 # Seconds since 1970-01-01 UTC
+TSI_GPS   = 0x2 # Seconds since 1980-01-06 GPS time
+TSI_OTHER = 0x3 # Seconds since an epoch agreed with the device
+
+TSF_NONE         = 0x0 # No fractional seconds timestamp
+TSF_SAMPLE_COUNT = 0x1 # Samples since the start of the integer second
+TSF_REAL_TIME    = 0x2 # Picoseconds since the start of the integer second
+TSF_FREE_RUNNING = 0x3 # Samples since an arbitrary epoch, not tied to the integer second
+
+PICOSECONDS_PER_SECOND = 1000000000000
+GPS_EPOCH_OFFSET       = 315964800 # Seconds from 1970-01-01 to 1980-01-06
+GPS_LEAP_SECONDS       = 18        # Leap seconds GPS time is ahead of UTC, as of 2017-01-01
 
 class VRL:
     """
@@ -358,18 +380,33 @@ class Vita49DataPacket:
     This object encapsulates a the VRL, VRT and Payload components of a Vita49.0/1 packet.
     It is intended to provide a way to treat the extracted information from a data stream
     as a single object.
+
+    The payload is either a list of signed 16bit values, or a NumPy int16 array.  When a NumPy array is provided
+    it is stored as is, which allows the payload to be a view straight over the receive buffer.
     """
-    def __init__(self, the_vrl, the_vrt_header, the_payload_tuple):
+    def __init__(self, the_vrl, the_vrt_header, the_payload_tuple, the_timestamps=None, the_gap=0, the_lead=0):
         """
         Constructor
         :param the_vrl:           This is a Vita49.VRL object
         :param the_vrt_header:    This is a Vita49.VRT object
         :param the_payload_tuple: This is the payload extracted from the data stream as a tuple of
-                                  signed 16Bit values.
+                                  signed 16Bit values, or a NumPy int16 array (not copied).
+        :param the_timestamps:    This is the Vita49.Vita49Timestamps of the packets the payload came from, or None
+        :param the_gap:           This is the number of complex samples missing just before the payload, -1 when the
+                                  stream was discontinuous but the number is not known.
+        :param the_lead:          This is the number of complex samples placed in front of the payload of the first
+                                  packet, to conceal the samples missing before it.
         """
         self.vrl_        = the_vrl
         self.vrt_header_ = the_vrt_header
-        self.payload_    = list(the_payload_tuple)
+        self.timestamps_ = the_timestamps
+        self.gap_        = the_gap
+        self.lead_       = the_lead
+
+        if isinstance(the_payload_tuple, numpy.ndarray):
+            self.payload_ = the_payload_tuple
+        else:
+            self.payload_ = list(the_payload_tuple)
 
     def vrl(self):
         """
@@ -391,20 +428,940 @@ class Vita49DataPacket:
         """
         Accessor method to obtain the payload
 
-        :return: A list of 16bit unsigned shorts.
+        :return: A list of 16bit signed shorts, or a NumPy int16 array.
         """
         return self.payload_
 
+    def timestamps(self):
+        """
+        Accessor method to obtain the timestamps of the packets the payload came from, one per packet.
+
+        :return: Vita49.Vita49Timestamps object, or None when they were not decoded.
+        """
+        return self.timestamps_
+
+    def gap(self):
+        """
+        Accessor method to obtain the number of complex samples missing just before the payload, that were not
+        concealed.
+
+        :return: integer, 0 when the payload follows on from the previous one, -1 when the number is not known.
+        """
+        return self.gap_
+
+    def lead_samples(self):
+        """
+        Accessor method to obtain the number of complex samples the payload starts with, before the first sample of
+        the first packet.  The payload starts that many samples before the first timestamp.
+
+        :return: integer
+        """
+        return self.lead_
+
+    def complex_payload(self):
+        """
+        Accessor method to obtain the payload as I/Q pairs.
+
+        NOTE:
+            When the payload is a NumPy array the result is a view, no data is copied.
+
+        :return: NumPy int16 array with the shape (number of samples, 2), column 0 is I and column 1 is Q.
+        """
+        return numpy.asarray(self.payload_, dtype=numpy.int16).reshape(-1, 2)
+
     def extend(self, the_tuple):
         """
         Use this method to extend the payload list with additional items.
         Written to specifically extend the array with the results from struct.unpack.
 
+        NOTE:
+            When the payload is a NumPy array, this will allocate a new array.  Prefer filling a preallocated
+            array and passing it to the constructor.
+
         :param the_tuple: The tuple of complex values, where I and Q are signed short 16bit values.
 
         :return:  N/A
         """
-        self.payload_.extend(the_tuple)
+        if isinstance(self.payload_, numpy.ndarray):
+            self.payload_ = numpy.concatenate((self.payload_, numpy.asarray(the_tuple, dtype=self.payload_.dtype)))
+        else:
+            self.payload_.extend(the_tuple)
+
+
+def packet_dtype(the_byte_order=LITTLE_ENDIAN):
+    """
+    Use this function to obtain the NumPy structured data type that overlays a single AVS4000 Vita49.0/1 packet
+    (VRL + VRT Header + Payload + VEND) of VRT_PACKET_SIZE bytes.
+
+    :param the_byte_order: The byte order of the 32bit words and 16bit samples in the packet.
+
+    :return: numpy.dtype
+    """
+    if the_byte_order == LITTLE_ENDIAN:
+        the_prefix = "<"
+    else:
+        the_prefix = ">"
+
+    the_dtype = numpy.dtype\
+        (
+            [
+                ("faw",       the_prefix + "u4"),
+                ("fcfs",      the_prefix + "u4"),
+                ("header",    the_prefix + "u4"),
+                ("stream_id", the_prefix + "u4"),
+                ("ist",       the_prefix + "u4"),
+                ("fst_msw",   the_prefix + "u4"),
+                ("fst_lsw",   the_prefix + "u4"),
+                ("payload",   the_prefix + "i2", (VRT_PAYLOAD_SHORTS,)),
+                ("vend",      the_prefix + "u4")
+            ]
+        )
+
+    assert the_dtype.itemsize == VRT_PACKET_SIZE
+
+    return the_dtype
+
+_packet_dtypes_ = \
+    {
+        LITTLE_ENDIAN: packet_dtype(LITTLE_ENDIAN),
+        BIG_ENDIAN:    packet_dtype(BIG_ENDIAN)
+    }
+
+
+def _rate_fraction_(the_sample_rate):
+    """
+    This is a utility function that returns the sample rate as the fraction numerator / denominator, with a
+    numerator small enough (< 2**31) that the timestamp math in _samples_to_time_ fits in 64 bits.
+
+    :param the_sample_rate: The sample rate in Hz, Master.realSampleRate for instance
+
+    :return: tuple of (numerator, denominator)
+
+    :raises ValueError: if the_sample_rate is not positive
+    """
+    if the_sample_rate <= 0:
+        raise ValueError("Invalid sample rate <{}> requested.".format(the_sample_rate))
+
+    the_limit    = max(1, (2 ** 31 - 1) // int(math.ceil(the_sample_rate)))
+    the_fraction = fractions.Fraction(the_sample_rate).limit_denominator(the_limit)
+
+    return the_fraction.numerator, the_fraction.denominator
+
+def _samples_to_time_(the_counts, the_sample_rate):
+    """
+    This is a utility function that converts sample counts into whole seconds and picoseconds, using integer math
+    only so the result does not drift with the count.
+
+    :param the_counts:      NumPy array of uint64 sample counts
+    :param the_sample_rate: The sample rate in Hz
+
+    :return: tuple of NumPy uint64 arrays (seconds, picoseconds)
+    """
+    the_numerator, the_denominator = _rate_fraction_(the_sample_rate)
+
+    n = numpy.uint64(the_numerator)
+    d = numpy.uint64(the_denominator)
+    q = numpy.uint64(PICOSECONDS_PER_SECOND // the_numerator)
+    r = numpy.uint64(PICOSECONDS_PER_SECOND % the_numerator)
+
+    #
+    # seconds = counts * d / n, split so no product exceeds 2**62.
+    #
+    the_scaled      = (the_counts % n) * d
+    the_seconds     = (the_counts // n) * d + the_scaled // n
+    the_remainder   = the_scaled % n
+    the_picoseconds = the_remainder * q + (the_remainder * r) // n
+
+    return the_seconds, the_picoseconds
+
+class Vita49Timestamps:
+    """
+    This object holds the exact time of the first sample of each packet of a Vita49PacketBlock, see
+    Vita49PacketBlock.timestamps.  The time is kept as integer seconds and integer picoseconds, so the difference
+    between two packets is exact.
+    """
+
+    def __init__(self, the_integer_seconds, the_picoseconds, the_valid):
+        """
+        Constructor
+
+        :param the_integer_seconds: NumPy int64 array, seconds since 1970-01-01 UTC
+        :param the_picoseconds:     NumPy int64 array, picoseconds since the integer second (< 10**12)
+        :param the_valid:           NumPy bool array, True where the time is related to UTC
+        """
+        self.integer_seconds_ = the_integer_seconds
+        self.picoseconds_     = the_picoseconds
+        self.valid_           = the_valid
+
+    def __len__(self):
+        return len(self.integer_seconds_)
+
+    def __getitem__(self, the_index):
+        """
+        Use this method to obtain the timestamps of a range of packets.
+
+        :param the_index: A slice, or the index of a single packet
+
+        :return: Vita49Timestamps object
+        """
+        if not isinstance(the_index, slice):
+            the_index = slice(the_index, the_index + 1)
+
+        return Vita49Timestamps\
+            (
+                self.integer_seconds_[the_index], self.picoseconds_[the_index], self.valid_[the_index]
+            )
+
+    def integer_seconds(self):
+        """
+        Accessor method, that returns the whole seconds of each packet.
+
+        :return: numpy array of int64
+        """
+        return self.integer_seconds_
+
+    def picoseconds(self):
+        """
+        Accessor method, that returns the picoseconds since the whole second of each packet.
+
+        :return: numpy array of int64
+        """
+        return self.picoseconds_
+
+    def fractional_seconds(self):
+        """
+        Accessor method, that returns the fraction of a second of each packet.
+
+        :return: numpy array of float64
+        """
+        return self.picoseconds_ / float(PICOSECONDS_PER_SECOND)
+
+    def valid(self):
+        """
+        Accessor method, that returns which timestamps are related to UTC, the TSI is UTC or GPS and the TSF is not
+        free running.
+
+        :return: numpy array of bool
+        """
+        return self.valid_
+
+    def is_valid(self):
+        """
+        Use this method to determine if every timestamp is related to UTC.
+
+        :return:
+            == True,  all timestamps valid
+            == False, one or more timestamps invalid.
+        """
+        return bool(self.valid_.all())
+
+    def elapsed(self):
+        """
+        Use this method to obtain the picoseconds from the first packet to each packet.
+
+        :return: numpy array of int64
+        """
+        if len(self.integer_seconds_) == 0:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        return (self.integer_seconds_ - self.integer_seconds_[0]) * PICOSECONDS_PER_SECOND \
+            + (self.picoseconds_ - self.picoseconds_[0])
+
+    def time(self, the_index=0):
+        """
+        Use this method to obtain the time of a single packet, in the form taken by bulkio.timestamp.create.
+
+        :param the_index: The index of the packet.
+
+        :return: tuple of (integer seconds, fractional seconds as a float)
+        """
+        return int(self.integer_seconds_[the_index]), int(self.picoseconds_[the_index]) / float(PICOSECONDS_PER_SECOND)
+
+class Vita49PacketBlock:
+    """
+    This object decodes the VRL, VRT Header and VEND trailer of every packet contained in a receive buffer in a
+    single vectorized pass.  The buffer is mapped as a NumPy structured array, so no data is copied and no per packet
+    objects are created.  Each accessor returns a NumPy array with one element per packet.
+    """
+
+    def __init__(self, the_buffer, the_byte_order=LITTLE_ENDIAN, the_number_packets=None, the_offset=0, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_buffer:          A bytearray (or any object supporting the buffer interface, e.g. a packet
+                                    array) containing one or more back to back Vita49.0/1 packets.
+        :param the_byte_order:      The byte order to use when decoding the packets.
+        :param the_number_packets:  The number of packets to decode, None decodes every complete packet in the buffer.
+        :param the_offset:          The number of bytes from the start of the_buffer the first packet is located.
+        :param loglevel:            The loglevel to use for the object.
+        """
+        self.logger_ = logging.getLogger('Vita49.Vita49PacketBlock')
+        self.logger_.setLevel(loglevel)
+
+        self.logger_.debug("--> __init__()")
+
+        if the_number_packets is None:
+            if isinstance(the_buffer, numpy.ndarray):
+                the_number_packets = (the_buffer.nbytes - the_offset) / VRT_PACKET_SIZE
+            else:
+                the_number_packets = (len(the_buffer) - the_offset) / VRT_PACKET_SIZE
+
+        self.format_  = the_byte_order
+        self.packets_ = numpy.frombuffer\
+            (
+                the_buffer,
+                dtype=_packet_dtypes_[the_byte_order],
+                count=the_number_packets,
+                offset=the_offset
+            )
+
+        self.logger_.debug("<-- __init__()")
+
+    def __len__(self):
+        return len(self.packets_)
+
+    def number_packets(self):
+        """
+        Accessor method, that returns the number of packets decoded.
+
+        :return: integer
+        """
+        return len(self.packets_)
+
+    def packets(self):
+        """
+        Accessor method, that returns the underlying structured array.
+
+        :return: numpy.ndarray using the dtype returned by packet_dtype()
+        """
+        return self.packets_
+
+    def faw(self):
+        """
+        Accessor method, that returns the FAW of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["faw"]
+
+    def frame_count(self):
+        """
+        Accessor method, that returns the VRL frame count of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["fcfs"] >> VRL._frame_count_shift_
+
+    def frame_size(self):
+        """
+        Accessor method, that returns the VRL frame size (32bit words) of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["fcfs"] & VRL._frame_size_bit_mask_
+
+    def header(self):
+        """
+        Accessor method, that returns the first 32bit word of the VRT Header of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["header"]
+
+    def tsi(self):
+        """
+        Accessor method, that returns the tsi field of each packet.
+
+        :return: numpy array of uint32
+        """
+        return (self.packets_["header"] & VRT._tsi_mask_) >> VRT._tsi_shift_
+
+    def tsf(self):
+        """
+        Accessor method, that returns the tsf field of each packet.
+
+        :return: numpy array of uint32
+        """
+        return (self.packets_["header"] & VRT._tsf_mask_) >> VRT._tsf_shift_
+
+    def packet_count(self):
+        """
+        Accessor method, that returns the 4bit packet_count field of each packet.
+
+        :return: numpy array of uint32
+        """
+        return (self.packets_["header"] & VRT._pkt_count_mask_) >> VRT._pkt_count_shift_
+
+    def packet_size(self):
+        """
+        Accessor method, that returns the packet_size field of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["header"] & VRT._pkt_size_mask_
+
+    def stream_id(self):
+        """
+        Accessor method, that returns the stream_id field of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["stream_id"]
+
+    def integer_seconds_timestamp(self):
+        """
+        Accessor method, that returns the integer seconds timestamp of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["ist"]
+
+    def fractional_seconds_timestamp_msw(self):
+        """
+        Accessor method, that returns the fractional seconds timestamp msw of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["fst_msw"]
+
+    def fractional_seconds_timestamp_lsw(self):
+        """
+        Accessor method, that returns the fractional seconds timestamp lsw of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["fst_lsw"]
+
+    def fractional_seconds_timestamp(self):
+        """
+        Accessor method, that returns the 64bit fractional seconds timestamp (msw, lsw) of each packet.
+
+        :return: numpy array of uint64
+        """
+        return (self.packets_["fst_msw"].astype(numpy.uint64) << numpy.uint64(32)) \
+            | self.packets_["fst_lsw"].astype(numpy.uint64)
+
+    def timestamps(self, the_sample_rate, the_leap_seconds=GPS_LEAP_SECONDS):
+        """
+        Use this method to decode the time of the first sample of every packet in a single vectorized pass.  The
+        TSI and TSF fields of each packet select how its timestamp is decoded:
+
+          TSI UTC, the integer seconds are used as is.  TSI GPS, they are moved to UTC using the_leap_seconds.
+          TSI other/none, the integer seconds (0 for none) are used as is and the timestamp is not valid.
+
+          TSF sample count, the 64bit fractional timestamp is the number of samples since the integer second.
+          TSF real time, it is the number of picoseconds since the integer second.
+          TSF free running, it is the number of samples since the device's epoch, the integer seconds are ignored
+          and the timestamp is not valid.  TSF none, the fraction is 0.
+
+        A fraction of a second or more is carried into the integer seconds.
+
+        :param the_sample_rate:  The sample rate in Hz, use Master.realSampleRate which is the rate the samples
+                                 are counted at.
+        :param the_leap_seconds: The number of seconds GPS time is ahead of UTC
+
+        :return: Vita49Timestamps object
+
+        :raises ValueError: if the_sample_rate is not positive and a packet counts samples
+        """
+        the_tsi        = self.tsi()
+        the_tsf        = self.tsf()
+        the_fractional = self.fractional_seconds_timestamp()
+
+        the_seconds     = numpy.where(the_tsi == TSI_NONE, 0, self.packets_["ist"]).astype(numpy.uint64)
+        the_picoseconds = numpy.zeros(len(self.packets_), dtype=numpy.uint64)
+
+        the_counted = (the_tsf == TSF_SAMPLE_COUNT) | (the_tsf == TSF_FREE_RUNNING)
+
+        if the_counted.any():
+            the_count_seconds, the_count_picoseconds = _samples_to_time_(the_fractional, the_sample_rate)
+
+            the_seconds     = numpy.where(the_tsf == TSF_FREE_RUNNING, the_count_seconds, the_seconds)
+            the_seconds     = numpy.where(the_tsf == TSF_SAMPLE_COUNT, the_seconds + the_count_seconds, the_seconds)
+            the_picoseconds = numpy.where(the_counted, the_count_picoseconds, the_picoseconds)
+
+        the_real_time = the_tsf == TSF_REAL_TIME
+
+        if the_real_time.any():
+            the_second      = numpy.uint64(PICOSECONDS_PER_SECOND)
+            the_seconds     = numpy.where(the_real_time, the_seconds + the_fractional // the_second, the_seconds)
+            the_picoseconds = numpy.where(the_real_time, the_fractional % the_second, the_picoseconds)
+
+        the_seconds = the_seconds.astype(numpy.int64)
+        the_seconds[the_tsi == TSI_GPS] += GPS_EPOCH_OFFSET - the_leap_seconds
+
+        the_valid = ((the_tsi == TSI_UTC) | (the_tsi == TSI_GPS)) & (the_tsf != TSF_FREE_RUNNING)
+
+        return Vita49Timestamps(the_seconds, the_picoseconds.astype(numpy.int64), the_valid)
+
+    def vend(self):
+        """
+        Accessor method, that returns the VEND trailer of each packet.
+
+        :return: numpy array of uint32
+        """
+        return self.packets_["vend"]
+
+    def payload(self):
+        """
+        Accessor method, that returns the payload of each packet as a view into the buffer.
+
+        :return: numpy array of int16 with the shape (number_packets, VRT_PAYLOAD_SHORTS)
+        """
+        return self.packets_["payload"]
+
+    def valid(self):
+        """
+        Use this method to validate the FAW, packet_size and VEND of every packet.
+
+        :return: numpy array of bool, True where the packet is valid.
+        """
+        the_mask  = self.packets_["faw"] == VRL.EXPECTED_FAW
+        the_mask &= self.packets_["vend"] == VRL.EXPECTED_FEND
+        the_mask &= (self.packets_["header"] & VRT._pkt_size_mask_) == VRT.EXPECTED_PACKET_SIZE
+
+        return the_mask
+
+    def is_valid(self):
+        """
+        Use this method to determine if every packet in the block is valid.
+
+        :return:
+            == True,  all packets valid
+            == False, one or more packets invalid.
+        """
+        return bool(self.valid().all())
+
+    def vrl(self, the_index):
+        """
+        Use this method to obtain a Vita49.VRL object for a single packet.
+
+        :param the_index: The index of the packet.
+
+        :return: Vita49.VRL object
+        """
+        the_bytes = self.packets_[the_index:the_index + 1].view(numpy.uint8)
+        return VRL(the_bytes[VRL_OFFSET:VRL_OFFSET + VRL.SIZE].tobytes(), self.format_)
+
+    def vrt(self, the_index):
+        """
+        Use this method to obtain a Vita49.VRT object for a single packet.
+
+        :param the_index: The index of the packet.
+
+        :return: Vita49.VRT object
+        """
+        the_bytes = self.packets_[the_index:the_index + 1].view(numpy.uint8)
+        return VRT(the_bytes[VRT_OFFSET:VRT_OFFSET + VRT.HDR_SIZE].tobytes(), self.format_)
+
+
+class Vita49Synchronizer:
+    """
+    Use this object to locate the complete and valid Vita49.0/1 packets in a byte stream that is not guaranteed to
+    start on a packet boundary, e.g. after the daemon has overflowed.  The stream is searched for the VRL FAW (VRLP)
+    using vectorized comparisons, and every candidate is validated using its packet_size and VEND trailer.
+    """
+
+    def __init__(self, the_byte_order=LITTLE_ENDIAN, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_byte_order: The byte order of the 32bit words in the stream.
+        :param loglevel:       The loglevel to use for the object.
+        """
+        self.logger_ = logging.getLogger('Vita49.Vita49Synchronizer')
+        self.logger_.setLevel(loglevel)
+
+        self.logger_.debug("--> __init__()")
+
+        if the_byte_order == LITTLE_ENDIAN:
+            the_format = "<"
+            the_size_offset = VRT_OFFSET        # packet_size is the low 16 bits of the VRT header word.
+        else:
+            the_format = ">"
+            the_size_offset = VRT_OFFSET + 2
+
+        self.format_       = the_byte_order
+        self.faw_bytes_    = numpy.frombuffer(struct.pack(the_format + "I", VRL.EXPECTED_FAW), dtype=numpy.uint8)
+        self.fend_bytes_   = numpy.frombuffer(struct.pack(the_format + "I", VRL.EXPECTED_FEND), dtype=numpy.uint8)
+        self.size_bytes_   = numpy.frombuffer(struct.pack(the_format + "H", VRT.EXPECTED_PACKET_SIZE), dtype=numpy.uint8)
+        self.size_offset_  = the_size_offset
+
+        self.synchronized_  = True
+        self.bytes_skipped_ = 0
+        self.resync_events_ = 0
+
+        self.logger_.debug("<-- __init__()")
+
+    def __str__(self):
+        the_string = \
+            "synchronized   <{0}>\n"\
+            "bytes_skipped  <{1}>\n"\
+            "resync_events  <{2}>\n"\
+            .format\
+                (
+                    self.synchronized_,
+                    self.bytes_skipped_,
+                    self.resync_events_
+                )
+        return the_string
+
+    @staticmethod
+    def _match_(the_bytes, the_positions, the_pattern):
+        """
+        Utility method, returns True for every position where the_pattern is found in the_bytes.
+        """
+        the_mask = the_bytes[the_positions] == the_pattern[0]
+
+        for index in range(1, len(the_pattern)):
+            the_mask &= the_bytes[the_positions + index] == the_pattern[index]
+
+        return the_mask
+
+    def _skip_(self, the_count):
+        """
+        Utility method, used to account for bytes that are not part of a valid packet.
+        """
+        if the_count <= 0:
+            return
+
+        if self.synchronized_:
+            self.resync_events_ += 1
+            self.synchronized_ = False
+
+        self.bytes_skipped_ += the_count
+
+    def find_packets(self, the_buffer, the_length=None):
+        """
+        Use this method to locate the valid packets contained in the_buffer.
+
+        :param the_buffer: A bytearray containing the stream.
+        :param the_length: The number of valid bytes in the_buffer, None uses the length of the_buffer.
+
+        :return:
+            Tuple of two elements:
+                Item 1: numpy array containing the byte offset of every valid packet found.
+                Item 2: The byte offset of the first byte that should be kept for the next read, because it may be
+                        the start of a packet that has not been completely received.
+        """
+        self.logger_.debug("--> find_packets()")
+
+        if the_length is None:
+            the_length = len(the_buffer)
+
+        the_offsets = []
+
+        if the_length < len(self.faw_bytes_):
+            self.logger_.debug("<-- find_packets()")
+            return numpy.array(the_offsets, dtype=numpy.intp), 0
+
+        #
+        # Find every position holding the first byte of the FAW, then keep the ones where the rest of the FAW follows.
+        #
+        the_bytes      = numpy.frombuffer(the_buffer, dtype=numpy.uint8, count=the_length)
+        the_candidates = numpy.flatnonzero(the_bytes[:the_length - len(self.faw_bytes_) + 1] == self.faw_bytes_[0])
+        the_candidates = the_candidates[self._match_(the_bytes, the_candidates, self.faw_bytes_)]
+
+        the_position    = 0 # First byte not yet accounted for.
+        the_search_from = 0 # Where to start looking for the next FAW.
+        the_keep        = the_length
+
+        while True:
+            the_index = numpy.searchsorted(the_candidates, the_search_from)
+
+            if the_index == len(the_candidates):
+                #
+                # No FAW left, keep the trailing bytes that might be the start of a FAW.
+                #
+                the_keep = max(the_position, the_length - len(self.faw_bytes_) + 1)
+                self._skip_(the_keep - the_position)
+                break
+
+            the_start = int(the_candidates[the_index])
+            self._skip_(the_start - the_position)
+
+            the_count = (the_length - the_start) / VRT_PACKET_SIZE
+
+            if the_count == 0:
+                the_keep = the_start
+                break
+
+            the_positions = the_start + numpy.arange(the_count) * VRT_PACKET_SIZE
+            the_mask      = self._match_(the_bytes, the_positions + VRL.FEND_OFFSET, self.fend_bytes_)
+            the_mask     &= self._match_(the_bytes, the_positions + self.size_offset_, self.size_bytes_)
+            the_mask     &= self._match_(the_bytes, the_positions, self.faw_bytes_)
+
+            if the_mask.all():
+                the_offsets.append(the_positions)
+                self.synchronized_ = True
+                the_position    = the_start + the_count * VRT_PACKET_SIZE
+                the_search_from = the_position
+                continue
+
+            the_bad = int(the_mask.argmin())
+
+            if the_bad > 0:
+                the_offsets.append(the_positions[:the_bad])
+                self.synchronized_ = True
+
+            the_position    = int(the_positions[the_bad])
+            the_search_from = the_position + 1
+
+        if len(the_offsets) > 0:
+            the_result = numpy.concatenate(the_offsets)
+        else:
+            the_result = numpy.array(the_offsets, dtype=numpy.intp)
+
+        self.logger_.debug("<-- find_packets()")
+        return the_result, the_keep
+
+    def packet_block(self, the_buffer, the_offsets):
+        """
+        Use this method to create a Vita49PacketBlock from the offsets returned by find_packets.
+
+        NOTE:
+            When the packets are back to back the block is a view of the_buffer, otherwise the packets are
+            gathered into a new array.
+
+        :param the_buffer:  The bytearray passed to find_packets.
+        :param the_offsets: The offsets returned from find_packets.
+
+        :return:
+            == None, no packets
+            != None, Vita49PacketBlock
+        """
+        if len(the_offsets) == 0:
+            return None
+
+        the_first = int(the_offsets[0])
+        the_count = len(the_offsets)
+
+        if int(the_offsets[-1]) - the_first == (the_count - 1) * VRT_PACKET_SIZE:
+            return Vita49PacketBlock(the_buffer, self.format_, the_count, the_first)
+
+        #
+        # Gather each run of back to back packets.
+        #
+        the_breaks = numpy.flatnonzero(numpy.diff(the_offsets) != VRT_PACKET_SIZE) + 1
+        the_runs   = []
+
+        for the_run in numpy.split(the_offsets, the_breaks):
+            the_runs.append\
+                (
+                    numpy.frombuffer
+                    (
+                        the_buffer,
+                        dtype=_packet_dtypes_[self.format_],
+                        count=len(the_run),
+                        offset=int(the_run[0])
+                    )
+                )
+
+        return Vita49PacketBlock(numpy.concatenate(the_runs), self.format_)
+
+    def reset(self):
+        """
+        Use this method when the stream is restarted, the next byte received is expected to be a packet start.
+
+        :return: N/A
+        """
+        self.synchronized_ = True
+
+    def synchronized(self):
+        """
+        Accessor method, that returns whether the last packet examined was valid.
+
+        :return: bool
+        """
+        return self.synchronized_
+
+    def bytes_skipped(self):
+        """
+        Accessor method, that returns the total number of bytes discarded while searching for the FAW.
+
+        :return: integer
+        """
+        return self.bytes_skipped_
+
+    def resync_events(self):
+        """
+        Accessor method, that returns the number of times synchronization to the stream was lost.
+
+        :return: integer
+        """
+        return self.resync_events_
+
+
+class Vita49ContinuityTracker:
+    """
+    Use this object to find the packets missing from a Vita49.0/1 stream.  The VRL frame_count (12 bits) and the VRT
+    packet_count (4 bits) of every packet of a block are checked against the packet before it in a single vectorized
+    pass, the last packet of a block being carried over to the next block.
+
+    The number of packets missing before a packet is taken from the frame_count, so a gap of FRAME_COUNT_MODULUS
+    packets or more is under counted.  The packet_count is expected to agree with it, a packet whose packet_count does
+    not is counted as a packet count error.
+    """
+
+    FRAME_COUNT_MODULUS  = 4096
+    PACKET_COUNT_MODULUS = 16
+    SAMPLES_PER_PACKET   = VRT_PAYLOAD_SHORTS / 2  # Complex samples carried by a packet
+
+    def __init__(self, the_history=16, loglevel=logging.INFO):
+        """
+        Constructor
+
+        :param the_history: The number of gaps whose time is kept, see gap_times.
+        :param loglevel:    The loglevel to use for the object.
+        """
+        self.logger_ = logging.getLogger('Vita49.Vita49ContinuityTracker')
+        self.logger_.setLevel(loglevel)
+
+        self.logger_.debug("--> __init__()")
+
+        self.last_frame_count_  = None
+        self.last_packet_count_ = None
+
+        self.packets_             = 0
+        self.dropped_packets_     = 0
+        self.gaps_                = 0
+        self.packet_count_errors_ = 0
+        self.gap_times_           = collections.deque(maxlen=the_history)  # (time, packets missing) of recent gaps
+
+        self.logger_.debug("<-- __init__()")
+
+    def __str__(self):
+        the_string = \
+            "packets              <{0}>\n"\
+            "dropped_packets      <{1}>\n"\
+            "gaps                 <{2}>\n"\
+            "packet_count_errors  <{3}>\n"\
+            .format\
+                (
+                    self.packets_,
+                    self.dropped_packets_,
+                    self.gaps_,
+                    self.packet_count_errors_
+                )
+        return the_string
+
+    def update(self, the_block, the_timestamps=None):
+        """
+        Use this method to check the continuity of each block, in the order the blocks were received.
+
+        :param the_block:      Vita49PacketBlock object
+        :param the_timestamps: Vita49Timestamps of the_block, used to record when the gaps happened, or None
+
+        :return: numpy array of int64, the number of packets missing before each packet of the_block
+        """
+        the_frame_counts  = the_block.frame_count().astype(numpy.int64)
+        the_packet_counts = the_block.packet_count().astype(numpy.int64)
+
+        if len(the_frame_counts) == 0:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        if self.last_frame_count_ is None:
+            self.last_frame_count_  = the_frame_counts[0] - 1
+            self.last_packet_count_ = the_packet_counts[0] - 1
+
+        the_frame_counts  = numpy.concatenate(([self.last_frame_count_], the_frame_counts))
+        the_packet_counts = numpy.concatenate(([self.last_packet_count_], the_packet_counts))
+
+        the_missing        = (numpy.diff(the_frame_counts) - 1) % self.FRAME_COUNT_MODULUS
+        the_packet_missing = (numpy.diff(the_packet_counts) - 1) % self.PACKET_COUNT_MODULUS
+
+        self.last_frame_count_  = the_frame_counts[-1]
+        self.last_packet_count_ = the_packet_counts[-1]
+
+        self.packets_             += len(the_missing)
+        self.packet_count_errors_ += int\
+            (
+                numpy.count_nonzero(the_missing % self.PACKET_COUNT_MODULUS != the_packet_missing)
+            )
+
+        the_gaps = numpy.flatnonzero(the_missing)
+
+        if len(the_gaps) > 0:
+            self.gaps_            += len(the_gaps)
+            self.dropped_packets_ += int(the_missing[the_gaps].sum())
+
+            for index in the_gaps:
+                the_time = None
+
+                if the_timestamps is not None and the_timestamps.valid()[index]:
+                    the_whole_seconds, the_fractional_seconds = the_timestamps.time(index)
+                    the_time = the_whole_seconds + the_fractional_seconds
+
+                self.gap_times_.append((the_time, int(the_missing[index])))
+
+        return the_missing
+
+    def reset(self):
+        """
+        Use this method when the stream is restarted, the next packet received starts the count again.
+
+        :return: N/A
+        """
+        self.last_frame_count_  = None
+        self.last_packet_count_ = None
+
+    def packets(self):
+        """
+        Accessor method, that returns the number of packets checked.
+
+        :return: integer
+        """
+        return self.packets_
+
+    def dropped_packets(self):
+        """
+        Accessor method, that returns the number of packets found missing.
+
+        :return: integer
+        """
+        return self.dropped_packets_
+
+    def dropped_samples(self):
+        """
+        Accessor method, that returns the number of complex samples carried by the packets found missing.
+
+        :return: integer
+        """
+        return self.dropped_packets_ * self.SAMPLES_PER_PACKET
+
+    def gaps(self):
+        """
+        Accessor method, that returns the number of places one or more packets were found missing.
+
+        :return: integer
+        """
+        return self.gaps_
+
+    def packet_count_errors(self):
+        """
+        Accessor method, that returns the number of packets whose packet_count did not agree with the frame_count.
+
+        :return: integer
+        """
+        return self.packet_count_errors_
+
+    def loss_rate(self):
+        """
+        Accessor method, that returns the fraction of the packets sent that were found missing.
+
+        :return: float
+        """
+        the_sent = self.packets_ + self.dropped_packets_
+        return self.dropped_packets_ / float(the_sent) if the_sent > 0 else 0.0
+
+    def gap_times(self):
+        """
+        Accessor method, that returns the recent gaps, oldest first.
+
+        :return: list of (UTC time of the first packet after the gap or None when unknown, packets missing)
+        """
+        return list(self.gap_times_)
+
 
 class GEOLOCATION_GPS_struct:
 
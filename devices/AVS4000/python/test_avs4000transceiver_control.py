@@ -0,0 +1,859 @@
+import unittest
+import logging
+import socket
+import json
+import threading
+import time
+import AVS4000Transceiver
+
+
+class FakeDaemon:
+    """
+    Plays the part of the avs4000d control port on one end of a socket pair.  Every request line received is recorded
+    and answered with the reply built by the_responder, the replies are written a few bytes at a time to exercise the
+    framing.
+    """
+    def __init__(self, the_socket, the_responder, the_piece_size=7):
+        self.socket_     = the_socket
+        self.responder_  = the_responder
+        self.piece_size_ = the_piece_size
+        self.requests_   = []
+
+        self.thread_ = threading.Thread(target=self._run_)
+        self.thread_.daemon = True
+        self.thread_.start()
+
+    def _run_(self):
+        the_reader = AVS4000Transceiver.ReplyReader()
+
+        while True:
+            try:
+                the_request = the_reader.read_reply(self.socket_)
+            except (EOFError, socket.error):
+                return
+
+            self.requests_.append(the_request)
+
+            the_reply = json.dumps(self.responder_(the_request)) + "\n"
+
+            for index in range(0, len(the_reply), self.piece_size_):
+                self.socket_.sendall(the_reply[index:index + self.piece_size_])
+                time.sleep(0.001)
+
+
+def respond_get(the_request):
+    the_groups = \
+        {
+            "rx":     {"Freq": 100.0, "SampleRate": 2.0},
+            "rxdata": {"ConEnable": True, "Run": True, "UseV49": True},
+            "rxstat": {"Overflow": 0},
+            "gps":    {"LAT": 39.0, "LONG": -77.0},
+            "master": {"SampleRate": 40000000, "RealSampleRate": 40000000.0}
+        }
+
+    if the_request[0] != "get":
+        return [True]
+
+    return [True, dict((the_group, the_groups[the_group]) for the_group in the_request[1])]
+
+
+class TestReplyReader_methods(unittest.TestCase):
+    def test_split_and_joined_replies(self):
+        the_socket, the_peer = socket.socketpair()
+        the_reader = AVS4000Transceiver.ReplyReader()
+
+        the_peer.sendall('[true, {"a": ')
+        the_peer.sendall('1}]\n[false, 3, "bad"]\n\n[tr')
+
+        self.assertEqual(the_reader.read_reply(the_socket), [True, {"a": 1}])
+        self.assertEqual(the_reader.read_reply(the_socket), [False, 3, "bad"])
+        self.assertEqual(the_reader.pending(), 4)
+
+        the_peer.close()
+        self.assertRaises(EOFError, the_reader.read_reply, the_socket)
+        the_socket.close()
+
+    def test_large_reply(self):
+        the_socket, the_peer = socket.socketpair()
+        the_reader = AVS4000Transceiver.ReplyReader()
+
+        the_reply = [True, {"dm": {}, "1": {"dn": 1, "sn": "x" * 200000}}]
+        threading.Thread(target=the_peer.sendall, args=(json.dumps(the_reply) + "\n",)).start()
+
+        self.assertEqual(the_reader.read_reply(the_socket), the_reply)
+
+        the_peer.close()
+        the_socket.close()
+
+
+class TestDeviceController_control_methods(unittest.TestCase):
+    def setUp(self):
+        self.controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+
+        the_socket, the_peer = socket.socketpair()
+        self.controller.control_socket_ = the_socket
+        self.peer   = the_peer
+        self.daemon = FakeDaemon(the_peer, respond_get)
+
+    def tearDown(self):
+        self.controller.disconnect_control()
+        self.peer.close()
+
+    def test_send_command(self):
+        valid, data = self.controller.send_command(["get", ["master"]])
+
+        self.assertTrue(valid)
+        self.assertEqual(json.loads(data)["master"]["SampleRate"], 40000000)
+
+    def test_send_commands_in_order(self):
+        the_replies = self.controller.send_commands([["get", ["rx"]], ["set", {"rx": {"freq": 1.0}}], ["get", ["gps"]]])
+
+        self.assertEqual([valid for valid, data in the_replies], [True, True, True])
+        self.assertEqual(json.loads(the_replies[0][1]).keys(), ["rx"])
+        self.assertEqual(the_replies[1][1], None)
+        self.assertEqual(json.loads(the_replies[2][1]).keys(), ["gps"])
+
+    def test_query_status(self):
+        the_rx, the_rx_stat, the_gps, the_master = self.controller.query_status()
+
+        self.assertEqual(the_master.sampleRate(), 40000000)
+        self.assertEqual(self.daemon.requests_, [["get", ["rx", "rxstat", "gps", "master"]]])
+
+    def test_query_groups(self):
+        self.assertTrue(self.controller.query_gps() is self.controller.gps())
+        self.assertTrue(self.controller.query_master() is self.controller.master())
+        self.assertTrue(self.controller.query_rx() is self.controller.rx())
+        self.assertTrue(self.controller.query_rxstat() is self.controller.rxstatus())
+
+        self.assertEqual(self.controller.master().sampleRate(), 40000000)
+        self.assertEqual(self.controller.control_channel_.submitted(), 4)
+        self.assertEqual\
+            (
+                [the_request[1] for the_request in self.daemon.requests_], [["gps"], ["master"], ["rx"], ["rxstat"]]
+            )
+
+        for the_group in ("gps", "master", "rx", "rxstat"):
+            self.assertTrue(self.controller.status_age(the_group) is not None)
+
+    def test_transact(self):
+        the_transaction = AVS4000Transceiver.Transaction()
+        the_transaction.set("rxdata", {"conEnable": True}).set("rx", {"freq": 1.0}).set("rxdata", {"run": True})
+        the_transaction.get("master", "rxdata", "master")
+
+        the_snapshot = self.controller.transact(the_transaction)
+
+        self.assertEqual(sorted(the_snapshot.keys()), ["master", "rxdata"])
+        self.assertTrue(the_snapshot["rxdata"] is self.controller.rxdata())
+        self.assertEqual\
+            (
+                self.daemon.requests_[0], ["set", {"rxdata": {"conEnable": True, "run": True}, "rx": {"freq": 1.0}}]
+            )
+        self.assertEqual(self.daemon.requests_[1], ["get", ["master", "rxdata"]])
+
+        self.assertRaises(ValueError, the_transaction.get, "dm")
+
+    def test_enable_disable_single_request(self):
+        self.controller.set_read_data_flag(False)
+
+        self.assertTrue(self.controller.enable())
+        self.controller.disable()
+
+        self.assertEqual\
+            (
+                self.daemon.requests_,
+                [
+                    ["set", {"rxdata": {"conEnable": True, "run": True}}],
+                    ["set", {"rxdata": {"run": False, "conEnable": False}}]
+                ]
+            )
+
+    def test_set_tune_queries_master(self):
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+
+        self.assertEqual([the_request[0] for the_request in self.daemon.requests_], ["set", "get"])
+        self.assertEqual(self.controller.master().sampleRate(), 40000000)
+
+    def test_set_tune_confirmed_values_only(self):
+        the_rates = []
+
+        def responder(the_request):
+            the_rates.append(self.controller.sample_rate())
+            return respond_get(the_request)
+
+        self.daemon.responder_ = responder
+
+        the_previous = self.controller.sample_rate()
+
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 4.0))
+        self.assertEqual(the_rates[0], the_previous)
+        self.assertEqual(self.controller.rx().sampleRate(), 4.0)
+        self.assertEqual(self.controller.rx().freq(), 100.0)
+
+        self.daemon.responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+
+        self.assertFalse(self.controller.set_tune(200.0, 1.0, 8.0))
+        self.assertEqual(self.controller.rx().sampleRate(), 4.0)
+        self.assertEqual(self.controller.rx().freq(), 100.0)
+
+    def test_refused(self):
+        self.daemon.responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+
+        self.assertFalse(self.controller.enable())
+        self.assertRaises(RuntimeError, self.controller.query_snapshot)
+
+    def test_unchanged_not_sent(self):
+        self.controller.set_read_data_flag(False)
+
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertTrue(self.controller.enable())
+        self.assertTrue(self.controller.enable())
+
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertEqual\
+            (
+                self.daemon.requests_,
+                [["set", {"rxdata": {"conEnable": False, "run": False}}], ["get", ["master"]]]
+            )
+
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.set_tune(105.0, 1.0, 2.0))
+        self.assertEqual(self.daemon.requests_, [["set", {"rx": {"freq": 105.0}}], ["get", ["master"]]])
+        self.assertEqual(self.controller.rx().freq(), 105.0)
+
+        self.assertTrue(self.controller.setup())
+        self.assertEqual(len(self.daemon.requests_), 2)
+
+    def test_refused_change_not_cached(self):
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+
+        self.daemon.responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+        self.assertFalse(self.controller.set_tune(6000.0, 1.0, 2.0))
+        self.assertEqual(self.controller.rx().freq(), 100.0)
+
+        #
+        # The daemon may have applied part of the refused change, so it is sent again.
+        #
+        self.daemon.responder_ = respond_get
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertEqual(self.daemon.requests_[0], ["set", {"rx": {"freq": 100.0}}])
+
+    def test_retune_marks_stream_position(self):
+        self.controller.set_read_data_flag(False)
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertTrue(self.controller.enable())
+
+        del self.daemon.requests_[:]
+
+        #
+        # 4000 samples were received before the retune was confirmed, but none of them were converted yet, they are
+        # still before it.
+        #
+        self.controller.bytes_received_ = 4000 * 4
+
+        self.assertTrue(self.controller.retune(the_center_frequency=105.0))
+        self.assertEqual(self.daemon.requests_, [["set", {"rx": {"freq": 105.0}}]])
+        self.assertEqual(self.controller.retune_count(), 1)
+        self.assertTrue(self.controller.retune_latency() > 0)
+
+        self.controller.convert_data_block(bytearray(5000 * 4))
+        self.assertEqual(self.controller.advance_samples(3000), None)
+
+        #
+        # The 4000th sample is the first one received after the retune was confirmed.
+        #
+        self.assertEqual(self.controller.advance_samples(2048), (1000, 2.0))
+        self.assertEqual(self.controller.advance_samples(2048), None)
+
+        self.daemon.responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+        self.assertFalse(self.controller.retune(the_sample_rate=99e9))
+        self.assertEqual(self.controller.retune_count(), 1)
+
+    def test_arm_start(self):
+        self.controller.set_read_data_flag(False)
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertTrue(self.controller.enable())
+
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.arm_start(1700000000.25, the_sample_rate=4.0))
+        self.assertEqual\
+            (
+                self.daemon.requests_,
+                [
+                    ["set", {"rxdata": {"run": False}, "rx": {"sampleRate": 4.0}}],
+                    ["get", ["master"]],
+                    ["set", {"rx": {"startMode": "OnTime", "startUTCInt": 1700000000, "startUTCFrac": 10000000}}],
+                    ["set", {"rxdata": {"run": True}}]
+                ]
+            )
+
+        self.controller.convert_data_block(bytearray(4))
+        self.assertEqual(self.controller.advance_samples(1), (0, 2.0))
+        self.assertEqual(self.controller.sample_clock().time_of(0), 1700000000.25)
+
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.cancel_timed_start())
+        self.assertEqual(self.daemon.requests_, [["set", {"rx": {"startMode": "Immediate"}}]])
+
+    def test_enable_at(self):
+        self.controller.set_read_data_flag(False)
+
+        self.assertTrue(self.controller.enable_at(1700000000, 5))
+        self.assertEqual\
+            (
+                self.daemon.requests_,
+                [
+                    ["set", {"rx": {"startMode": "OnTime", "startUTCInt": 1700000000, "startUTCFrac": 5}}],
+                    ["set", {"rxdata": {"conEnable": True, "run": True}}]
+                ]
+            )
+
+    def test_enable_at_disable_enable(self):
+        self.controller.set_read_data_flag(False)
+
+        self.assertTrue(self.controller.enable_at(1700000000, 5))
+        self.controller.disable()
+
+        self.assertEqual\
+            (
+                self.daemon.requests_[-1],
+                ["set", {"rxdata": {"run": False, "conEnable": False}, "rx": {"startMode": "Immediate"}}]
+            )
+
+        del self.daemon.requests_[:]
+
+        self.assertTrue(self.controller.enable())
+        self.controller.disable()
+
+        self.assertEqual\
+            (
+                self.daemon.requests_,
+                [
+                    ["set", {"rxdata": {"conEnable": True, "run": True}}],
+                    ["set", {"rxdata": {"run": False, "conEnable": False}}]
+                ]
+            )
+
+    def test_refresh_status(self):
+        the_ttls = {"rxstat": 10.0, "gps": 10.0, "master": 0}
+
+        self.assertEqual(self.controller.refresh_status(the_ttls), ["gps", "rxstat"])
+        self.assertEqual(self.daemon.requests_, [["get", ["gps", "rxstat"]]])
+        self.assertEqual(self.controller.gps().lat(), 39.0)
+        self.assertTrue(self.controller.sri_changed())
+        self.assertEqual(self.controller.status_age("master"), None)
+
+        #
+        # Nothing has expired, so nothing is sent.
+        #
+        self.assertEqual(self.controller.refresh_status(the_ttls), [])
+        self.assertEqual(len(self.daemon.requests_), 1)
+
+        self.controller.status_times_["gps"] -= 11.0
+
+        self.assertEqual(self.controller.refresh_status(the_ttls), [])
+        self.assertEqual(self.daemon.requests_[1], ["get", ["gps"]])
+        self.assertFalse(self.controller.sri_changed())
+
+    def test_request_tune_merges_burst(self):
+        self.controller.set_read_data_flag(False)
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+
+        del self.daemon.requests_[:]
+
+        self.controller.set_tune_window(0.1)
+
+        the_futures = [self.controller.request_tune(the_center_frequency=101.0 + index) for index in range(5)]
+        the_futures.append(self.controller.request_tune(the_sample_rate=4.0))
+
+        self.assertTrue(all(the_future is the_futures[0] for the_future in the_futures))
+        self.assertFalse(the_futures[0].done())
+
+        the_called = []
+        the_futures[0].add_done_callback(the_called.append)
+
+        self.assertTrue(the_futures[0].result(5.0))
+        self.assertEqual(the_called, [the_futures[0]])
+        self.assertEqual\
+            (
+                self.daemon.requests_, [["set", {"rx": {"freq": 105.0, "sampleRate": 4.0}}], ["get", ["master"]]]
+            )
+        self.assertEqual(self.controller.tunes_coalesced(), 4)
+        self.assertEqual(self.controller.retune_count(), 1)
+
+        #
+        # Without a window each request is made before returning.
+        #
+        self.controller.set_tune_window(0)
+        self.daemon.responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+
+        the_future = self.controller.request_tune(the_center_frequency=9000.0)
+        self.assertTrue(the_future.done())
+        self.assertFalse(the_future.result())
+        self.assertEqual(self.controller.center_frequency(), 105.0)
+
+        #
+        # An unexpected error is given to the requests, instead of leaving them waiting.
+        #
+        def broken(the_center_frequency=None, the_sample_rate=None):
+            raise ValueError("broken")
+
+        self.controller.retune = broken
+
+        the_future = self.controller.request_tune(the_center_frequency=106.0)
+        self.assertTrue(the_future.done())
+        self.assertRaises(RuntimeError, the_future.result)
+
+        self.assertRaises(ValueError, self.controller.set_tune_window, -1)
+
+    def test_reconnect_restores_settings(self):
+        self.controller.set_read_data_flag(False)
+        self.assertTrue(self.controller.set_tune(100.0, 1.0, 2.0))
+        self.assertTrue(self.controller.enable())
+        self.assertFalse(self.controller.connection_lost())
+
+        #
+        # The daemon goes away, and comes back on a new control port.
+        #
+        self.peer.shutdown(socket.SHUT_RDWR)
+        self.assertRaises(RuntimeError, self.controller.query_snapshot)
+        self.assertTrue(self.controller.connection_lost())
+
+        the_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        the_server.bind(("127.0.0.1", 0))
+        the_server.listen(1)
+
+        self.controller.host_         = "127.0.0.1"
+        self.controller.control_port_ = the_server.getsockname()[1]
+
+        the_daemons = []
+
+        def the_accept():
+            the_connection, the_address = the_server.accept()
+            the_daemons.append(FakeDaemon(the_connection, respond_get))
+
+        the_thread = threading.Thread(target=the_accept)
+        the_thread.start()
+
+        self.controller.reconnect()
+        the_thread.join(5.0)
+
+        the_requests = the_daemons[0].requests_
+
+        self.assertEqual(the_requests[0][1]["rx"], {"freq": 100.0, "sampleRate": 2.0})
+        self.assertEqual(the_requests[0][1]["rxdata"]["useV49"], self.controller.rxdata().useV49())
+        self.assertEqual(the_requests[1], ["set", {"rxdata": {"conEnable": True, "run": True}}])
+        self.assertFalse(self.controller.connection_lost())
+        self.assertTrue(self.controller.sri_changed())
+
+        self.controller.disconnect_control()
+        the_server.close()
+
+    def test_connection_closed(self):
+        self.peer.shutdown(socket.SHUT_RDWR)
+
+        self.assertEqual(self.controller.send_commands([["get", ["rx"]], ["get", ["gps"]]]), [(False, None)] * 2)
+        self.assertEqual(self.controller.control_socket_, None)
+
+
+class TestDeviceManager_synchronized_start(unittest.TestCase):
+    def setUp(self):
+        self.manager     = AVS4000Transceiver.DeviceManager(loglevel=logging.INFO)
+        self.controllers = {}
+        self.daemons     = {}
+        self.peers       = []
+
+        for index in range(3):
+            the_controller = AVS4000Transceiver.DeviceController(index, '', 'SN00000{}'.format(index), 'AVS4000', 'usb')
+            the_controller.set_read_data_flag(False)
+
+            the_socket, the_peer = socket.socketpair()
+            the_controller.control_socket_ = the_socket
+
+            self.controllers[index] = the_controller
+            self.daemons[index]     = FakeDaemon(the_peer, respond_get)
+            self.peers.append(the_peer)
+
+    def tearDown(self):
+        for the_controller in self.controllers.values():
+            the_controller.disconnect_control()
+
+        for the_peer in self.peers:
+            the_peer.close()
+
+    def test_shared_start(self):
+        the_start = self.manager.start_synchronized(self.controllers, the_lead=0.5)
+
+        self.assertTrue(the_start >= time.time() + 0.4)
+
+        for the_daemon in self.daemons.values():
+            self.assertEqual(the_daemon.requests_[0][1]["rx"]["startUTCInt"], the_start)
+            self.assertEqual(the_daemon.requests_[1], ["set", {"rxdata": {"conEnable": True, "run": True}}])
+
+    def test_refused_disables_the_others(self):
+        self.daemons[2].responder_ = lambda the_request: [False, 5, "Invalid parameter"]
+
+        self.assertRaises(RuntimeError, self.manager.start_synchronized, self.controllers, 0.5)
+
+        for index in (0, 1):
+            self.assertEqual\
+                (
+                    self.daemons[index].requests_[-1],
+                    ["set", {"rxdata": {"run": False, "conEnable": False}, "rx": {"startMode": "Immediate"}}]
+                )
+
+    def test_verify(self):
+        for the_controller in self.controllers.values():
+            the_controller.query_snapshot()
+            the_controller.set_read_data_flag(True)
+            the_controller.first_timestamp_ = 1700000000
+
+        self.controllers[0].set_read_data_flag(False)
+        self.controllers[0].first_timestamp_ = None
+
+        self.assertEqual\
+            (
+                self.manager.verify_synchronized_start(self.controllers, 1700000000, 0.1),
+                (True, {1: 1700000000, 2: 1700000000})
+            )
+
+        self.controllers[2].first_timestamp_ = 1700000001
+
+        self.assertFalse(self.manager.verify_synchronized_start(self.controllers, 1700000000, 0.1)[0])
+
+        self.controllers[2].first_timestamp_ = None
+
+        self.assertEqual\
+            (
+                self.manager.verify_synchronized_start(self.controllers, time.time(), 0.1)[1],
+                {1: 1700000000, 2: None}
+            )
+
+        #
+        # Nothing can be checked when no controller reads Vita49 data.
+        #
+        for the_controller in self.controllers.values():
+            the_controller.set_read_data_flag(False)
+
+        self.assertEqual(self.manager.verify_synchronized_start(self.controllers, 1700000000, 0.1), (False, {}))
+
+
+class TestControlChannel_methods(unittest.TestCase):
+    def setUp(self):
+        self.started  = threading.Event()
+        self.release  = threading.Event()
+        self.executed = []
+
+        self.channel = AVS4000Transceiver.ControlChannel(self._execute_, "test_control")
+
+    def tearDown(self):
+        self.release.set()
+        self.assertTrue(self.channel.stop())
+
+    def _execute_(self, the_transaction):
+        self.started.set()
+        self.release.wait(5.0)
+
+        if the_transaction.sets().get("rx", {}).get("freq") == 0:
+            raise RuntimeError("refused")
+
+        if the_transaction.sets().get("rx", {}).get("freq") == -1:
+            raise ValueError("broken")
+
+        self.executed.append(the_transaction.requests())
+        return len(self.executed)
+
+    def test_coalesce_pending_gets(self):
+        the_first = self.channel.submit(AVS4000Transceiver.Transaction().get("rx"))
+        self.assertTrue(self.started.wait(5.0))
+
+        #
+        # The first query is being made, so only the queries waiting behind it are coalesced.
+        #
+        the_second = self.channel.submit(AVS4000Transceiver.Transaction().get("rxstat", "gps"))
+        the_third  = self.channel.submit(AVS4000Transceiver.Transaction().get("gps", "rxstat"))
+        the_fourth = self.channel.submit(AVS4000Transceiver.Transaction().get("rx"))
+        the_set    = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": 1.0}))
+
+        self.assertTrue(the_second is the_third)
+        self.assertFalse(the_fourth is the_first)
+
+        self.release.set()
+
+        self.assertEqual([the_first.result(5.0), the_second.result(5.0), the_fourth.result(5.0)], [1, 2, 3])
+        self.assertEqual(the_set.result(5.0), 4)
+        self.assertEqual(self.channel.submitted(), 5)
+        self.assertEqual(self.channel.coalesced(), 1)
+
+    def test_submit_while_stopping(self):
+        the_running = []
+
+        def execute(the_transaction):
+            the_running.append(the_transaction.sets()["rx"]["freq"])
+            self.assertEqual(len(the_running) - len(self.executed), 1)
+            self._execute_(the_transaction)
+
+        self.channel.execute_ = execute
+
+        the_first = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": 1.0}))
+        self.assertTrue(self.started.wait(5.0))
+
+        the_second = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": 2.0}))
+
+        #
+        # The worker is still busy, the transaction submitted after the stop request waits for it to finish.
+        #
+        self.assertFalse(self.channel.stop(0.05))
+        self.assertTrue(self.channel.running())
+
+        the_third = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": 3.0}))
+
+        self.release.set()
+
+        for the_future in (the_first, the_second, the_third):
+            the_future.result(5.0)
+
+        self.assertEqual(the_running, [1.0, 2.0, 3.0])
+        self.assertEqual([the_requests[0][1]["rx"]["freq"] for the_requests in self.executed], [1.0, 2.0, 3.0])
+
+    def test_error_and_timeout(self):
+        the_refused = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": 0}))
+
+        self.assertRaises(RuntimeError, the_refused.result, 0.05)
+        self.assertFalse(the_refused.done())
+
+        self.release.set()
+        self.assertRaises(RuntimeError, the_refused.result, 5.0)
+        self.assertTrue(the_refused.done())
+
+        #
+        # Other errors are given as a RuntimeError, the error the callers handle.
+        #
+        the_broken = self.channel.submit(AVS4000Transceiver.Transaction().set("rx", {"freq": -1}))
+        self.assertRaises(RuntimeError, the_broken.result, 5.0)
+
+
+class TestDeviceController_concurrent_control(unittest.TestCase):
+    def test_threads_share_control_socket(self):
+        the_controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+
+        the_socket, the_peer = socket.socketpair()
+        the_controller.control_socket_ = the_socket
+        the_daemon = FakeDaemon(the_peer, respond_get, the_piece_size=3)
+
+        the_errors = []
+
+        def the_client(the_frequency):
+            try:
+                for index in range(5):
+                    the_controller.retune(the_center_frequency=the_frequency + index)
+                    the_snapshot = the_controller.transact(AVS4000Transceiver.Transaction().get("master", "gps"))
+                    assert the_snapshot["master"].sampleRate() == 40000000
+
+            except Exception as the_error:
+                the_errors.append(the_error)
+
+        the_threads = [threading.Thread(target=the_client, args=(index * 100.0,)) for index in range(4)]
+
+        for the_thread in the_threads:
+            the_thread.start()
+
+        for the_thread in the_threads:
+            the_thread.join(10.0)
+
+        self.assertEqual(the_errors, [])
+        self.assertEqual(the_controller.retune_count(), 20)
+        self.assertTrue(the_controller.control_channel_.submitted() >= 40)
+
+        the_controller.teardown()
+        self.assertFalse(the_controller.control_channel_.running())
+        the_peer.close()
+
+
+class TestStatusPoller_methods(unittest.TestCase):
+    def test_invalid_intervals(self):
+        the_controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+
+        self.assertRaises(ValueError, AVS4000Transceiver.StatusPoller, the_controller, {"dm": 1.0})
+        self.assertRaises(ValueError, AVS4000Transceiver.StatusPoller, the_controller, {"gps": -1.0})
+
+    def test_refresh_on_interval(self):
+        the_controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+
+        the_socket, the_peer = socket.socketpair()
+        the_controller.control_socket_ = the_socket
+        the_daemon = FakeDaemon(the_peer, respond_get, the_piece_size=64)
+
+        the_changes = []
+
+        the_poller = AVS4000Transceiver.StatusPoller\
+            (
+                the_controller, {"rxstat": 0.1, "gps": 0.0, "master": 10.0}, the_on_change=the_changes.append
+            )
+
+        the_poller.start()
+        time.sleep(0.35)
+        self.assertTrue(the_poller.stop())
+
+        #
+        # Both groups are queried at first, after that only rxstat is due, and it does not change.
+        #
+        self.assertEqual(the_daemon.requests_[0], ["get", ["master", "rxstat"]])
+        self.assertTrue(len(the_daemon.requests_) >= 3)
+        self.assertEqual(the_daemon.requests_[1:], [["get", ["rxstat"]]] * (len(the_daemon.requests_) - 1))
+        self.assertEqual(the_changes, [["master", "rxstat"]])
+        self.assertEqual(the_poller.errors(), 0)
+
+        the_controller.disconnect_control()
+        the_peer.close()
+
+
+class FailingController:
+    """
+    Loses its connection once, and fails the_failures reconnect attempts before it succeeds.
+    """
+    def __init__(self, the_failures):
+        self.failures_ = the_failures
+        self.lost_     = True
+        self.attempts_ = []
+
+    def stream_id(self):
+        return "SN000001"
+
+    def sample_rate(self):
+        return 1000.0
+
+    def samples_received(self):
+        return 42
+
+    def connection_lost(self):
+        return self.lost_
+
+    def reconnect(self):
+        self.attempts_.append(time.time())
+
+        if len(self.attempts_) <= self.failures_:
+            raise RuntimeError("daemon not running")
+
+        self.lost_ = False
+
+
+class TestConnectionSupervisor_methods(unittest.TestCase):
+    def test_invalid_backoff(self):
+        the_controller = FailingController(0)
+
+        self.assertRaises(ValueError, AVS4000Transceiver.ConnectionSupervisor, the_controller, 0.0)
+        self.assertRaises(ValueError, AVS4000Transceiver.ConnectionSupervisor, the_controller, 1.0, 2.0, 1.0)
+
+    def test_backoff_and_recovery(self):
+        the_controller = FailingController(3)
+        the_outages    = []
+
+        the_supervisor = AVS4000Transceiver.ConnectionSupervisor\
+            (
+                the_controller, 0.01, 0.05, 0.1, the_on_recover=the_outages.append
+            )
+
+        self.assertEqual(the_supervisor.samples_recovered(), 0)
+
+        the_supervisor.start()
+        time.sleep(0.5)
+        self.assertTrue(the_supervisor.stop())
+
+        #
+        # The attempts are spaced 0.05, 0.1 and 0.1 seconds apart.
+        #
+        the_gaps = [the_after - the_before for the_before, the_after in zip(the_controller.attempts_,
+                                                                            the_controller.attempts_[1:])]
+
+        self.assertEqual(len(the_controller.attempts_), 4)
+        self.assertTrue(0.04 < the_gaps[0] < 0.09)
+        self.assertTrue(0.09 < the_gaps[2] < 0.15)
+
+        self.assertEqual(len(the_outages), 1)
+        self.assertEqual(the_supervisor.outages(), 1)
+        self.assertEqual(the_supervisor.attempts(), 3)
+        self.assertAlmostEqual(the_supervisor.last_outage(), the_outages[0])
+        self.assertEqual(the_supervisor.samples_lost(), int(the_outages[0] * 1000.0))
+        self.assertEqual(the_supervisor.samples_recovered(), 42)
+        self.assertFalse(the_supervisor.in_outage())
+
+
+class ArmingController:
+    """
+    Records the hops armed by a HopScheduler, arming fails for the frequencies in the_refused.
+    """
+    def __init__(self, the_refused=()):
+        self.refused_   = the_refused
+        self.armed_     = []
+        self.cancelled_ = 0
+
+    def stream_id(self):
+        return "SN000001"
+
+    def arm_start(self, the_start_time, the_center_frequency=None, the_sample_rate=None):
+        if the_center_frequency in self.refused_:
+            return False
+
+        self.armed_.append((time.time(), the_start_time, the_center_frequency, the_sample_rate))
+        return True
+
+    def cancel_timed_start(self):
+        self.cancelled_ += 1
+        return True
+
+
+class TestHopScheduler_methods(unittest.TestCase):
+    def test_invalid_hops(self):
+        the_controller = ArmingController()
+
+        self.assertRaises(ValueError, AVS4000Transceiver.HopScheduler, the_controller, [])
+        self.assertRaises(ValueError, AVS4000Transceiver.HopScheduler, the_controller, [(1.0, 2.0, 0.1)], 0.0)
+        self.assertRaises(ValueError, AVS4000Transceiver.HopScheduler, the_controller, [(1.0, 2.0, 0.1)], 0.2)
+
+    def test_hops_armed_ahead_of_start(self):
+        the_controller = ArmingController(the_refused=(3.0,))
+        the_started    = []
+
+        the_scheduler = AVS4000Transceiver.HopScheduler\
+            (
+                the_controller,
+                [(1.0, 2.0, 0.1), (2.0, 4.0, 0.15), (3.0, 2.0, 0.1)],
+                the_lead=0.05,
+                the_boundary=0.5,
+                the_on_hop=lambda the_index, the_hop, the_start: the_started.append((the_index, the_start))
+            )
+
+        the_scheduler.start()
+        time.sleep(1.2)
+        self.assertTrue(the_scheduler.stop())
+        self.assertFalse(the_scheduler.running())
+
+        the_armed = the_controller.armed_
+        self.assertTrue(len(the_armed) >= 2)
+
+        #
+        # The first hop starts on a boundary, each later hop the dwell of the previous hop after it, every hop is
+        # armed before it starts.
+        #
+        self.assertAlmostEqual(the_armed[0][1] * 2, round(the_armed[0][1] * 2), places=5)
+        self.assertAlmostEqual(the_armed[1][1] - the_armed[0][1], 0.1, places=5)
+        self.assertEqual([the_frequency for the_time, the_start, the_frequency, the_rate in the_armed[:2]], [1.0, 2.0])
+
+        for the_time, the_start, the_frequency, the_rate in the_armed:
+            self.assertTrue(the_time < the_start)
+
+        self.assertEqual(the_started[:2], [(0, the_armed[0][1]), (1, the_armed[1][1])])
+        self.assertEqual(the_scheduler.hops_armed(), len(the_armed))
+        self.assertTrue(the_scheduler.hops_failed() >= 1)
+        self.assertEqual(the_controller.cancelled_, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,723 @@
+import unittest
+import socket
+import struct
+import threading
+import time
+import AVS4000Transceiver
+import Vita49
+
+from test_vita49 import create_packet
+
+
+def create_controller(the_payload_mode=AVS4000Transceiver.NUMPYPayloadMode):
+    """
+    Builds a DeviceController whose data socket is one end of a socket pair, the other end is returned so the test
+    can play the part of the avs4000d data port.
+    """
+    the_controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+    the_controller.set_payload_mode(the_payload_mode)
+
+    the_data_socket, the_peer = socket.socketpair()
+    the_data_socket.settimeout(0.10)
+    the_controller.data_socket_ = the_data_socket
+
+    return the_controller, the_peer
+
+
+def send_in_background(the_socket, the_bytes):
+    the_thread = threading.Thread(target=the_socket.sendall, args=(the_bytes,))
+    the_thread.daemon = True
+    the_thread.start()
+    return the_thread
+
+
+class TestDeviceController_data_methods(unittest.TestCase):
+    def setUp(self):
+        self.controller, self.peer = create_controller()
+
+    def tearDown(self):
+        self.controller.disconnect_data()
+        self.peer.close()
+
+    def test_read_convert_complex(self):
+        the_samples = [(index % 300) - 150 for index in range(self.controller.block_size() / 2)]
+        send_in_background(self.peer, struct.pack("<{}h".format(len(the_samples)), *the_samples))
+
+        the_buffer = self.controller.read_data_block()
+        self.assertEqual(len(the_buffer), self.controller.block_size())
+
+        the_data = self.controller.convert_data_block(the_buffer)
+        self.assertEqual(the_data[:4].tolist(), the_samples[:4])
+        self.assertEqual(the_data.reshape(-1, 2).shape, (len(the_samples) / 2, 2))
+
+    def test_read_convert_vita49_keeps_partial_packet(self):
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.master_.config(SampleRate=2040, RealSampleRate=2040.0)
+
+        the_bytes = "junk" + "".join(create_packet(index, index, 7, 0, index) for index in range(130))
+        send_in_background(self.peer, the_bytes)
+
+        the_first  = self.controller.convert_data_block(self.controller.read_data_block())
+        the_second = self.controller.convert_data_block(self.controller.read_data_block())
+
+        self.assertEqual(len(the_first[0].payload()), 63 * Vita49.VRT_PAYLOAD_SHORTS)
+        self.assertEqual(the_first[0].vrl().frame_count(), 0)
+
+        self.assertEqual(the_second[0].vrl().frame_count(), 63)
+        self.assertEqual(the_second[0].payload()[0], 63)
+        self.assertEqual(self.controller.vita49_bytes_skipped(), 4)
+        self.assertEqual(self.controller.first_timestamp(), 7)
+
+    def test_retune_in_blocks_not_converted(self):
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.set_buffer_pool_capacity(3)
+
+        the_count = 3 * self.controller.block_size() / Vita49.VRT_PACKET_SIZE + 1
+        the_bytes = "junk" + "".join(create_packet(index, index, 7, 0, index) for index in range(the_count))
+        send_in_background(self.peer, the_bytes)
+
+        #
+        # Two blocks are waiting to be converted when the retune is confirmed, as in the queue of a DataPipeline.
+        #
+        the_blocks = [self.controller.read_data_block(), self.controller.read_data_block()]
+        self.controller._mark_position_(2.0)
+
+        the_blocks.append(self.controller.read_data_block())
+
+        the_samples = 0
+
+        for the_buffer in the_blocks:
+            for the_packet in self.controller.convert_data_block(the_buffer):
+                the_samples += len(the_packet.payload()) / 2
+
+        #
+        # The packets starting in the bytes received before the retune come before it, the junk skipped does not.
+        #
+        the_before = (2 * self.controller.block_size() - 4 + Vita49.VRT_PACKET_SIZE - 1) / Vita49.VRT_PACKET_SIZE
+
+        self.assertEqual\
+            (
+                self.controller.advance_samples(the_samples),
+                (the_before * Vita49.VRT_PAYLOAD_SHORTS / 2, 2.0)
+            )
+
+    def test_first_timestamp_not_related_to_utc(self):
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.master_.config(SampleRate=2040, RealSampleRate=2040.0)
+
+        #
+        # The first packet has no integer seconds timestamp, the later packets can not stand in for it.
+        #
+        the_bytes = create_packet(0, 0, 0, 0, 0, the_tsi=0x0) + \
+            "".join(create_packet(index, index, 7, 0, index) for index in range(1, 64))
+        send_in_background(self.peer, the_bytes)
+
+        self.controller.convert_data_block(self.controller.read_data_block())
+        self.assertEqual(self.controller.first_timestamp(), None)
+
+    def test_read_no_data(self):
+        self.assertEqual(self.controller.read_data_block(), None)
+
+        #
+        # The buffer is kept for the next call, instead of going back and forth to the pool.
+        #
+        self.assertEqual(self.controller.read_data_block(), None)
+        self.assertEqual(self.controller.buffer_pool().in_use(), 1)
+
+    def test_buffers_for_active_format(self):
+        self.assertEqual(self.controller.buffer_pool(), None)
+
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        send_in_background(self.peer, create_packet(0) * 64)
+
+        the_buffer = self.controller.read_data_block()
+        the_pool   = self.controller.buffer_pool()
+
+        self.assertEqual(the_pool.allocated(), 1)
+        self.assertEqual(the_pool.buffer_size(), Vita49.VRT_PACKET_SIZE + self.controller.block_size())
+
+        self.controller.release_buffer(the_buffer)
+        self.assertEqual(the_pool.in_use(), 0)
+
+    def test_fixed_block_size(self):
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.set_block_packets(2)
+
+        send_in_background(self.peer, "".join(create_packet(index, index, 0, 0, index) for index in range(4)))
+
+        the_first  = self.controller.get_data_vita49_single_timestamp()
+        self.assertEqual(len(the_first[0].payload()), 2 * Vita49.VRT_PAYLOAD_SHORTS)
+
+        the_second = self.controller.get_data_vita49_single_timestamp()
+        self.assertEqual(the_second[0].vrl().frame_count(), 2)
+
+        self.assertRaises(ValueError, self.controller.set_block_packets, 0)
+        self.assertRaises(ValueError, self.controller.set_block_packets, 257)
+
+    def test_auto_block_size(self):
+        self.controller.set_block_mode(AVS4000Transceiver.AUTOBlockMode)
+        self.controller.set_block_latency(10.0)
+
+        self.controller.rx_.config(SampleRate=1000000)
+        self.assertEqual(self.controller.block_packets(), 5)     # 10000 samples / 2048
+        self.assertEqual(self.controller.block_size(), 5 * 8192)
+
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.assertEqual(self.controller.block_packets(), 5)     # 10000 samples / 2040
+
+        self.controller.rx_.config(SampleRate=100000000)
+        self.assertEqual(self.controller.block_packets(), 256)
+
+        self.controller.rx_.config(SampleRate=0)
+        self.assertEqual(self.controller.block_packets(), 1)
+
+        self.assertRaises(ValueError, self.controller.set_block_latency, 0)
+        self.assertRaises(ValueError, self.controller.set_block_mode, "Bogus")
+
+    def _check_resumed_read(self):
+        self.controller.set_block_packets(1)
+
+        the_samples = range(self.controller.block_size() / 2)
+        the_bytes   = struct.pack("<{}h".format(len(the_samples)), *the_samples)
+
+        self.peer.sendall(the_bytes[:1000])
+        self.assertEqual(self.controller.get_data_complex(), None)
+
+        self.peer.sendall(the_bytes[1000:] + the_bytes[:4])
+        self.assertEqual(self.controller.get_data_complex().tolist(), the_samples)
+
+        self.peer.sendall(the_bytes[4:])
+        self.assertEqual(self.controller.get_data_complex().tolist(), the_samples)
+
+    def test_resumed_read(self):
+        self._check_resumed_read()
+
+    def test_resumed_read_bulk_receive(self):
+        self.controller.set_bulk_receive(True)
+        self.assertEqual(self.controller.data_socket_.gettimeout(), None)
+
+        self._check_resumed_read()
+
+    def test_resumed_read_data_block(self):
+        self.controller.set_block_packets(1)
+
+        self.peer.sendall("\x01" * 5000)
+        self.assertEqual(self.controller.read_data_block(), None)
+        self.assertEqual(self.controller.buffer_pool().in_use(), 1)
+
+        self.peer.sendall("\x02" * 3192)
+        the_buffer = self.controller.read_data_block()
+        self.assertEqual(str(the_buffer), "\x01" * 5000 + "\x02" * 3192)
+
+    def test_resumed_read_vita49(self):
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.set_block_packets(2)
+
+        the_bytes = "xx" + "".join(create_packet(index, index, 0, 0, index) for index in range(5))
+
+        self.peer.sendall(the_bytes[:10000])
+        self.assertEqual(self.controller.get_data_vita49(), None)
+
+        self.peer.sendall(the_bytes[10000:])
+        the_first  = self.controller.get_data_vita49()
+        the_second = self.controller.get_data_vita49()
+
+        self.assertEqual([the_packet.vrl().frame_count() for the_packet in the_first], [0])
+        self.assertEqual([the_packet.vrl().frame_count() for the_packet in the_second], [1, 2])
+
+
+class TestDeviceController_gap_policy(unittest.TestCase):
+    #
+    # 2040 samples per second, so each packet starts a second after the one before it.
+    #
+    def setUp(self):
+        self.controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+        self.controller.set_payload_mode(AVS4000Transceiver.NUMPYPayloadMode)
+        self.controller.set_output_format(AVS4000Transceiver.VITA49OutputFormat)
+        self.controller.rx_.config(SampleRate=2040)
+        self.controller.master_.config(SampleRate=2040, RealSampleRate=2040.0)
+
+    def packets(self, the_frame_counts, the_seconds=None):
+        the_buffer = bytearray()
+
+        for index, the_frame_count in enumerate(the_frame_counts):
+            the_ist = the_seconds[index] if the_seconds is not None else 100 + the_frame_count
+            the_buffer += create_packet(the_frame_count, the_frame_count, the_ist, 0, the_frame_count + 1)
+
+        return the_buffer
+
+    def block(self, the_frame_counts, the_seconds=None):
+        return Vita49.Vita49PacketBlock(self.packets(the_frame_counts, the_seconds))
+
+    def test_ignore(self):
+        the_packets = self.controller._aggregate_vita49_(self.block([0, 1, 3]), True)
+
+        self.assertEqual(len(the_packets), 1)
+        self.assertEqual(len(the_packets[0].payload()), 3 * Vita49.VRT_PAYLOAD_SHORTS)
+        self.assertEqual(the_packets[0].gap(), 0)
+
+    def test_zero_fill(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.ZEROFILLGapPolicy)
+
+        the_payload = self.controller._aggregate_vita49_(self.block([0, 1, 3]), True)[0].payload()
+
+        self.assertEqual(len(the_payload), 4 * Vita49.VRT_PAYLOAD_SHORTS)
+        self.assertEqual(the_payload[2 * Vita49.VRT_PAYLOAD_SHORTS:3 * Vita49.VRT_PAYLOAD_SHORTS].tolist(),
+                         [0] * Vita49.VRT_PAYLOAD_SHORTS)
+        self.assertEqual(the_payload[-1], 4)
+        self.assertEqual(self.controller.samples_concealed(), Vita49.VRT_PAYLOAD_SHORTS / 2)
+
+    def test_samples_produced(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.ZEROFILLGapPolicy)
+
+        #
+        # The bytes skipped to find the first packet are not samples, the samples concealing the gap are.  The block
+        # starts with a packet of headroom, as the blocks of read_data_block do.
+        #
+        the_buffer = bytearray(Vita49.VRT_PACKET_SIZE) + bytearray(12) + self.packets([0, 1, 3])
+
+        self.controller.convert_data_block(the_buffer)
+
+        self.assertEqual(self.controller.samples_produced(), 4 * Vita49.VRT_PAYLOAD_SHORTS / 2)
+
+    def test_hold_last_before_block(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.HOLDLASTGapPolicy, the_fill_limit=5.0)
+
+        self.controller._aggregate_vita49_(self.block([0]), True)
+        the_packet = self.controller._aggregate_vita49_(self.block([3]), True)[0]
+
+        self.assertEqual(the_packet.lead_samples(), Vita49.VRT_PAYLOAD_SHORTS)
+        the_fill = the_packet.payload()[:Vita49.VRT_PAYLOAD_SHORTS * 2]
+
+        self.assertEqual(the_fill.tolist(), [1] * 2 * Vita49.VRT_PAYLOAD_SHORTS)
+        self.assertEqual(the_packet.payload()[-1], 4)
+
+    def test_fill_limit_splits(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.ZEROFILLGapPolicy, the_fill_limit=0.5)
+
+        the_packets = self.controller._aggregate_vita49_(self.block([0, 1, 3]), True)
+
+        self.assertEqual([the_packet.gap() for the_packet in the_packets], [0, Vita49.VRT_PAYLOAD_SHORTS / 2])
+        self.assertEqual(self.controller.blocks_split(), 1)
+
+    def test_split_on_time(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.SPLITGapPolicy)
+
+        the_packets = self.controller._aggregate_vita49_(self.block([0, 1, 2, 3], [100, 101, 200, 150]), True)
+
+        self.assertEqual([the_packet.gap() for the_packet in the_packets], [0, 98 * Vita49.VRT_PAYLOAD_SHORTS / 2, -1])
+        self.assertEqual([the_packet.timestamps().time()[0] for the_packet in the_packets], [100, 200, 150])
+        self.assertEqual(len(the_packets[0].payload()), 2 * Vita49.VRT_PAYLOAD_SHORTS)
+
+    def test_split_on_time_real_rate(self):
+        self.controller.set_gap_policy(AVS4000Transceiver.SPLITGapPolicy)
+
+        #
+        # The time is converted to samples at the rate the timestamps are counted at, not the nominal rate.
+        #
+        self.controller.rx_.config(SampleRate=2000)
+
+        the_packets = self.controller._aggregate_vita49_(self.block([0, 1], [100, 200]), True)
+
+        self.assertEqual(the_packets[1].gap(), 99 * Vita49.VRT_PAYLOAD_SHORTS / 2)
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, self.controller.set_gap_policy, "Bogus")
+
+
+class TestBufferPool_methods(unittest.TestCase):
+    def test_recycle(self):
+        the_pool = AVS4000Transceiver.BufferPool(16, 2)
+
+        the_first = the_pool.acquire()
+        self.assertEqual(len(the_first), 16)
+        self.assertTrue(the_pool.release(the_first))
+        self.assertTrue(the_pool.acquire() is the_first)
+        self.assertEqual(the_pool.allocated(), 1)
+
+    def test_exhausted(self):
+        the_pool = AVS4000Transceiver.BufferPool(16, 2)
+
+        the_first  = the_pool.acquire()
+        the_second = the_pool.acquire()
+
+        self.assertEqual(the_pool.acquire(0.01), None)
+        self.assertEqual(the_pool.exhausted(), 1)
+        self.assertEqual(the_pool.high_water(), 2)
+
+        threading.Timer(0.05, the_pool.release, (the_second,)).start()
+        self.assertTrue(the_pool.acquire(1.0) is the_second)
+
+    def test_foreign_buffer(self):
+        the_pool = AVS4000Transceiver.BufferPool(16, 2)
+
+        self.assertFalse(the_pool.release(bytearray(16)))
+
+        the_buffer = the_pool.acquire()
+        self.assertTrue(the_pool.release(the_buffer))
+        self.assertFalse(the_pool.release(the_buffer))
+        self.assertEqual(the_pool.available(), 2)
+
+
+class TestSampleClock_methods(unittest.TestCase):
+    def setUp(self):
+        self.clock = AVS4000Transceiver.SampleClock(1000.0)
+
+    def test_no_reference(self):
+        self.assertEqual(self.clock.time_of(0), None)
+        self.assertEqual(self.clock.reference(), None)
+
+    def test_status_fit(self):
+        #
+        # The host clock runs 100 ppm fast, with +/- 1 ms of jitter.
+        #
+        for index in range(0, 32):
+            the_jitter = 0.001 if index % 2 else -0.001
+            self.clock.observe(1000 * index, 500.0 + index * 1.0001 + the_jitter)
+
+        self.assertEqual(self.clock.reference(), AVS4000Transceiver.STATUSClockReference)
+        self.assertAlmostEqual(self.clock.drift(), 100.0, delta=10.0)
+        self.assertAlmostEqual(self.clock.jitter(), 0.001, delta=0.0002)
+        self.assertAlmostEqual(self.clock.time_of(4500), 504.50045, places=3)
+
+    def test_preference(self):
+        self.assertTrue(self.clock.observe(0, 10.0, AVS4000Transceiver.ARRIVALClockReference))
+        self.assertEqual(self.clock.time_of(500), 10.5)
+
+        self.assertTrue(self.clock.observe(0, 20.0))
+        self.assertFalse(self.clock.observe(0, 30.0, AVS4000Transceiver.ARRIVALClockReference))
+        self.assertEqual(self.clock.observations(), 1)
+        self.assertEqual(self.clock.time_of(0), 20.0)
+
+    def test_anchor(self):
+        self.clock.observe(0, 20.0)
+        self.clock.observe(1000, 21.5)
+        self.clock.anchor(0, 100.0)
+
+        self.assertTrue(self.clock.observe(1000, 21.0))
+        self.assertEqual(self.clock.reference(), AVS4000Transceiver.DEVICEClockReference)
+        self.assertEqual(self.clock.time_of(2000), 102.0)
+
+    def test_sample_rate_change(self):
+        self.clock.anchor(0, 100.0)
+        self.clock.set_sample_rate(2000.0, 1000)
+
+        self.assertEqual(self.clock.time_of(1000), 101.0)
+        self.assertEqual(self.clock.time_of(3000), 102.0)
+
+    def test_block_time(self):
+        the_controller, the_peer = create_controller()
+        the_controller.sample_clock().reset(1000.0)
+
+        self.assertEqual(the_controller.block_time(100, 50.0), 49.9)
+
+        the_controller.advance_samples(100)
+        self.assertAlmostEqual(the_controller.block_time(100, 50.13), 50.0, places=6)
+
+        the_peer.close()
+
+
+class TestSriCache_methods(unittest.TestCase):
+    def setUp(self):
+        self.converted = []
+
+        def converter(the_id, the_value):
+            self.converted.append(the_id)
+            return the_id, the_value
+
+        self.cache    = AVS4000Transceiver.SriCache(converter, ("GPS::TIME",))
+        self.header   = {"streamID": "tuner_0", "xdelta": 1.0e-6, "mode": 1}
+        self.gps      = {"GPS::TIME": 100.0, "GPS::LATITUDE": 39.0}
+        self.keywords = [("CHAN_RF", 100.0e6), ("GPS", self.gps)]
+
+    def test_first_update(self):
+        the_changes = self.cache.update(self.header, self.keywords)
+
+        self.assertEqual(the_changes, ["mode", "streamID", "xdelta", "CHAN_RF", "GPS"])
+        self.assertEqual\
+            (
+                self.cache.keywords(),
+                [("CHAN_RF", 100.0e6), ("GPS", [("GPS::LATITUDE", 39.0), ("GPS::TIME", 100.0)])]
+            )
+
+    def test_unchanged(self):
+        self.cache.update(self.header, self.keywords)
+        del self.converted[:]
+
+        self.assertEqual(self.cache.update(dict(self.header), list(self.keywords)), [])
+        self.assertEqual(self.converted, [])
+        self.assertEqual(self.cache.pushes(), 1)
+        self.assertEqual(self.cache.unchanged(), 1)
+
+    def test_only_changed_keywords_converted(self):
+        self.cache.update(self.header, self.keywords)
+        del self.converted[:]
+
+        the_header = dict(self.header, xdelta=0.5e-6)
+
+        the_changes = self.cache.update(the_header, [("CHAN_RF", 200.0e6), ("GPS", self.gps)])
+
+        self.assertEqual(the_changes, ["xdelta", "CHAN_RF"])
+        self.assertEqual(self.converted, ["CHAN_RF"])
+        self.assertEqual(self.cache.keywords()[0], ("CHAN_RF", 200.0e6))
+
+    def test_volatile_entries(self):
+        self.cache.update(self.header, self.keywords)
+
+        the_gps = dict(self.gps)
+        the_gps["GPS::TIME"] = 101.0
+
+        self.assertEqual(self.cache.update(self.header, [("CHAN_RF", 100.0e6), ("GPS", the_gps)]), [])
+
+        the_gps["GPS::LATITUDE"] = 40.0
+
+        self.assertEqual(self.cache.update(self.header, [("CHAN_RF", 100.0e6), ("GPS", the_gps)]), ["GPS"])
+        self.assertEqual(self.cache.keywords()[1], ("GPS", [("GPS::LATITUDE", 40.0), ("GPS::TIME", 101.0)]))
+
+    def test_keywords_added_and_removed(self):
+        self.cache.update(self.header, self.keywords)
+
+        the_changes = self.cache.update(self.header, [("GAP", 1)] + self.keywords)
+
+        self.assertEqual(the_changes, ["GAP"])
+        self.assertEqual([the_id for the_id, _ in self.cache.keywords()], ["GAP", "CHAN_RF", "GPS"])
+
+        the_changes = self.cache.update(self.header, self.keywords)
+
+        self.assertEqual(the_changes, ["GAP"])
+        self.assertEqual([the_id for the_id, _ in self.cache.keywords()], ["CHAN_RF", "GPS"])
+
+    def test_reset(self):
+        self.cache.update(self.header, self.keywords)
+        self.cache.reset()
+
+        self.assertEqual(len(self.cache.update(self.header, self.keywords)), 5)
+
+
+class TestDataPipeline_methods(unittest.TestCase):
+    def test_stages(self):
+        the_blocks = range(10)
+        the_pushed = []
+
+        def the_reader():
+            if the_blocks:
+                return the_blocks.pop(0)
+            return None
+
+        def the_parser(the_block):
+            if the_block == 5:
+                return None
+            return the_block * 2
+
+        def the_pusher(the_data, the_time):
+            the_pushed.append(the_data)
+
+        the_released = []
+
+        the_pipeline = AVS4000Transceiver.DataPipeline\
+            (
+                "test", the_reader, the_parser, the_pusher, the_queue_depth=2, the_release=the_released.append
+            )
+        the_pipeline.start()
+
+        for index in range(100):
+            if len(the_pushed) == 9:
+                break
+            time.sleep(0.01)
+
+        self.assertTrue(the_pipeline.stop())
+
+        self.assertEqual(the_pushed, [0, 2, 4, 6, 8, 12, 14, 16, 18])
+        self.assertEqual(the_pipeline.blocks_read(), 10)
+        self.assertEqual(the_pipeline.blocks_pushed(), 9)
+        self.assertEqual(the_pipeline.blocks_dropped(), 1)
+        self.assertEqual(sorted(the_released), range(10))
+
+    def test_bounded_queue(self):
+        the_release = threading.Event()
+
+        def the_pusher(the_data, the_time):
+            the_release.wait()
+
+        the_pipeline = AVS4000Transceiver.DataPipeline("test", None, lambda the_block: the_block, the_pusher, 2)
+        the_pipeline.start()
+
+        for index in range(4):
+            self.assertTrue(the_pipeline.submit(index))
+
+        time.sleep(0.1)
+
+        self.assertTrue(the_pipeline.read_queue_size() <= 2)
+        self.assertTrue(the_pipeline.push_queue_size() <= 2)
+        self.assertTrue(the_pipeline.push_high_water() >= 1)
+
+        the_release.set()
+        self.assertTrue(the_pipeline.stop())
+        self.assertFalse(the_pipeline.submit(5))
+
+    def test_invalid_depth(self):
+        self.assertRaises(ValueError, AVS4000Transceiver.DataPipeline, "test", None, None, None, 0)
+
+
+class TestDataEngine_methods(unittest.TestCase):
+    def setUp(self):
+        self.engine = AVS4000Transceiver.DataEngine()
+        self.tuners = []
+
+    def tearDown(self):
+        self.engine.stop()
+
+        for the_controller, the_peer, the_pipeline, the_pushed in self.tuners:
+            the_pipeline.stop()
+            the_controller.disconnect_data()
+            the_peer.close()
+
+    def _add_tuner(self, the_pusher=None, the_queue_depth=4):
+        the_controller, the_peer = create_controller()
+        the_controller.set_block_packets(1)
+        the_pushed = []
+
+        if the_pusher is None:
+            the_pusher = lambda the_data, the_time: the_pushed.append(the_data)
+
+        the_pipeline = AVS4000Transceiver.DataPipeline\
+            (
+                "test", None, the_controller.convert_data_block, the_pusher, the_queue_depth,
+                the_release=the_controller.release_buffer
+            )
+        the_pipeline.start()
+
+        self.assertTrue(self.engine.add(the_controller, the_pipeline))
+        self.tuners.append((the_controller, the_peer, the_pipeline, the_pushed))
+
+        return the_controller, the_peer, the_pipeline, the_pushed
+
+    def _wait_for(self, the_condition):
+        for index in range(200):
+            if the_condition():
+                return True
+            time.sleep(0.01)
+
+        return False
+
+    def test_ready_sockets_only(self):
+        the_idle = self._add_tuner()
+        the_busy = self._add_tuner()
+        self.engine.start()
+
+        the_samples = range(4096)
+        the_bytes   = struct.pack("<4096h", *the_samples)
+
+        #
+        # A partial block is kept until the rest arrives, the idle tuner never holds up the busy one.
+        #
+        the_busy[1].sendall(the_bytes[:3000])
+        time.sleep(0.05)
+        self.assertEqual(the_busy[3], [])
+
+        the_busy[1].sendall(the_bytes[3000:] + the_bytes)
+        self.assertTrue(self._wait_for(lambda: len(the_busy[3]) == 2))
+
+        self.assertEqual(the_busy[3][0].tolist(), the_samples)
+        self.assertEqual(the_busy[3][1].tolist(), the_samples)
+        self.assertEqual(the_idle[3], [])
+        self.assertEqual(self.engine.blocks_read(), 2)
+
+    def test_hold_full_queue(self):
+        the_release = threading.Event()
+
+        the_controller, the_peer, the_pipeline, the_pushed = self._add_tuner\
+            (
+                lambda the_data, the_time: the_release.wait(), 1
+            )
+        the_controller.set_buffer_pool_capacity(8)
+        self.engine.start()
+
+        send_in_background(the_peer, "\x00" * 8192 * 6)
+        self.assertTrue(self._wait_for(lambda: self.engine.holds() > 0))
+
+        the_release.set()
+        self.assertTrue(self._wait_for(lambda: the_pipeline.blocks_pushed() == 6))
+        self.assertEqual(self.engine.blocks_read(), 6)
+
+    def test_add_disconnected(self):
+        the_controller = AVS4000Transceiver.DeviceController(1, '', 'SN000001', 'AVS4000', 'usb')
+        self.assertFalse(self.engine.add(the_controller, None))
+        self.assertFalse(self.engine.remove(the_controller))
+
+
+class SlowController:
+    """
+    Stands in for a DeviceController whose daemon takes the_delay seconds to reply.
+    """
+    def __init__(self, the_delay, the_error=None):
+        self.delay_ = the_delay
+        self.error_ = the_error
+
+    def query_rx(self):
+        time.sleep(self.delay_)
+        if self.error_ is not None:
+            raise self.error_
+        return self.delay_
+
+    def set_tune(self, the_center_frequency, the_bandwidth, the_sample_rate):
+        return the_center_frequency
+
+
+class TestDeviceFleet_methods(unittest.TestCase):
+    def test_concurrent_queries(self):
+        the_error = RuntimeError("Daemon refused status request.")
+        the_fleet = AVS4000Transceiver.DeviceFleet\
+            (
+                dict((index, SlowController(0.2, the_error if index == 3 else None)) for index in range(8))
+            )
+
+        the_start = time.time()
+        the_results, the_errors = the_fleet.query_rx()
+
+        self.assertTrue(time.time() - the_start < 1.0)
+        self.assertEqual(sorted(the_results.keys()), [0, 1, 2, 4, 5, 6, 7])
+        self.assertEqual(the_errors, {3: the_error})
+
+    def test_set_tune_subset(self):
+        the_fleet = AVS4000Transceiver.DeviceFleet(dict((index, SlowController(0)) for index in range(4)))
+
+        the_results, the_errors = the_fleet.set_tune({1: (100.0, 1.0, 2.0), 2: (200.0, 1.0, 2.0)})
+
+        self.assertEqual(the_results, {1: 100.0, 2: 200.0})
+        self.assertEqual(the_errors, {})
+
+    def test_iter_data(self):
+        the_tuners = [create_controller() for index in range(3)]
+
+        for the_controller, the_peer in the_tuners:
+            the_controller.set_block_packets(1)
+
+        the_fleet = AVS4000Transceiver.DeviceFleet(dict(enumerate(the_controller for the_controller, _ in the_tuners)))
+
+        the_tuners[2][1].sendall(struct.pack("<4096h", *([2] * 4096)))
+        the_tuners[0][1].sendall(struct.pack("<4096h", *([0] * 4096)))
+
+        the_seen = {}
+
+        for the_key, the_data, the_time in the_fleet.iter_data():
+            the_seen[the_key] = the_data[0]
+            if len(the_seen) == 2:
+                break
+
+        self.assertEqual(the_seen, {0: 0, 2: 2})
+
+        self.assertEqual(the_tuners[1][0].buffer_pool(), None)
+
+        for the_controller, the_peer in the_tuners:
+            if the_controller.buffer_pool() is not None:
+                self.assertEqual(the_controller.buffer_pool().in_use(), 0)
+            the_controller.disconnect_data()
+            the_peer.close()
+
+    def test_invalid_workers(self):
+        self.assertRaises(ValueError, AVS4000Transceiver.DeviceFleet, {}, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,32 @@
 import unittest
 import Vita49
 import logging
+import struct
+
+
+def create_packet(the_frame_count, the_packet_count=0, the_ist=0, the_fst_lsw=0, the_value=0, the_tsi=0x1, the_tsf=0x1,
+                  the_fst_msw=0):
+    """
+    Builds a little endian AVS4000 Vita49 packet as it would be received from the data port.
+    """
+    the_header = (0x1 << 28) | (the_tsi << 22) | (the_tsf << 20) | ((the_packet_count & 0xF) << 16)\
+        | Vita49.VRT.EXPECTED_PACKET_SIZE
+
+    the_bytes = struct.pack\
+        (
+            "<7I",
+            Vita49.VRL.EXPECTED_FAW,
+            (the_frame_count << 20) | Vita49.VRL.EXPECTED_FRAME_SIZE,
+            the_header,
+            0,
+            the_ist,
+            the_fst_msw,
+            the_fst_lsw
+        )
+    the_bytes += struct.pack("<h", the_value) * Vita49.VRT_PAYLOAD_SHORTS
+    the_bytes += struct.pack("<I", Vita49.VRL.EXPECTED_FEND)
+
+    return the_bytes
 
 class TestVita49VRL_methods(unittest.TestCase):
     def setUp(self):
@@ -77,5 +103,213 @@ class TestVita49VRT_methods(unittest.TestCase):
     def test_packet_size(self):
         self.assertEqual(self.vrt.packet_size(), 0x07FD, "Actual <{}>".format(self.vrt.packet_size()))
 
+
+class TestVita49PacketBlock_methods(unittest.TestCase):
+    def setUp(self):
+        self.buffer = bytearray()
+        for index in range(0, 4):
+            self.buffer += create_packet(index, index, 100 + index, 2040 * index, index)
+
+        self.block = Vita49.Vita49PacketBlock(self.buffer)
+
+    def test_number_packets(self):
+        self.assertEqual(self.block.number_packets(), 4)
+
+    def test_columns(self):
+        self.assertEqual(self.block.frame_count().tolist(), [0, 1, 2, 3])
+        self.assertEqual(self.block.frame_size().tolist(), [0x800] * 4)
+        self.assertEqual(self.block.packet_count().tolist(), [0, 1, 2, 3])
+        self.assertEqual(self.block.packet_size().tolist(), [Vita49.VRT.EXPECTED_PACKET_SIZE] * 4)
+        self.assertEqual(self.block.integer_seconds_timestamp().tolist(), [100, 101, 102, 103])
+        self.assertEqual(self.block.fractional_seconds_timestamp_lsw().tolist(), [0, 2040, 4080, 6120])
+        self.assertEqual(self.block.tsi().tolist(), [1] * 4)
+        self.assertEqual(self.block.tsf().tolist(), [1] * 4)
+
+    def test_payload(self):
+        self.assertEqual(self.block.payload().shape, (4, Vita49.VRT_PAYLOAD_SHORTS))
+        self.assertEqual(self.block.payload()[3, 0], 3)
+
+    def test_valid(self):
+        self.assertTrue(self.block.is_valid())
+
+    def test_invalid_vend(self):
+        self.buffer[2 * Vita49.VRT_PACKET_SIZE - 1] = 0
+        self.assertEqual(self.block.valid().tolist(), [True, False, True, True])
+        self.assertFalse(self.block.is_valid())
+
+    def test_vrl_vrt(self):
+        self.assertEqual(self.block.vrl(2).frame_count(), 2)
+        self.assertEqual(self.block.vrt(2).integer_seconds_timestamp(), 102)
+
+
+class TestVita49PacketBlock_timestamps(unittest.TestCase):
+    def block(self, *the_packets):
+        return Vita49.Vita49PacketBlock(bytearray().join(bytearray(the_packet) for the_packet in the_packets))
+
+    def test_sample_count(self):
+        the_block      = self.block(*[create_packet(index, index, 100, 2040 * index) for index in range(0, 3)])
+        the_timestamps = the_block.timestamps(3000.0)
+
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [100, 100, 101])
+        self.assertEqual(the_timestamps.picoseconds().tolist(), [0, 680000000000, 360000000000])
+        self.assertEqual(the_timestamps.elapsed().tolist(), [0, 680000000000, 1360000000000])
+        self.assertTrue(the_timestamps.is_valid())
+
+    def test_sample_count_fractional_rate(self):
+        the_timestamps = self.block(create_packet(0, 0, 100, 3)).timestamps(1.5)
+
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [102])
+        self.assertEqual(the_timestamps.picoseconds().tolist(), [0])
+
+    def test_sample_count_msw(self):
+        the_timestamps = self.block(create_packet(0, 0, 100, 1, the_fst_msw=1)).timestamps(2 ** 31)
+
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [102])
+        self.assertEqual(the_timestamps.picoseconds().tolist(), [465])
+
+    def test_real_time(self):
+        the_picoseconds = 2 * Vita49.PICOSECONDS_PER_SECOND + 5
+
+        the_timestamps = self.block\
+            (
+                create_packet(0, 0, 100, the_picoseconds & 0xFFFFFFFF, the_tsf=Vita49.TSF_REAL_TIME,
+                              the_fst_msw=the_picoseconds >> 32)
+            ).timestamps(0)
+
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [102])
+        self.assertEqual(the_timestamps.picoseconds().tolist(), [5])
+        self.assertTrue(the_timestamps.is_valid())
+
+    def test_gps(self):
+        the_timestamps = self.block(create_packet(0, 0, 100, the_tsi=Vita49.TSI_GPS)).timestamps(1000.0)
+
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [100 + Vita49.GPS_EPOCH_OFFSET - 18])
+
+    def test_invalid(self):
+        the_timestamps = self.block\
+            (
+                create_packet(0, 0, 100, 10),
+                create_packet(1, 1, 100, 10, the_tsf=Vita49.TSF_FREE_RUNNING),
+                create_packet(2, 2, 100, 10, the_tsi=Vita49.TSI_NONE, the_tsf=Vita49.TSF_NONE)
+            ).timestamps(10.0)
+
+        self.assertEqual(the_timestamps.valid().tolist(), [True, False, False])
+        self.assertEqual(the_timestamps.integer_seconds().tolist(), [101, 1, 0])
+        self.assertEqual(len(the_timestamps[1:]), 2)
+
+    def test_no_rate(self):
+        self.assertRaises(ValueError, self.block(create_packet(0)).timestamps, 0)
+
+
+class TestVita49ContinuityTracker_methods(unittest.TestCase):
+    def setUp(self):
+        self.tracker = Vita49.Vita49ContinuityTracker()
+
+    def block(self, the_frame_counts, the_ist=100):
+        the_buffer = bytearray()
+
+        for the_frame_count in the_frame_counts:
+            the_buffer += create_packet(the_frame_count % 4096, the_frame_count, the_ist, the_frame_count)
+
+        return Vita49.Vita49PacketBlock(the_buffer)
+
+    def test_continuous(self):
+        self.assertEqual(self.tracker.update(self.block([4094, 4095, 4096, 4097])).tolist(), [0, 0, 0, 0])
+        self.assertEqual(self.tracker.update(self.block([4098, 4099])).tolist(), [0, 0])
+        self.assertEqual(self.tracker.packets(), 6)
+        self.assertEqual(self.tracker.dropped_packets(), 0)
+
+    def test_gaps(self):
+        self.tracker.update(self.block([10, 11]))
+
+        the_block = self.block([14, 15, 17])
+
+        self.assertEqual(self.tracker.update(the_block, the_block.timestamps(2040.0)).tolist(), [2, 0, 1])
+        self.assertEqual(self.tracker.dropped_packets(), 3)
+        self.assertEqual(self.tracker.dropped_samples(), 3 * Vita49.VRT_PAYLOAD_SHORTS / 2)
+        self.assertEqual(self.tracker.gaps(), 2)
+        self.assertEqual([the_missing for _, the_missing in self.tracker.gap_times()], [2, 1])
+        self.assertAlmostEqual(self.tracker.gap_times()[1][0], 100.0 + 17 / 2040.0, places=6)
+        self.assertAlmostEqual(self.tracker.loss_rate(), 3 / 8.0)
+
+    def test_packet_count_error(self):
+        the_buffer = bytearray(create_packet(1, 1)) + bytearray(create_packet(2, 5))
+
+        self.tracker.update(Vita49.Vita49PacketBlock(the_buffer))
+        self.assertEqual(self.tracker.packet_count_errors(), 1)
+        self.assertEqual(self.tracker.dropped_packets(), 0)
+
+    def test_reset(self):
+        self.tracker.update(self.block([10]))
+        self.tracker.reset()
+
+        self.assertEqual(self.tracker.update(self.block([20])).tolist(), [0])
+
+
+class TestVita49DataPacket_methods(unittest.TestCase):
+    def setUp(self):
+        self.buffer = bytearray(create_packet(1, the_value=7))
+        self.block  = Vita49.Vita49PacketBlock(self.buffer)
+
+    def test_list_payload(self):
+        the_packet = Vita49.Vita49DataPacket(self.block.vrl(0), self.block.vrt(0), (1, 2, 3, 4))
+        the_packet.extend((5, 6))
+        self.assertEqual(the_packet.payload(), [1, 2, 3, 4, 5, 6])
+
+    def test_numpy_payload_is_view(self):
+        the_packet = Vita49.Vita49DataPacket(self.block.vrl(0), self.block.vrt(0), self.block.payload()[0])
+        self.buffer[Vita49.VRT_PAYLOAD_OFFSET] = 9
+        self.assertEqual(the_packet.payload()[0], 9)
+
+    def test_complex_payload(self):
+        the_packet = Vita49.Vita49DataPacket(self.block.vrl(0), self.block.vrt(0), self.block.payload()[0])
+        self.assertEqual(the_packet.complex_payload().shape, (Vita49.VRT_PAYLOAD_SHORTS / 2, 2))
+
+
+class TestVita49Synchronizer_methods(unittest.TestCase):
+    def setUp(self):
+        self.synchronizer = Vita49.Vita49Synchronizer(Vita49.LITTLE_ENDIAN)
+
+    def test_aligned(self):
+        the_buffer = bytearray(create_packet(0) + create_packet(1) + create_packet(2)[:100])
+        the_offsets, the_keep = self.synchronizer.find_packets(the_buffer)
+
+        self.assertEqual(the_offsets.tolist(), [0, Vita49.VRT_PACKET_SIZE])
+        self.assertEqual(the_keep, 2 * Vita49.VRT_PACKET_SIZE)
+        self.assertEqual(self.synchronizer.bytes_skipped(), 0)
+        self.assertEqual(self.synchronizer.resync_events(), 0)
+
+    def test_leading_garbage(self):
+        the_buffer = bytearray("x" * 10 + create_packet(0) + create_packet(1))
+        the_offsets, the_keep = self.synchronizer.find_packets(the_buffer)
+
+        self.assertEqual(the_offsets.tolist(), [10, 10 + Vita49.VRT_PACKET_SIZE])
+        self.assertEqual(self.synchronizer.bytes_skipped(), 10)
+        self.assertEqual(self.synchronizer.resync_events(), 1)
+
+        the_block = self.synchronizer.packet_block(the_buffer, the_offsets)
+        self.assertEqual(the_block.frame_count().tolist(), [0, 1])
+
+    def test_truncated_packet(self):
+        the_buffer = bytearray(create_packet(0) + create_packet(1)[:5000] + create_packet(2) + create_packet(3))
+        the_offsets, the_keep = self.synchronizer.find_packets(the_buffer)
+
+        self.assertEqual(the_offsets.tolist(), [0, Vita49.VRT_PACKET_SIZE + 5000, 2 * Vita49.VRT_PACKET_SIZE + 5000])
+        self.assertEqual(self.synchronizer.bytes_skipped(), 5000)
+        self.assertEqual(self.synchronizer.resync_events(), 1)
+
+        the_block = self.synchronizer.packet_block(the_buffer, the_offsets)
+        self.assertEqual(the_block.frame_count().tolist(), [0, 2, 3])
+        self.assertTrue(the_block.is_valid())
+
+    def test_no_faw(self):
+        the_buffer = bytearray("x" * 100)
+        the_offsets, the_keep = self.synchronizer.find_packets(the_buffer)
+
+        self.assertEqual(len(the_offsets), 0)
+        self.assertEqual(the_keep, 97)
+        self.assertIsNone(self.synchronizer.packet_block(the_buffer, the_offsets))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file